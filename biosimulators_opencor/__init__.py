@@ -1,8 +1,13 @@
 from ._version import __version__  # noqa: F401
 # :obj:`str`: version
 
-from .core import exec_sed_task, preprocess_sed_task, exec_sed_doc, exec_sedml_docs_in_combine_archive  # noqa: F401
+import importlib
+import json
+import os
+import shutil
 import subprocess
+import sys
+import tempfile
 
 __all__ = [
     '__version__',
@@ -11,12 +16,99 @@ __all__ = [
     'preprocess_sed_task',
     'exec_sed_doc',
     'exec_sedml_docs_in_combine_archive',
+    'exec_sed_task_ensemble',
+    'CompiledTask',
 ]
 
+_lazy_attributes = {
+    'exec_sed_task': 'core',
+    'preprocess_sed_task': 'core',
+    'exec_sed_doc': 'core',
+    'exec_sedml_docs_in_combine_archive': 'core',
+    'exec_sed_task_ensemble': 'ensemble',
+    'CompiledTask': 'ensemble',
+}
+# :obj:`dict`: dictionary which maps the names of attributes which are imported on first use to their modules
+
+
+def __getattr__(name):
+    # import the methods for executing tasks on first use, so that importing this package doesn't import
+    # BioSimulators utils, KiSAO, and OpenCOR
+    module_name = _lazy_attributes.get(name, None)
+    if module_name is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_lazy_attributes.keys()))
+
+
+_simulator_version = None
+# :obj:`str`: version of OpenCOR, once it has been retrieved
+
 
 def get_simulator_version():
     """ Get the version of OpenCOR
 
+    The version is retrieved from the first of the following sources which is available, and then kept for the
+    lifetime of the process:
+
+    * The ``opencor`` module, if the current process is an OpenCOR Python shell which has already imported it
+    * The on-disk cache of the version of the OpenCOR executable (see :obj:`get_simulator_version_cache_filename`),
+      keyed by the path and modification time of the executable
+    * ``OpenCOR --version``
+
+    Returns:
+        :obj:`str`: version of OpenCOR
+    """
+    global _simulator_version
+
+    if _simulator_version is None:
+        _simulator_version = get_simulator_version_from_module()
+
+    if _simulator_version is None:
+        executable = shutil.which('OpenCOR')
+        executable = os.path.realpath(executable) if executable else None
+        executable_mtime = os.path.getmtime(executable) if executable else None
+
+        cache = read_simulator_version_cache()
+        cached = cache.get(executable, None) if executable else None
+        if cached and cached.get('mtime', None) == executable_mtime:
+            _simulator_version = cached['version']
+        else:
+            _simulator_version = get_simulator_version_from_executable()
+            if executable:
+                cache[executable] = {'mtime': executable_mtime, 'version': _simulator_version}
+                write_simulator_version_cache(cache)
+
+    return _simulator_version
+
+
+def get_simulator_version_from_module():
+    """ Get the version of OpenCOR from the ``opencor`` module, if it has already been imported
+
+    Returns:
+        :obj:`str`: version of OpenCOR, or :obj:`None` if the ``opencor`` module hasn't been imported or doesn't
+            report its version
+    """
+    opencor = sys.modules.get('opencor', None)
+    version = getattr(opencor, 'version', None) or getattr(opencor, '__version__', None)
+    if callable(version):
+        try:
+            version = version()
+        except Exception:
+            version = None
+    if not isinstance(version, str) or not version:
+        return None
+    return version.strip().replace('OpenCOR ', '')
+
+
+def get_simulator_version_from_executable():
+    """ Get the version of OpenCOR by running ``OpenCOR --version``
+
     Returns:
         :obj:`str`: version of OpenCOR
     """
@@ -30,3 +122,46 @@ def get_simulator_version():
             result.stderr.decode().strip().replace('\n', '\n  ')))
 
     return result.stdout.decode().strip().replace('OpenCOR ', '')
+
+
+def get_simulator_version_cache_filename():
+    """ Get the path to the on-disk cache of the versions of OpenCOR executables
+    (``{XDG_CACHE_HOME or ~/.cache}/biosimulators_opencor/simulator-version.json``)
+
+    Returns:
+        :obj:`str`: path to the cache
+    """
+    cache_dirname = os.environ.get('XDG_CACHE_HOME', None) or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dirname, 'biosimulators_opencor', 'simulator-version.json')
+
+
+def read_simulator_version_cache():
+    """ Read the on-disk cache of the versions of OpenCOR executables
+
+    Returns:
+        :obj:`dict`: dictionary which maps the path of each executable to its modification time and version
+    """
+    try:
+        with open(get_simulator_version_cache_filename(), 'r') as file:
+            cache = json.load(file)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_simulator_version_cache(cache):
+    """ Save the on-disk cache of the versions of OpenCOR executables. Errors (e.g., read-only home directories) are
+    ignored because the cache is only an optimization.
+
+    Args:
+        cache (:obj:`dict`): dictionary which maps the path of each executable to its modification time and version
+    """
+    filename = get_simulator_version_cache_filename()
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        fid, temp_filename = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.json')
+        with os.fdopen(fid, 'w') as file:
+            json.dump(cache, file)
+        os.replace(temp_filename, filename)
+    except OSError:
+        pass
@@ -6,17 +6,96 @@
 :License: MIT
 """
 
-from . import get_simulator_version
-from ._version import __version__
-from .core import exec_sedml_docs_in_combine_archive
-from biosimulators_utils.simulator.cli import build_cli
+import time
+_start_time = time.perf_counter()
+# :obj:`float`: time when the command-line application started to be loaded
 
-App = build_cli('biosimulators-opencor', __version__,
-                'OpenCOR', get_simulator_version(), 'https://opencor.ws',
-                exec_sedml_docs_in_combine_archive)
+from . import get_simulator_version  # noqa: E402
+from ._version import __version__  # noqa: E402
+from biosimulators_utils.simulator.cli import build_cli  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+
+
+def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
+    """ Execute the SED tasks defined in a COMBINE/OMEX archive and save the outputs (see
+    :obj:`biosimulators_opencor.core.exec_sedml_docs_in_combine_archive`)
+
+    The executer is only imported when an archive is executed, so that ``--help`` and ``--version`` don't load it.
+
+    Args:
+        archive_filename (:obj:`str`): path to COMBINE/OMEX archive
+        out_dir (:obj:`str`): path to store the outputs of the archive
+        config (:obj:`Config`, optional): BioSimulators common configuration
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`SedDocumentResults`: results
+            * :obj:`CombineArchiveLog`: log
+    """
+    from .core import exec_sedml_docs_in_combine_archive
+    return exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config)
+
+
+def build_app(simulator_version=None):
+    """ Build the command-line application
+
+    Args:
+        simulator_version (:obj:`str`, optional): version of OpenCOR to report for ``--version``
+
+    Returns:
+        :obj:`type`: command-line application
+    """
+    return build_cli('biosimulators-opencor', __version__,
+                     'OpenCOR', simulator_version, 'https://opencor.ws',
+                     exec_sedml_docs_in_combine_archive)
+
+
+def get_startup_duration():
+    """ Get the time elapsed since the process started (including the startup of OpenCOR), or, on platforms which
+    don't report when processes started, since the command-line application started to be loaded
+
+    Returns:
+        :obj:`float`: duration in seconds
+    """
+    try:
+        with open('/proc/self/stat', 'r') as file:
+            start_ticks = int(file.read().rpartition(')')[2].split()[19])
+        with open('/proc/uptime', 'r') as file:
+            uptime = float(file.read().split()[0])
+        return max(uptime - start_ticks / os.sysconf('SC_CLK_TCK'), 0.)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - _start_time
+
+
+def __getattr__(name):
+    # build :obj:`App` when it is first used, so that the version of OpenCOR is only retrieved when it is needed
+    if name == 'App':
+        globals()['App'] = App = build_app(get_simulator_version())
+        return App
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from .batch import main as batch_main
+        sys.exit(batch_main())
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'daemon':
+        from .daemon import main as daemon_main
+        sys.exit(daemon_main())
+
+    # only retrieve the version of OpenCOR when it is requested
+    if '-v' in sys.argv[1:] or '--version' in sys.argv[1:]:
+        App = build_app(get_simulator_version())
+    else:
+        App = build_app()
+
+    # only report the startup time when it is requested, so that the output of ``--help`` and ``--version`` is unchanged
+    if os.environ.get('REPORT_STARTUP_DURATION', '0').lower() in ['1', 'true']:
+        print('Started in {:.3f} s'.format(get_startup_duration()), file=sys.stderr)
+
     with App() as app:
         app.run()
 
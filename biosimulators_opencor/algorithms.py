@@ -0,0 +1,240 @@
+""" Memoized tables of the substitutions of algorithms and of the translations of the values of algorithm parameters
+
+Resolving which algorithm OpenCOR should execute for a requested algorithm walks the KiSAO ontology, and the
+result only depends on the requested algorithm and the substitution policy. Similarly, the OpenCOR representation
+of the value of a parameter only depends on the value and the type of the parameter. These results are memoized
+for the lifetime of the process. The tables can also be precomputed (:obj:`build_algorithm_tables`), saved to a
+file (:obj:`save_algorithm_tables`), and loaded into other processes (:obj:`load_algorithm_tables` or
+:obj:`SimulatorConfig.ALGORITHM_TABLES_FILENAME`).
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .config import get_simulator_config
+from .data_model import KISAO_ALGORITHM_MAP
+from kisao.data_model import AlgorithmSubstitutionPolicy
+from kisao.exceptions import AlgorithmCannotBeSubstitutedException
+from kisao.utils import get_preferred_substitute_algorithm_by_ids
+from kisao.warnings import AlgorithmSubstitutedWarning
+import json
+import warnings
+
+__all__ = [
+    'get_substitute_algorithm_id',
+    'get_memoized_parameter_value',
+    'build_algorithm_tables',
+    'save_algorithm_tables',
+    'load_algorithm_tables',
+    'clear_algorithm_tables',
+]
+
+_substitutions = {}
+# :obj:`dict`: dictionary which maps pairs of requested KiSAO ids and names of substitution policies to tuples of the
+# KiSAO id of the algorithm which OpenCOR should execute (or :obj:`None`), the message of the exception that the
+# algorithm cannot be substituted (or :obj:`None`), and the messages of the warnings about the substitution
+
+_parameter_values = {}
+# :obj:`dict`: dictionary which maps tuples of the names of the types and allowed values of parameters and values
+# to tuples of whether the values are valid and their OpenCOR representations
+
+_default_tables_loaded = False
+
+
+def get_substitute_algorithm_id(kisao_id, substitution_policy):
+    """ Get the KiSAO id of the algorithm which OpenCOR should execute for a requested algorithm
+
+    The warnings about the substitution are emitted each time the substitution is requested, including when the
+    substitution is memoized.
+
+    Args:
+        kisao_id (:obj:`str`): KiSAO id of the requested algorithm
+        substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): algorithm substitution policy
+
+    Returns:
+        :obj:`str`: KiSAO id of the algorithm which OpenCOR should execute
+
+    Raises:
+        :obj:`AlgorithmCannotBeSubstitutedException`: if OpenCOR doesn't support the algorithm or a substitute for it
+    """
+    _load_default_algorithm_tables()
+
+    key = (kisao_id, substitution_policy.name)
+    substitution = _substitutions.get(key, None)
+    if substitution is None:
+        substitution = _substitutions[key] = _resolve_substitute_algorithm_id(kisao_id, substitution_policy)
+
+    substitute_kisao_id, error, warning_msgs = substitution
+    for msg in warning_msgs:
+        warnings.warn(msg, AlgorithmSubstitutedWarning)
+    if error is not None:
+        raise AlgorithmCannotBeSubstitutedException(error)
+    return substitute_kisao_id
+
+
+def _resolve_substitute_algorithm_id(kisao_id, substitution_policy):
+    """ Resolve the KiSAO id of the algorithm which OpenCOR should execute for a requested algorithm with KiSAO
+
+    Args:
+        kisao_id (:obj:`str`): KiSAO id of the requested algorithm
+        substitution_policy (:obj:`AlgorithmSubstitutionPolicy`): algorithm substitution policy
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`str`: KiSAO id of the algorithm which OpenCOR should execute, or :obj:`None`
+            * :obj:`str`: message of the exception that the algorithm cannot be substituted, or :obj:`None`
+            * :obj:`list` of :obj:`str`: messages of the warnings about the substitution
+    """
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter('always', AlgorithmSubstitutedWarning)
+        try:
+            substitute_kisao_id = get_preferred_substitute_algorithm_by_ids(
+                kisao_id, KISAO_ALGORITHM_MAP.keys(), substitution_policy=substitution_policy)
+            error = None
+        except AlgorithmCannotBeSubstitutedException as exception:
+            substitute_kisao_id = None
+            error = str(exception)
+
+    warning_msgs = []
+    for caught_warning in caught_warnings:
+        if issubclass(caught_warning.category, AlgorithmSubstitutedWarning):
+            warning_msgs.append(str(caught_warning.message))
+        else:
+            warnings.warn_explicit(caught_warning.message, caught_warning.category, caught_warning.filename, caught_warning.lineno)
+
+    return substitute_kisao_id, error, warning_msgs
+
+
+def get_memoized_parameter_value(value, value_type, enum_cls, get_value):
+    """ Get the OpenCOR representation of a value of a parameter, memoizing the representation
+
+    Args:
+        value (:obj:`str`): string-encoded parameter value
+        value_type (:obj:`ValueType`): expected type of the value
+        enum_cls (:obj:`type`): allowed values of the parameter
+        get_value (:obj:`types.FunctionType`): function which gets the OpenCOR representation of the value
+            (see :obj:`biosimulators_opencor.utils.get_opencor_parameter_value`)
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`bool`: whether the value is valid
+            * :obj:`str`: OpenCOR representation of a value of a parameter
+    """
+    if not isinstance(value, str):
+        return get_value(value, value_type, enum_cls)
+
+    _load_default_algorithm_tables()
+
+    key = (value_type.name, enum_cls.__name__ if enum_cls else None, value)
+    parameter_value = _parameter_values.get(key, None)
+    if parameter_value is None:
+        parameter_value = _parameter_values[key] = tuple(get_value(value, value_type, enum_cls))
+    return parameter_value
+
+
+def build_algorithm_tables(get_value):
+    """ Precompute the substitutions of the algorithms which OpenCOR can execute in place of other algorithms for every
+    substitution policy, and the translations of the allowed and default values of the parameters of these algorithms
+
+    Args:
+        get_value (:obj:`types.FunctionType`): function which gets the OpenCOR representation of the value of a
+            parameter (see :obj:`biosimulators_opencor.utils.get_opencor_parameter_value`)
+    """
+    from kisao import Kisao
+    from kisao.utils import get_substitutable_algorithms
+
+    kisao = Kisao()
+    kisao_ids = set(KISAO_ALGORITHM_MAP.keys())
+    for alg_kisao_id in KISAO_ALGORITHM_MAP.keys():
+        for alt_alg in get_substitutable_algorithms(kisao.get_term(alg_kisao_id)):
+            kisao_ids.add(kisao.get_term_id(alt_alg))
+
+    for substitution_policy in AlgorithmSubstitutionPolicy:
+        for kisao_id in sorted(kisao_ids):
+            key = (kisao_id, substitution_policy.name)
+            if key not in _substitutions:
+                _substitutions[key] = _resolve_substitute_algorithm_id(kisao_id, substitution_policy)
+
+    for alg_specs in KISAO_ALGORITHM_MAP.values():
+        for param_specs in alg_specs['parameters'].values():
+            enum_cls = param_specs.get('enum', None)
+            values = [str(param_specs['default']).lower() if isinstance(param_specs['default'], bool) else str(param_specs['default'])]
+            if enum_cls:
+                for member in enum_cls:
+                    values.extend([member.name, member.name.replace('KISAO_', 'KISAO:'), member.value])
+            for value in values:
+                get_memoized_parameter_value(value, param_specs['type'], enum_cls, get_value)
+
+
+def save_algorithm_tables(filename):
+    """ Save the memoized substitutions of algorithms and translations of the values of parameters to a JSON file
+
+    Args:
+        filename (:obj:`str`): path to save the tables
+    """
+    tables = {
+        'substitutions': [
+            {
+                'kisaoId': kisao_id,
+                'substitutionPolicy': policy_name,
+                'substitute': substitute_kisao_id,
+                'error': error,
+                'warnings': warning_msgs,
+            }
+            for (kisao_id, policy_name), (substitute_kisao_id, error, warning_msgs) in sorted(_substitutions.items())
+        ],
+        'parameterValues': [
+            {
+                'type': type_name,
+                'enum': enum_name,
+                'value': value,
+                'valid': is_valid,
+                'opencorValue': opencor_value,
+            }
+            for (type_name, enum_name, value), (is_valid, opencor_value) in sorted(
+                _parameter_values.items(), key=lambda item: tuple('' if el is None else el for el in item[0]))
+        ],
+    }
+    with open(filename, 'w') as file:
+        json.dump(tables, file, indent=2)
+
+
+def load_algorithm_tables(filename):
+    """ Load memoized substitutions of algorithms and translations of the values of parameters from a JSON file
+    (see :obj:`save_algorithm_tables`)
+
+    Args:
+        filename (:obj:`str`): path to the tables
+    """
+    with open(filename, 'r') as file:
+        tables = json.load(file)
+
+    for substitution in tables.get('substitutions', []):
+        _substitutions[(substitution['kisaoId'], substitution['substitutionPolicy'])] = (
+            substitution['substitute'], substitution['error'], list(substitution['warnings']))
+
+    for parameter_value in tables.get('parameterValues', []):
+        _parameter_values[(parameter_value['type'], parameter_value['enum'], parameter_value['value'])] = (
+            parameter_value['valid'], parameter_value['opencorValue'])
+
+
+def clear_algorithm_tables():
+    """ Discard the memoized substitutions of algorithms and translations of the values of parameters """
+    global _default_tables_loaded
+    _substitutions.clear()
+    _parameter_values.clear()
+    _default_tables_loaded = False
+
+
+def _load_default_algorithm_tables():
+    """ Load the tables configured by :obj:`SimulatorConfig.ALGORITHM_TABLES_FILENAME` once per process """
+    global _default_tables_loaded
+    if not _default_tables_loaded:
+        _default_tables_loaded = True
+        filename = get_simulator_config().ALGORITHM_TABLES_FILENAME
+        if filename:
+            load_algorithm_tables(filename)
@@ -0,0 +1,283 @@
+""" Methods for executing many COMBINE/OMEX archives with a pool of long-lived OpenCOR worker processes
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .config import get_simulator_config
+from .parallel import create_worker_pool
+from biosimulators_utils.log.data_model import Status
+from concurrent.futures.process import BrokenProcessPool
+import argparse
+import concurrent.futures
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import yaml
+
+__all__ = [
+    'get_archive_filenames',
+    'get_archive_out_dirs',
+    'exec_archives_in_batch',
+    'write_batch_summary',
+    'main',
+]
+
+SUMMARY_FILENAME = 'batch-summary.yml'
+
+
+def get_archive_filenames(paths):
+    """ Get the paths to the COMBINE/OMEX archives described by a list of paths to archives, directories
+    (which are searched recursively for ``.omex`` files), and glob patterns
+
+    Args:
+        paths (:obj:`list` of :obj:`str`): paths to archives, directories, and glob patterns
+
+    Returns:
+        :obj:`list` of :obj:`str`: absolute paths to the archives, without duplicates
+
+    Raises:
+        :obj:`ValueError`: if a path doesn't match any file or directory
+    """
+    archive_filenames = []
+    for path in paths:
+        if os.path.isfile(path):
+            matches = [path]
+        elif os.path.isdir(path):
+            matches = sorted(glob.glob(os.path.join(path, '**', '*.omex'), recursive=True))
+        else:
+            matches = sorted(filename for filename in glob.glob(path, recursive=True) if os.path.isfile(filename))
+            if not matches:
+                raise ValueError('`{}` is not a path to an archive, a directory, or a glob pattern which matches archives.'.format(path))
+
+        for match in matches:
+            match = os.path.abspath(match)
+            if match not in archive_filenames:
+                archive_filenames.append(match)
+
+    return archive_filenames
+
+
+def get_archive_out_dirs(archive_filenames, out_dir):
+    """ Get the directories to save the outputs of archives. The directory for each archive is the path of the archive
+    relative to the common parent directory of the archives, without the archive's extension.
+
+    Args:
+        archive_filenames (:obj:`list` of :obj:`str`): paths to archives
+        out_dir (:obj:`str`): root directory for the outputs of the archives
+
+    Returns:
+        :obj:`list` of :obj:`str`: directories to save the outputs of the archives
+    """
+    if not archive_filenames:
+        return []
+
+    common_dirname = os.path.commonpath([os.path.dirname(filename) for filename in archive_filenames])
+    return [
+        os.path.join(out_dir, os.path.splitext(os.path.relpath(filename, common_dirname))[0])
+        for filename in archive_filenames
+    ]
+
+
+def exec_archives_in_batch(archive_filenames, out_dir, num_workers=None):
+    """ Execute COMBINE/OMEX archives with a pool of long-lived OpenCOR worker processes
+
+    Each worker keeps OpenCOR, its imported modules, and its pool of compiled simulations loaded across the archives
+    which it executes. When a worker terminates abruptly (e.g., due to a crash of OpenCOR), the pool breaks and all
+    of the archives which haven't finished fail with it. The archives which the workers had started to execute are then
+    retried once, each on its own in a new pool with a single worker, so that a crash only fails the archive which
+    caused it. The archives which the workers hadn't started are resubmitted to a new pool, without counting as
+    a retry. The pools of workers are shut down before this function returns.
+
+    Args:
+        archive_filenames (:obj:`list` of :obj:`str`): paths to archives
+        out_dir (:obj:`str`): root directory for the outputs of the archives (see :obj:`get_archive_out_dirs`)
+        num_workers (:obj:`int`, optional): number of worker processes (default: number of CPUs)
+
+    Returns:
+        :obj:`list` of :obj:`dict`: status of the execution of each archive, in the order of :obj:`archive_filenames`
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    archive_out_dirs = get_archive_out_dirs(archive_filenames, out_dir)
+
+    # flags which the workers set when they start to execute each archive
+    started = multiprocessing.get_context('fork').Array('b', len(archive_filenames), lock=False)
+
+    summaries = [None] * len(archive_filenames)
+    pending = list(range(len(archive_filenames)))
+    while pending:
+        with create_worker_pool(num_workers, initializer=_set_started_archives, initargs=(started,)) as worker_pool:
+            futures = {
+                worker_pool.submit(_exec_archive_in_batch_worker, i_archive,
+                                   archive_filenames[i_archive], archive_out_dirs[i_archive]): i_archive
+                for i_archive in pending
+            }
+
+            pending = []
+            crashed = []
+            for future in concurrent.futures.as_completed(futures):
+                i_archive = futures[future]
+                try:
+                    summaries[i_archive] = future.result()
+                except BrokenProcessPool:
+                    if started[i_archive]:
+                        crashed.append(i_archive)
+                    else:
+                        pending.append(i_archive)
+
+        # if the pool broke before it started any of the archives, retry each of the archives on its own
+        if pending and not crashed:
+            crashed = pending
+            pending = []
+
+        # retry each archive which was executing when a worker crashed on its own
+        for i_archive in sorted(crashed):
+            with create_worker_pool(1) as worker_pool:
+                try:
+                    summaries[i_archive] = worker_pool.submit(exec_archive_in_worker, archive_filenames[i_archive],
+                                                              archive_out_dirs[i_archive]).result()
+                except BrokenProcessPool as exception:
+                    summaries[i_archive] = {
+                        'archive': archive_filenames[i_archive],
+                        'outDir': archive_out_dirs[i_archive],
+                        'status': Status.FAILED.value,
+                        'duration': None,
+                        'exception': '{}: {}'.format(exception.__class__.__name__, str(exception)),
+                    }
+
+    return summaries
+
+
+_started_archives = None
+
+
+def _set_started_archives(started_archives):
+    """ Set the flags which a worker process sets when it starts to execute each archive of a batch
+
+    Args:
+        started_archives (:obj:`multiprocessing.Array`): flags
+    """
+    global _started_archives
+    _started_archives = started_archives
+
+
+def _exec_archive_in_batch_worker(i_archive, archive_filename, out_dir):
+    """ Flag that a worker process has started to execute an archive of a batch, and execute it
+    (see :obj:`exec_archive_in_worker`)
+
+    Args:
+        i_archive (:obj:`int`): index of the archive in the batch
+        archive_filename (:obj:`str`): path to archive
+        out_dir (:obj:`str`): directory to save the outputs of the archive
+
+    Returns:
+        :obj:`dict`: status of the execution of the archive
+    """
+    _started_archives[i_archive] = 1
+    return exec_archive_in_worker(archive_filename, out_dir)
+
+
+def exec_archive_in_worker(archive_filename, out_dir):
+    """ Execute a COMBINE/OMEX archive in a worker process
+
+    Args:
+        archive_filename (:obj:`str`): path to archive
+        out_dir (:obj:`str`): directory to save the outputs of the archive
+
+    Returns:
+        :obj:`dict`: status of the execution of the archive
+    """
+    from .core import exec_sedml_docs_in_combine_archive
+
+    # the worker executes the tasks of the archive itself, rather than with a nested pool of workers
+    simulator_config = get_simulator_config()
+    simulator_config.NUM_WORKERS = 1
+
+    start_time = time.perf_counter()
+    try:
+        _, log = exec_sedml_docs_in_combine_archive(archive_filename, out_dir, simulator_config=simulator_config)
+        status = log.status.value if log else Status.SUCCEEDED.value
+        exception = None
+    except Exception as caught_exception:
+        status = Status.FAILED.value
+        exception = '{}: {}'.format(caught_exception.__class__.__name__, str(caught_exception))
+
+    return {
+        'archive': archive_filename,
+        'outDir': out_dir,
+        'status': status,
+        'duration': time.perf_counter() - start_time,
+        'exception': exception,
+    }
+
+
+def write_batch_summary(summaries, out_dir, duration=None):
+    """ Save the status and duration of the execution of each archive of a batch to ``{out_dir}/batch-summary.yml``
+
+    Args:
+        summaries (:obj:`list` of :obj:`dict`): status of the execution of each archive
+        out_dir (:obj:`str`): root directory for the outputs of the archives
+        duration (:obj:`float`, optional): duration of the execution of the batch in seconds
+
+    Returns:
+        :obj:`str`: path to the summary
+    """
+    counts = {}
+    for summary in summaries:
+        counts[summary['status']] = counts.get(summary['status'], 0) + 1
+
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    filename = os.path.join(out_dir, SUMMARY_FILENAME)
+    with open(filename, 'w') as file:
+        yaml.dump({
+            'duration': duration,
+            'statusCounts': counts,
+            'archives': summaries,
+        }, file, sort_keys=False)
+    return filename
+
+
+def main(args=None):
+    """ Execute the archives described by command-line arguments in batch
+
+    Args:
+        args (:obj:`list` of :obj:`str`, optional): command-line arguments (default: :obj:`sys.argv` after the ``batch``
+            sub-command)
+
+    Returns:
+        :obj:`int`: exit code (``0`` if every archive executed successfully)
+    """
+    parser = argparse.ArgumentParser(
+        prog='biosimulators-opencor batch',
+        description='Execute many COMBINE/OMEX archives with a pool of long-lived OpenCOR worker processes.')
+    parser.add_argument('archives', nargs='+', metavar='ARCHIVE',
+                        help='Path to a COMBINE/OMEX archive, a directory of archives, or a glob pattern for archives')
+    parser.add_argument('-o', '--out-dir', required=True,
+                        help='Directory to save the outputs of the archives and the summary of the batch')
+    parser.add_argument('-n', '--num-workers', type=int, default=None,
+                        help='Number of worker processes (default: number of CPUs)')
+    args = parser.parse_args(sys.argv[2:] if args is None else args)
+
+    try:
+        archive_filenames = get_archive_filenames(args.archives)
+    except ValueError as exception:
+        parser.error(str(exception))
+
+    start_time = time.perf_counter()
+    summaries = exec_archives_in_batch(archive_filenames, args.out_dir, num_workers=args.num_workers)
+    duration = time.perf_counter() - start_time
+
+    summary_filename = write_batch_summary(summaries, args.out_dir, duration=duration)
+
+    for summary in summaries:
+        print('{}  {:>9.3f} s  {}'.format(summary['status'].ljust(9),
+                                          summary['duration'] if summary['duration'] is not None else float('nan'),
+                                          summary['archive']))
+    print('Executed {} archives in {:.3f} s. The summary was saved to {}.'.format(len(summaries), duration, summary_filename))
+
+    return 0 if all(summary['status'] == Status.SUCCEEDED.value for summary in summaries) else 1
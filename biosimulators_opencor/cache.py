@@ -0,0 +1,422 @@
+""" Caches for reusing expensive objects, such as compiled OpenCOR simulations, across tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .config import get_simulator_config
+import collections
+import copy
+import hashlib
+import io
+import lxml.etree
+import os
+
+__all__ = [
+    'LruCache',
+    'SimulationPool',
+    'ParsedModelCache',
+    'get_simulation_pool',
+    'get_simulation_pool_key',
+    'get_parsed_model_cache',
+    'get_results_index_cache',
+    'get_model_index_cache',
+    'get_flattened_model_cache',
+]
+
+RESULTS_INDEX_CACHE_MAX_ENTRIES = 64
+RESULTS_INDEX_CACHE_MAX_BYTES = 64 * 1024 * 1024
+MODEL_INDEX_CACHE_MAX_ENTRIES = 16
+MODEL_INDEX_CACHE_MAX_BYTES = 64 * 1024 * 1024
+FLATTENED_MODEL_CACHE_MAX_ENTRIES = 256
+FLATTENED_MODEL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class LruCache(object):
+    """ Least-recently-used cache which is bounded by a number of entries and an estimated number of bytes
+
+    Attributes:
+        max_entries (:obj:`int`): maximum number of entries (``0`` disables the cache)
+        max_bytes (:obj:`int`): maximum total estimated size (in bytes) of the entries
+        hits (:obj:`int`): number of lookups which found an entry
+        misses (:obj:`int`): number of lookups which did not find an entry
+        evictions (:obj:`int`): number of entries which were evicted to satisfy the limits
+        _entries (:obj:`collections.OrderedDict`): dictionary which maps each key to a tuple of its value and size,
+            ordered from the least to the most recently used entry
+        _num_bytes (:obj:`int`): total estimated size (in bytes) of the entries
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        """
+        Args:
+            max_entries (:obj:`int`): maximum number of entries (``0`` disables the cache)
+            max_bytes (:obj:`int`): maximum total estimated size (in bytes) of the entries
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._num_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def num_bytes(self):
+        """ Get the total estimated size of the entries
+
+        Returns:
+            :obj:`int`: total estimated size (in bytes) of the entries
+        """
+        return self._num_bytes
+
+    def get(self, key, default=None):
+        """ Get the value of an entry and mark the entry as the most recently used
+
+        Args:
+            key (:obj:`object`): key
+            default (:obj:`object`, optional): value to return if the cache doesn't contain the key
+
+        Returns:
+            :obj:`object`: value
+        """
+        entry = self._entries.get(key, None)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key, value, size=0):
+        """ Add an entry and evict the least recently used entries until the cache satisfies its limits
+
+        Args:
+            key (:obj:`object`): key
+            value (:obj:`object`): value
+            size (:obj:`int`, optional): estimated size (in bytes) of the value
+
+        Returns:
+            :obj:`bool`: whether the entry was retained
+        """
+        if key in self._entries:
+            self.pop(key)
+
+        if self.max_entries <= 0 or size > self.max_bytes:
+            self.on_evict(key, value)
+            return False
+
+        self._entries[key] = (value, size)
+        self._num_bytes += size
+        self.resize(self.max_entries, self.max_bytes)
+        return True
+
+    def pop(self, key):
+        """ Remove an entry without disposing of its value
+
+        Args:
+            key (:obj:`object`): key
+
+        Returns:
+            :obj:`object`: value, or :obj:`None` if the cache doesn't contain the key
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._num_bytes -= entry[1]
+        return entry[0]
+
+    def checkout(self, key):
+        """ Remove an entry, so that its value can't be evicted while it is in use, and count the lookup as a hit or
+        a miss. Values should be returned to the cache (:obj:`set`) once they are no longer in use.
+
+        Args:
+            key (:obj:`object`): key
+
+        Returns:
+            :obj:`object`: value, or :obj:`None` if the cache doesn't contain the key
+        """
+        value = self.pop(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def resize(self, max_entries, max_bytes):
+        """ Change the limits of the cache and evict the least recently used entries until the cache satisfies them
+
+        Args:
+            max_entries (:obj:`int`): maximum number of entries (``0`` disables the cache)
+            max_bytes (:obj:`int`): maximum total estimated size (in bytes) of the entries
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        while self._entries and (len(self._entries) > max(max_entries, 0) or self._num_bytes > max_bytes):
+            key, (value, size) = self._entries.popitem(last=False)
+            self._num_bytes -= size
+            self.evictions += 1
+            self.on_evict(key, value)
+
+    def clear(self):
+        """ Dispose of all of the entries """
+        while self._entries:
+            key, (value, _) = self._entries.popitem(last=False)
+            self.on_evict(key, value)
+        self._num_bytes = 0
+
+    def on_evict(self, key, value):
+        """ Dispose of the value of an entry which is no longer cached
+
+        Args:
+            key (:obj:`object`): key
+            value (:obj:`object`): value
+        """
+        pass
+
+    def get_stats(self):
+        """ Get statistics about the usage of the cache
+
+        Returns:
+            :obj:`dict`: statistics about the usage of the cache
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self._num_bytes,
+            'maxEntries': self.max_entries,
+            'maxBytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class SimulationPool(LruCache):
+    """ Pool of opened (compiled) OpenCOR simulations which can be reset and reused by subsequent tasks
+
+    Simulations are checked out of the pool (:obj:`checkout`) while they are executed, so that a simulation which is
+    in use is never evicted, and returned to the pool (:obj:`set`) afterwards.
+    """
+
+    def on_evict(self, key, value):
+        """ Close an OpenCOR simulation which is no longer pooled, which releases its compiled model and its data
+
+        Args:
+            key (:obj:`str`): key
+            value (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        """
+        import opencor
+        opencor.close_simulation(value)
+
+
+class ParsedModelCache(LruCache):
+    """ Cache of parsed XML models, which are shared across tasks and documents
+
+    Models are cached by the hashes of their contents, so files with the same contents share a parsed model. The
+    hash of each file is memoized by its path, modification time, and size, so that unmodified files are not read
+    again. Cached models must not be modified; callers which modify models (e.g., to apply changes) should request
+    a copy.
+
+    Attributes:
+        parses (:obj:`int`): number of models which were parsed
+        reads (:obj:`int`): number of files which were read to determine their hashes
+        _content_hashes (:obj:`dict`): dictionary which maps the path of each file to a tuple of its modification time,
+            size, and hash
+    """
+
+    MAX_CONTENT_HASHES = 4096
+
+    def __init__(self, max_entries, max_bytes):
+        """
+        Args:
+            max_entries (:obj:`int`): maximum number of entries (``0`` disables the cache)
+            max_bytes (:obj:`int`): maximum total estimated size (in bytes) of the entries
+        """
+        super(ParsedModelCache, self).__init__(max_entries, max_bytes)
+        self.parses = 0
+        self.reads = 0
+        self._content_hashes = {}
+
+    def get_model(self, filename, copy_model=False):
+        """ Get a parsed model
+
+        Args:
+            filename (:obj:`str`): path to the model
+            copy_model (:obj:`bool`, optional): whether to return a copy of the model, which the caller can modify
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`lxml.etree._ElementTree`: element tree for the model
+                * :obj:`str`: hash of the contents of the model
+        """
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+
+        content = None
+        content_hash = self._content_hashes.get(filename, None)
+        if content_hash is None or content_hash[0:2] != (stat.st_mtime_ns, stat.st_size):
+            with open(filename, 'rb') as file:
+                content = file.read()
+            self.reads += 1
+
+            if len(self._content_hashes) >= self.MAX_CONTENT_HASHES:
+                self._content_hashes.clear()
+            content_hash = self._content_hashes[filename] = (stat.st_mtime_ns, stat.st_size, hashlib.sha256(content).hexdigest())
+        content_hash = content_hash[2]
+
+        model_etree = self.get(content_hash)
+        if model_etree is None:
+            if content is None:
+                with open(filename, 'rb') as file:
+                    content = file.read()
+                self.reads += 1
+            model_etree = lxml.etree.parse(io.BytesIO(content))
+            self.parses += 1
+            self.set(content_hash, model_etree, size=10 * len(content))
+
+        if copy_model:
+            model_etree = copy.deepcopy(model_etree)
+        return model_etree, content_hash
+
+    def clear(self):
+        """ Dispose of all of the entries and of the memoized hashes of the files """
+        super(ParsedModelCache, self).clear()
+        self._content_hashes.clear()
+
+    def get_stats(self):
+        """ Get statistics about the usage of the cache
+
+        Returns:
+            :obj:`dict`: statistics about the usage of the cache
+        """
+        stats = super(ParsedModelCache, self).get_stats()
+        stats['parses'] = self.parses
+        stats['reads'] = self.reads
+        return stats
+
+
+_simulation_pool = None
+
+
+def get_simulation_pool(simulator_config=None):
+    """ Get the pool of opened OpenCOR simulations for this process, resized to the limits of a configuration
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+
+    Returns:
+        :obj:`SimulationPool`: pool of opened OpenCOR simulations
+    """
+    global _simulation_pool
+
+    simulator_config = simulator_config or get_simulator_config()
+    if _simulation_pool is None:
+        _simulation_pool = SimulationPool(simulator_config.SIMULATION_POOL_MAX_ENTRIES, simulator_config.SIMULATION_POOL_MAX_BYTES)
+    else:
+        _simulation_pool.resize(simulator_config.SIMULATION_POOL_MAX_ENTRIES, simulator_config.SIMULATION_POOL_MAX_BYTES)
+    return _simulation_pool
+
+
+def get_simulation_pool_key(model_filename, algorithm):
+    """ Get the key for an OpenCOR simulation of a model with an algorithm. The key includes the hashes of the
+    model and of all of the files which it imports, directly or indirectly (see
+    :obj:`biosimulators_opencor.cellml_imports.get_flattened_cellml_model_key`), because OpenCOR compiles the
+    imported components into the simulation.
+
+    Args:
+        model_filename (:obj:`str`): path to the model
+        algorithm (:obj:`Algorithm`): algorithm that OpenCOR should execute
+
+    Returns:
+        :obj:`str`: key
+    """
+    from .cellml_imports import get_flattened_cellml_model_key
+
+    hash = hashlib.sha256(get_flattened_cellml_model_key(model_filename).encode())
+    hash.update(b'\0' + algorithm.kisao_id.encode())
+    for change in sorted(algorithm.changes, key=lambda change: change.kisao_id):
+        hash.update('\0{}={}'.format(change.kisao_id, change.new_value).encode())
+    return hash.hexdigest()
+
+
+_parsed_model_cache = None
+
+
+def get_parsed_model_cache(simulator_config=None):
+    """ Get the cache of parsed models for this process, resized to the limits of a configuration
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+
+    Returns:
+        :obj:`ParsedModelCache`: cache of parsed models
+    """
+    global _parsed_model_cache
+
+    simulator_config = simulator_config or get_simulator_config()
+    if _parsed_model_cache is None:
+        _parsed_model_cache = ParsedModelCache(simulator_config.MODEL_CACHE_MAX_ENTRIES, simulator_config.MODEL_CACHE_MAX_BYTES)
+    else:
+        _parsed_model_cache.resize(simulator_config.MODEL_CACHE_MAX_ENTRIES, simulator_config.MODEL_CACHE_MAX_BYTES)
+    return _parsed_model_cache
+
+
+_results_index_cache = None
+
+
+def get_results_index_cache():
+    """ Get the cache of the indices from the names of the variables of compiled OpenCOR simulations to their groups
+    of results (see :obj:`biosimulators_opencor.utils.get_opencor_results_index`), keyed by the keys of the
+    simulations in the pool of opened simulations (see :obj:`get_simulation_pool_key`)
+
+    Returns:
+        :obj:`LruCache`: cache
+    """
+    global _results_index_cache
+
+    if _results_index_cache is None:
+        _results_index_cache = LruCache(RESULTS_INDEX_CACHE_MAX_ENTRIES, RESULTS_INDEX_CACHE_MAX_BYTES)
+    return _results_index_cache
+
+
+_model_index_cache = None
+
+
+def get_model_index_cache():
+    """ Get the cache of the indices of parsed CellML models (see
+    :obj:`biosimulators_opencor.model_index.CellmlModelIndex`), keyed by the ids of their element trees
+
+    Returns:
+        :obj:`LruCache`: cache
+    """
+    global _model_index_cache
+
+    if _model_index_cache is None:
+        _model_index_cache = LruCache(MODEL_INDEX_CACHE_MAX_ENTRIES, MODEL_INDEX_CACHE_MAX_BYTES)
+    return _model_index_cache
+
+
+_flattened_model_cache = None
+
+
+def get_flattened_model_cache():
+    """ Get the cache of the flattened CellML models (see
+    :obj:`biosimulators_opencor.cellml_imports.get_flattened_cellml_model`), keyed by the hashes of the files
+
+    Returns:
+        :obj:`LruCache`: cache
+    """
+    global _flattened_model_cache
+
+    if _flattened_model_cache is None:
+        _flattened_model_cache = LruCache(FLATTENED_MODEL_CACHE_MAX_ENTRIES, FLATTENED_MODEL_CACHE_MAX_BYTES)
+    return _flattened_model_cache
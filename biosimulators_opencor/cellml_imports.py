@@ -0,0 +1,294 @@
+""" Methods for resolving the imports of CellML models into flattened models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .cache import get_flattened_model_cache, get_parsed_model_cache
+import copy
+import hashlib
+import lxml.etree
+import os
+import urllib.parse
+
+__all__ = [
+    'get_cellml_imports',
+    'has_relative_cellml_imports',
+    'get_flattened_cellml_model',
+    'get_flattened_cellml_model_key',
+]
+
+CELLML_NAMESPACE_PREFIX = 'http://www.cellml.org/cellml/'
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+
+def get_cellml_imports(model_etree):
+    """ Get the imports of a CellML model
+
+    Args:
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for the model
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: location (``xlink:href``) of each imported model and a list of the imported
+            components and units, as tuples of their type (``component`` or ``units``), their names in the
+            imported model, and their names in the importing model
+    """
+    imports = []
+    for import_el in model_etree.getroot():
+        if not _is_cellml_element(import_el, 'import'):
+            continue
+
+        items = []
+        for item_el in import_el:
+            if _is_cellml_element(item_el, 'component'):
+                items.append(('component', item_el.attrib.get('component_ref', None), item_el.attrib.get('name', None)))
+            elif _is_cellml_element(item_el, 'units'):
+                items.append(('units', item_el.attrib.get('units_ref', None), item_el.attrib.get('name', None)))
+
+        imports.append((import_el.attrib.get(XLINK_HREF, None), items))
+    return imports
+
+
+def has_relative_cellml_imports(model_filename):
+    """ Determine whether a CellML model imports other models by paths relative to its directory
+
+    Args:
+        model_filename (:obj:`str`): path to the model
+
+    Returns:
+        :obj:`bool`: :obj:`True`, if the model imports other models by relative paths, or if the model can't be parsed
+    """
+    try:
+        model_etree, _ = get_parsed_model_cache().get_model(os.path.abspath(model_filename))
+    except (OSError, lxml.etree.XMLSyntaxError):
+        return True
+
+    for href, _ in get_cellml_imports(model_etree):
+        if not href:
+            continue
+        url = urllib.parse.urlparse(href)
+        if (not url.scheme or len(url.scheme) == 1) and not os.path.isabs(href):
+            return True
+    return False
+
+
+def get_flattened_cellml_model(model_filename):
+    """ Get a flattened copy of a CellML model, in which the components and units that the model imports
+    (directly or indirectly) are copied into the model under their local names, and the imports are removed
+
+    Only imports of local files are resolved; imports of other resources (e.g., URLs) and of missing files are left
+    as is. The components which are encapsulated by imported components are also copied into the flattened model.
+
+    Flattened models are cached by the hashes of the model and of all of the files which it imports, directly
+    or indirectly. Files are parsed with the cache of parsed models (see :obj:`get_parsed_model_cache`), so each
+    file is parsed once, regardless of how many models import it. Because flattened models are shared, they must
+    not be modified.
+
+    Args:
+        model_filename (:obj:`str`): path to the model
+
+    Returns:
+        :obj:`lxml.etree._ElementTree`: element tree for the flattened model
+
+    Raises:
+        :obj:`ValueError`: if the imports of the model are cyclic
+    """
+    return _get_flattened_cellml_model(os.path.abspath(model_filename), ())[1]
+
+
+def get_flattened_cellml_model_key(model_filename):
+    """ Get a key for a CellML model and all of the files which it imports, directly or indirectly, which changes
+    whenever any of these files changes
+
+    Args:
+        model_filename (:obj:`str`): path to the model
+
+    Returns:
+        :obj:`str`: key, which is a hash of the model and of the files which it imports
+
+    Raises:
+        :obj:`ValueError`: if the imports of the model are cyclic
+    """
+    return _get_flattened_cellml_model(os.path.abspath(model_filename), ())[0]
+
+
+def _get_flattened_cellml_model(model_filename, importers):
+    """ Get a flattened copy of a CellML model
+
+    Args:
+        model_filename (:obj:`str`): absolute path to the model
+        importers (:obj:`tuple` of :obj:`str`): absolute paths to the models which (indirectly) import the model
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`str`: key of the flattened model, which is a hash of the model and of the files which it imports
+            * :obj:`lxml.etree._ElementTree`: element tree for the flattened model
+    """
+    if model_filename in importers:
+        raise ValueError('The imports of `{}` are cyclic:\n  {}'.format(
+            importers[0], '\n  '.join(importers + (model_filename,))))
+
+    # parse each distinct file once
+    model_etree, content_hash = get_parsed_model_cache().get_model(model_filename)
+    imports = get_cellml_imports(model_etree)
+
+    # flatten the imported models
+    dirname = os.path.dirname(model_filename)
+    imported_models = []
+    key = hashlib.sha256(content_hash.encode())
+    for href, items in imports:
+        imported_filename = _get_local_filename(href, dirname)
+        if imported_filename is None:
+            imported_models.append(None)
+            continue
+
+        imported_key, imported_model_etree = _get_flattened_cellml_model(imported_filename, importers + (model_filename,))
+        imported_models.append(imported_model_etree)
+        key.update(b'\0' + href.encode() + b'\0' + imported_key.encode())
+    key = key.hexdigest()
+
+    if all(imported_model_etree is None for imported_model_etree in imported_models):
+        return key, model_etree
+
+    cache = get_flattened_model_cache()
+    flattened = cache.get(key)
+    if flattened is None:
+        flattened = _flatten_cellml_model(model_etree, imports, imported_models)
+        cache.set(key, flattened, size=10 * len(lxml.etree.tostring(flattened)))
+    return key, flattened
+
+
+def _flatten_cellml_model(model_etree, imports, imported_models):
+    """ Copy the imported components and units of a CellML model into a copy of the model
+
+    Args:
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for the model
+        imports (:obj:`list` of :obj:`tuple`): imports of the model (see :obj:`get_cellml_imports`)
+        imported_models (:obj:`list` of :obj:`lxml.etree._ElementTree`): flattened imported models, or :obj:`None`
+            for imports which were not resolved
+
+    Returns:
+        :obj:`lxml.etree._ElementTree`: element tree for the flattened model
+    """
+    flattened = copy.deepcopy(model_etree)
+    root = flattened.getroot()
+    namespace = root.tag[1:].partition('}')[0]
+
+    import_els = [el for el in root if _is_cellml_element(el, 'import')]
+    local_names = {
+        (el.tag.rpartition('}')[2], el.attrib.get('name', None))
+        for el in root
+        if _is_cellml_element(el, 'component') or _is_cellml_element(el, 'units')
+    }
+
+    for import_el, (_, items), imported_model_etree in zip(import_els, imports, imported_models):
+        if imported_model_etree is None:
+            continue
+
+        imported_root = imported_model_etree.getroot()
+        for type, ref, name in items:
+            for i_el, el in enumerate(_get_imported_elements(imported_root, type, ref)):
+                el = copy.deepcopy(el)
+                if i_el == 0:
+                    el.attrib['name'] = name
+                if (type, el.attrib.get('name', None)) in local_names:
+                    continue
+                local_names.add((type, el.attrib.get('name', None)))
+                _set_cellml_namespace(el, namespace)
+                root.append(el)
+
+        root.remove(import_el)
+
+    return flattened
+
+
+def _get_imported_elements(imported_root, type, ref):
+    """ Get the elements of a model which an import of a component or units brings into the importing model,
+    which are the component and the components which it encapsulates, or the units
+
+    Args:
+        imported_root (:obj:`lxml.etree._Element`): root of the imported model
+        type (:obj:`str`): ``component`` or ``units``
+        ref (:obj:`str`): name of the component or units in the imported model
+
+    Returns:
+        :obj:`list` of :obj:`lxml.etree._Element`: elements
+    """
+    els = {el.attrib.get('name', None): el for el in imported_root if _is_cellml_element(el, type)}
+    if ref not in els:
+        return []
+    if type == 'units':
+        return [els[ref]]
+
+    children = {}
+    for group_el in imported_root:
+        if not _is_cellml_element(group_el, 'group'):
+            continue
+        if not any(_is_cellml_element(el, 'relationship_ref') and el.attrib.get('relationship', None) == 'encapsulation'
+                   for el in group_el):
+            continue
+        for parent_el in group_el.iter('{*}component_ref'):
+            children.setdefault(parent_el.attrib.get('component', None), []).extend(
+                child_el.attrib.get('component', None) for child_el in parent_el if _is_cellml_element(child_el, 'component_ref'))
+
+    names = [ref]
+    for name in names:
+        for child_name in children.get(name, []):
+            if child_name not in names:
+                names.append(child_name)
+    return [els[name] for name in names if name in els]
+
+
+def _get_local_filename(href, dirname):
+    """ Get the path to an imported model which is a local file
+
+    Args:
+        href (:obj:`str`): location of the imported model
+        dirname (:obj:`str`): directory of the importing model
+
+    Returns:
+        :obj:`str`: absolute path to the imported model, or :obj:`None` if the import is not a local file
+    """
+    if not href:
+        return None
+    url = urllib.parse.urlparse(href)
+    if url.scheme and url.scheme != 'file' and len(url.scheme) > 1:
+        return None
+
+    filename = os.path.abspath(os.path.join(dirname, urllib.parse.unquote(url.path if url.scheme == 'file' else href)))
+    if not os.path.isfile(filename):
+        return None
+    return filename
+
+
+def _is_cellml_element(el, tag):
+    """ Determine whether an XML element is a CellML element of a type
+
+    Args:
+        el (:obj:`lxml.etree._Element`): XML element
+        tag (:obj:`str`): type of element (e.g., ``component``)
+
+    Returns:
+        :obj:`bool`
+    """
+    return (
+        isinstance(el.tag, str)
+        and el.tag.startswith('{' + CELLML_NAMESPACE_PREFIX)
+        and el.tag.rpartition('}')[2] == tag
+    )
+
+
+def _set_cellml_namespace(el, namespace):
+    """ Set the namespace of a CellML element and of its CellML descendants (e.g., to copy elements of a CellML 1.0
+    model into a CellML 1.1 model)
+
+    Args:
+        el (:obj:`lxml.etree._Element`): XML element
+        namespace (:obj:`str`): CellML namespace
+    """
+    for descendant in el.iter():
+        if isinstance(descendant.tag, str) and descendant.tag.startswith('{' + CELLML_NAMESPACE_PREFIX):
+            descendant.tag = '{' + namespace + '}' + descendant.tag.rpartition('}')[2]
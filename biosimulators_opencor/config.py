@@ -0,0 +1,138 @@
+""" Configuration for OpenCOR-specific features of the simulation tool
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import os
+
+__all__ = ['SimulatorConfig', 'get_simulator_config']
+
+DEFAULT_SIMULATION_POOL_MAX_ENTRIES = 8
+DEFAULT_SIMULATION_POOL_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_NUM_WORKERS = 1
+DEFAULT_SKIP_TRANSIENT_OUTPUT = True
+DEFAULT_STREAMING_SEGMENT_STEPS = 10000
+DEFAULT_MODEL_CACHE_MAX_ENTRIES = 64
+DEFAULT_MODEL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_ALGORITHM_TABLES_FILENAME = None
+DEFAULT_PROFILE_TASKS = False
+DEFAULT_PROFILE_MEMORY = False
+DEFAULT_TRACE_FILENAME = None
+DEFAULT_ENSEMBLE_CHUNK_SIZE = 0
+DEFAULT_ENSEMBLE_MAX_RETRIES = 2
+
+
+class SimulatorConfig(object):
+    """ OpenCOR configuration
+
+    Attributes:
+        SIMULATION_POOL_MAX_ENTRIES (:obj:`int`): maximum number of opened OpenCOR simulations to keep for reuse
+            by subsequent tasks (``0`` disables the pool)
+        SIMULATION_POOL_MAX_BYTES (:obj:`int`): maximum estimated memory (in bytes) of the opened OpenCOR simulations
+            to keep for reuse by subsequent tasks
+        NUM_WORKERS (:obj:`int`): number of OpenCOR worker processes for executing independent tasks in parallel
+            (``1`` executes tasks serially in the current process)
+        SKIP_TRANSIENT_OUTPUT (:obj:`bool`): whether to integrate simulations from their initial times to their output start
+            times without recording the results (otherwise, the transient is recorded and then discarded)
+        STREAMING_SEGMENT_STEPS (:obj:`int`): maximum number of steps of each segment of simulations whose results are streamed
+            to HDF5 files (see :obj:`exec_sed_task`)
+        MODEL_CACHE_MAX_ENTRIES (:obj:`int`): maximum number of parsed models to keep for reuse by subsequent tasks
+            (``0`` disables the cache)
+        MODEL_CACHE_MAX_BYTES (:obj:`int`): maximum estimated memory (in bytes) of the parsed models to keep for reuse by
+            subsequent tasks
+        ALGORITHM_TABLES_FILENAME (:obj:`str`): path to precomputed substitutions of algorithms and translations of the values
+            of their parameters to load when they are first used (see :obj:`save_algorithm_tables`)
+        PROFILE_TASKS (:obj:`bool`): whether to profile the execution of each task with :obj:`cProfile` and save the profiles
+            to the output directories of the SED documents (see :obj:`biosimulators_opencor.profiling`)
+        PROFILE_MEMORY (:obj:`bool`): whether to also trace the memory allocated by Python while profiling tasks
+        TRACE_FILENAME (:obj:`str`): path to a JSON lines file to append spans of the execution of archives, SED documents,
+            tasks, and their phases to (see :obj:`biosimulators_opencor.tracing`)
+        ENSEMBLE_CHUNK_SIZE (:obj:`int`): number of parameter sets of each chunk of ensembles which are executed by the pool
+            of worker processes (``0`` divides each ensemble into about four chunks per worker, see
+            :obj:`exec_sed_task_ensemble`)
+        ENSEMBLE_MAX_RETRIES (:obj:`int`): maximum number of times to retry a chunk of an ensemble whose worker process
+            crashed
+    """
+
+    def __init__(self,
+                 SIMULATION_POOL_MAX_ENTRIES=DEFAULT_SIMULATION_POOL_MAX_ENTRIES,
+                 SIMULATION_POOL_MAX_BYTES=DEFAULT_SIMULATION_POOL_MAX_BYTES,
+                 NUM_WORKERS=DEFAULT_NUM_WORKERS,
+                 SKIP_TRANSIENT_OUTPUT=DEFAULT_SKIP_TRANSIENT_OUTPUT,
+                 STREAMING_SEGMENT_STEPS=DEFAULT_STREAMING_SEGMENT_STEPS,
+                 MODEL_CACHE_MAX_ENTRIES=DEFAULT_MODEL_CACHE_MAX_ENTRIES,
+                 MODEL_CACHE_MAX_BYTES=DEFAULT_MODEL_CACHE_MAX_BYTES,
+                 ALGORITHM_TABLES_FILENAME=DEFAULT_ALGORITHM_TABLES_FILENAME,
+                 PROFILE_TASKS=DEFAULT_PROFILE_TASKS,
+                 PROFILE_MEMORY=DEFAULT_PROFILE_MEMORY,
+                 TRACE_FILENAME=DEFAULT_TRACE_FILENAME,
+                 ENSEMBLE_CHUNK_SIZE=DEFAULT_ENSEMBLE_CHUNK_SIZE,
+                 ENSEMBLE_MAX_RETRIES=DEFAULT_ENSEMBLE_MAX_RETRIES):
+        """
+        Args:
+            SIMULATION_POOL_MAX_ENTRIES (:obj:`int`, optional): maximum number of opened OpenCOR simulations to keep for reuse
+                by subsequent tasks (``0`` disables the pool)
+            SIMULATION_POOL_MAX_BYTES (:obj:`int`, optional): maximum estimated memory (in bytes) of the opened OpenCOR simulations
+                to keep for reuse by subsequent tasks
+            NUM_WORKERS (:obj:`int`, optional): number of OpenCOR worker processes for executing independent tasks in parallel
+                (``1`` executes tasks serially in the current process)
+            SKIP_TRANSIENT_OUTPUT (:obj:`bool`, optional): whether to integrate simulations from their initial times to their
+                output start times without recording the results (otherwise, the transient is recorded and then discarded)
+            STREAMING_SEGMENT_STEPS (:obj:`int`, optional): maximum number of steps of each segment of simulations whose
+                results are streamed to HDF5 files (see :obj:`exec_sed_task`)
+            MODEL_CACHE_MAX_ENTRIES (:obj:`int`, optional): maximum number of parsed models to keep for reuse by subsequent
+                tasks (``0`` disables the cache)
+            MODEL_CACHE_MAX_BYTES (:obj:`int`, optional): maximum estimated memory (in bytes) of the parsed models to keep for
+                reuse by subsequent tasks
+            ALGORITHM_TABLES_FILENAME (:obj:`str`, optional): path to precomputed substitutions of algorithms and translations
+                of the values of their parameters to load when they are first used (see :obj:`save_algorithm_tables`)
+            PROFILE_TASKS (:obj:`bool`, optional): whether to profile the execution of each task with :obj:`cProfile` and save
+                the profiles to the output directories of the SED documents (see :obj:`biosimulators_opencor.profiling`)
+            PROFILE_MEMORY (:obj:`bool`, optional): whether to also trace the memory allocated by Python while profiling tasks
+            TRACE_FILENAME (:obj:`str`, optional): path to a JSON lines file to append spans of the execution of archives, SED
+                documents, tasks, and their phases to (see :obj:`biosimulators_opencor.tracing`)
+            ENSEMBLE_CHUNK_SIZE (:obj:`int`, optional): number of parameter sets of each chunk of ensembles which are executed
+                by the pool of worker processes (``0`` divides each ensemble into about four chunks per worker, see
+                :obj:`exec_sed_task_ensemble`)
+            ENSEMBLE_MAX_RETRIES (:obj:`int`, optional): maximum number of times to retry a chunk of an ensemble whose worker
+                process crashed
+        """
+        self.SIMULATION_POOL_MAX_ENTRIES = SIMULATION_POOL_MAX_ENTRIES
+        self.SIMULATION_POOL_MAX_BYTES = SIMULATION_POOL_MAX_BYTES
+        self.NUM_WORKERS = NUM_WORKERS
+        self.SKIP_TRANSIENT_OUTPUT = SKIP_TRANSIENT_OUTPUT
+        self.STREAMING_SEGMENT_STEPS = STREAMING_SEGMENT_STEPS
+        self.MODEL_CACHE_MAX_ENTRIES = MODEL_CACHE_MAX_ENTRIES
+        self.MODEL_CACHE_MAX_BYTES = MODEL_CACHE_MAX_BYTES
+        self.ALGORITHM_TABLES_FILENAME = ALGORITHM_TABLES_FILENAME
+        self.PROFILE_TASKS = PROFILE_TASKS
+        self.PROFILE_MEMORY = PROFILE_MEMORY
+        self.TRACE_FILENAME = TRACE_FILENAME
+        self.ENSEMBLE_CHUNK_SIZE = ENSEMBLE_CHUNK_SIZE
+        self.ENSEMBLE_MAX_RETRIES = ENSEMBLE_MAX_RETRIES
+
+
+def get_simulator_config():
+    """ Get the OpenCOR configuration from environment variables
+
+    Returns:
+        :obj:`SimulatorConfig`: configuration
+    """
+    return SimulatorConfig(
+        SIMULATION_POOL_MAX_ENTRIES=int(os.environ.get('SIMULATION_POOL_MAX_ENTRIES', DEFAULT_SIMULATION_POOL_MAX_ENTRIES)),
+        SIMULATION_POOL_MAX_BYTES=int(os.environ.get('SIMULATION_POOL_MAX_BYTES', DEFAULT_SIMULATION_POOL_MAX_BYTES)),
+        NUM_WORKERS=int(os.environ.get('NUM_WORKERS', DEFAULT_NUM_WORKERS)),
+        SKIP_TRANSIENT_OUTPUT=os.environ.get('SKIP_TRANSIENT_OUTPUT', '1').lower() in ['1', 'true'],
+        STREAMING_SEGMENT_STEPS=int(os.environ.get('STREAMING_SEGMENT_STEPS', DEFAULT_STREAMING_SEGMENT_STEPS)),
+        MODEL_CACHE_MAX_ENTRIES=int(os.environ.get('MODEL_CACHE_MAX_ENTRIES', DEFAULT_MODEL_CACHE_MAX_ENTRIES)),
+        MODEL_CACHE_MAX_BYTES=int(os.environ.get('MODEL_CACHE_MAX_BYTES', DEFAULT_MODEL_CACHE_MAX_BYTES)),
+        ALGORITHM_TABLES_FILENAME=os.environ.get('ALGORITHM_TABLES_FILENAME', DEFAULT_ALGORITHM_TABLES_FILENAME) or None,
+        PROFILE_TASKS=os.environ.get('PROFILE_TASKS', '0').lower() in ['1', 'true'],
+        PROFILE_MEMORY=os.environ.get('PROFILE_MEMORY', '0').lower() in ['1', 'true'],
+        TRACE_FILENAME=os.environ.get('TRACE_FILENAME', DEFAULT_TRACE_FILENAME) or None,
+        ENSEMBLE_CHUNK_SIZE=int(os.environ.get('ENSEMBLE_CHUNK_SIZE', DEFAULT_ENSEMBLE_CHUNK_SIZE)),
+        ENSEMBLE_MAX_RETRIES=int(os.environ.get('ENSEMBLE_MAX_RETRIES', DEFAULT_ENSEMBLE_MAX_RETRIES)),
+    )
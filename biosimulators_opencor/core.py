@@ -6,29 +6,46 @@
 :License: MIT
 """
 
-from .utils import (validate_task, validate_simulation, load_opencor_simulation,
-                    get_results_from_opencor_simulation, log_opencor_execution, get_mock_libcellml)
-from biosimulators_utils.combine.exec import exec_sedml_docs_in_archive
+from .cache import get_simulation_pool, get_parsed_model_cache, get_results_index_cache
+from .cellml_imports import get_flattened_cellml_model
+from .config import get_simulator_config
+from .instrumentation import PhaseTimer, write_task_phases_summary, write_solver_settings_summary
+from .model_index import get_cellml_model_index
+from .parallel import get_independent_tasks, get_worker_pool, submit_tasks_to_worker_pool
+from .tracing import get_tracer, trace_span
+from .utils import (validate_task, validate_simulation, get_opencor_model_change_values, write_xml_model_with_changes,
+                    load_pooled_opencor_simulation, set_opencor_simulation_values, run_opencor_simulation, continue_opencor_simulation,
+                    estimate_opencor_simulation_size, get_opencor_results_index, get_results_from_opencor_simulation,
+                    get_opencor_solver_settings,
+                    release_opencor_simulation_results, log_opencor_execution, get_mock_libcellml,
+                    is_repeated_task_executable_with_single_simulation, are_model_changes_applicable_to_simulations)
 from biosimulators_utils.config import get_config, Config  # noqa: F401
 from biosimulators_utils.utils.core import raise_errors_warnings
 from biosimulators_utils.log.data_model import CombineArchiveLog, TaskLog, StandardOutputErrorCapturerLevel  # noqa: F401
 from biosimulators_utils.viz.data_model import VizFormat  # noqa: F401
 from biosimulators_utils.report.data_model import ReportFormat, VariableResults, SedDocumentResults  # noqa: F401
-from biosimulators_utils.sedml import validation
 from biosimulators_utils.sedml.data_model import Task, ModelAttributeChange, Variable  # noqa: F401
-from biosimulators_utils.sedml.exec import exec_sed_doc as base_exec_sed_doc
-from biosimulators_utils.sedml.utils import apply_changes_to_xml_model
+from biosimulators_utils.sedml.warnings import SedmlFeatureNotSupportedWarning
+from biosimulators_utils.utils.core import pad_arrays_to_consistent_shapes
+from biosimulators_utils.warnings import warn
 from unittest import mock
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
+import functools
+import math
+import numpy
 import os
-import tempfile
+import threading
 
 __all__ = [
-    'exec_sedml_docs_in_combine_archive', 'exec_sed_doc', 'exec_sed_task', 'preprocess_sed_task',
+    'exec_sedml_docs_in_combine_archive', 'exec_sed_doc', 'SedDocExecutionContext', 'sed_doc_execution_context',
+    'exec_repeated_sed_task', 'exec_sed_task', 'preprocess_sed_task',
 ]
 
 
-def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
+def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None, simulator_config=None):
     """ Execute the SED tasks defined in a COMBINE/OMEX archive and save the outputs
 
     Args:
@@ -41,6 +58,12 @@ def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
               with reports at keys ``{ relative-path-to-SED-ML-file-within-archive }/{ report.id }`` within the HDF5 file
 
         config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+
+    A summary of the wall time, CPU time, and memory of the phases of the tasks of the archive
+    (see :obj:`summarize_task_phases`) is saved to ``{ out_dir }/opencor-phases.json``, and a summary of the settings
+    of the solvers of the tasks (see :obj:`summarize_solver_settings`) is saved to
+    ``{ out_dir }/opencor-solver-settings.json``.
 
     Returns:
         :obj:`tuple`:
@@ -48,19 +71,51 @@ def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None):
             * :obj:`SedDocumentResults`: results
             * :obj:`CombineArchiveLog`: log
     """
-    with mock.patch.dict('sys.modules', libcellml=get_mock_libcellml()):
-        return exec_sedml_docs_in_archive(exec_sed_doc, archive_filename, out_dir,
-                                          apply_xml_model_changes=True,
-                                          log_level=StandardOutputErrorCapturerLevel.python,
-                                          config=config)
+    from biosimulators_utils.combine.exec import exec_sedml_docs_in_archive
+
+    if not simulator_config:
+        simulator_config = get_simulator_config()
+
+    get_tracer(simulator_config)
+    with trace_span('exec_sedml_docs_in_combine_archive', archive=archive_filename):
+        with mock.patch.dict('sys.modules', libcellml=get_mock_libcellml()):
+            results, log = exec_sedml_docs_in_archive(functools.partial(exec_sed_doc, simulator_config=simulator_config),
+                                                      archive_filename, out_dir,
+                                                      apply_xml_model_changes=False,
+                                                      log_level=StandardOutputErrorCapturerLevel.python,
+                                                      config=config)
+
+    # summarize the time and memory of the phases of the tasks and the settings of their solvers next to the reports
+    if log:
+        write_task_phases_summary(log, out_dir)
+        write_solver_settings_summary(log, out_dir)
+
+    return results, log
 
 
 def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
                  apply_xml_model_changes=False,
                  log=None, indent=0, pretty_print_modified_xml_models=False,
-                 log_level=StandardOutputErrorCapturerLevel.c, config=None):
+                 log_level=StandardOutputErrorCapturerLevel.c, config=None, simulator_config=None):
     """ Execute the tasks specified in a SED document and generate the specified outputs
 
+    When :obj:`SimulatorConfig.NUM_WORKERS` is greater than 1, the basic tasks which don't depend on other tasks
+    (see :obj:`get_independent_tasks`) are executed in parallel by a pool of OpenCOR worker processes. The document
+    is then executed as usual, using the results of the worker processes in place of executing these tasks again.
+    Tasks which fail in a worker process are re-executed in the current process so that their errors are reported
+    in the same way as for serial execution. Because the failed executions of these tasks have already been profiled
+    by the worker processes, their re-executions aren't profiled again. When the pool is broken (e.g., a worker
+    crashed), it is replaced by a new pool, and when the tasks can't be submitted to the new pool either, they are
+    executed serially.
+
+    When :obj:`apply_xml_model_changes` is :obj:`False`, the changes to models are applied by :obj:`exec_sed_task`,
+    which applies the changes to the values of constants and the initial values of states to compiled simulations
+    of the unmodified models. Documents whose changes can only be applied to copies of model files (see
+    :obj:`are_model_changes_applicable_to_simulations`) are always executed with :obj:`apply_xml_model_changes`.
+
+    When :obj:`SimulatorConfig.PROFILE_TASKS` is enabled, the execution of each basic task is profiled, and the
+    profiles are saved to ``{base_out_path}/{rel_out_path}/profiles`` (see :obj:`biosimulators_opencor.profiling`).
+
     Args:
         doc (:obj:`SedDocument` or :obj:`str`): SED document or a path to SED-ML file which defines a SED document
         working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
@@ -80,7 +135,7 @@ def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
         pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
         log_level (:obj:`StandardOutputErrorCapturerLevel`, optional): level at which to log output
         config (:obj:`Config`, optional): BioSimulators common configuration
-        simulator_config (:obj:`SimulatorConfig`, optional): tellurium configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
 
     Returns:
         :obj:`tuple`:
@@ -88,19 +143,371 @@ def exec_sed_doc(doc, working_dir, base_out_path, rel_out_path=None,
             * :obj:`ReportResults`: results of each report
             * :obj:`SedDocumentLog`: log of the document
     """
-    return base_exec_sed_doc(exec_sed_task, doc, working_dir, base_out_path,
-                             rel_out_path=rel_out_path,
-                             apply_xml_model_changes=apply_xml_model_changes,
-                             log=log,
-                             indent=indent,
-                             pretty_print_modified_xml_models=pretty_print_modified_xml_models,
-                             log_level=log_level,
-                             config=config)
+    if not config:
+        config = get_config()
+
+    # configure tracing with the OpenCOR configuration, or reuse the configuration of the calling archive or document
+    get_tracer(simulator_config)
+
+    if not simulator_config:
+        simulator_config = get_simulator_config()
+
+    if isinstance(doc, str):
+        from biosimulators_utils.sedml.io import SedmlSimulationReader
+        doc = SedmlSimulationReader().run(doc, config=config)
+
+    if not apply_xml_model_changes:
+        apply_xml_model_changes = not are_model_changes_applicable_to_simulations(doc)
+
+    context = SedDocExecutionContext()
+    task_executer = exec_sed_task
+
+    # profile the execution of each task
+    if simulator_config.PROFILE_TASKS:
+        from .profiling import get_profiles_dirname, profile_task_executer
+        profiles_dirname = get_profiles_dirname(base_out_path, rel_out_path)
+        task_executer = profile_task_executer(exec_sed_task, profiles_dirname, memory=simulator_config.PROFILE_MEMORY)
+    else:
+        profiles_dirname = None
+    serial_task_executer = task_executer
+
+    if simulator_config.NUM_WORKERS > 1:
+        tasks = get_independent_tasks(doc, working_dir)
+        if len(tasks) > 1:
+            futures = {}
+            for _ in range(2):
+                # a pool which broke since it was last used is replaced by :obj:`get_worker_pool`
+                worker_pool = get_worker_pool(simulator_config.NUM_WORKERS)
+                try:
+                    futures = submit_tasks_to_worker_pool(tasks, doc, working_dir, worker_pool, config=config,
+                                                          simulator_config=simulator_config, profiles_dirname=profiles_dirname)
+                    break
+                except concurrent.futures.BrokenExecutor:
+                    # tasks whose futures couldn't be submitted are executed serially
+                    futures = {}
+
+            def exec_sed_task_with_worker_results(task, variables, preprocessed_task=None, log=None, config=None):
+                future = futures.pop(task.id, None) if context.repeated_task_depth == 0 else None
+                if future is None or isinstance(future.exception(), concurrent.futures.BrokenExecutor):
+                    return serial_task_executer(task, variables, preprocessed_task=preprocessed_task, log=log, config=config)
+                if future.exception() is not None:
+                    # the worker has already saved a profile of the failed execution of the task
+                    return exec_sed_task(task, variables, preprocessed_task=preprocessed_task, log=log, config=config,
+                                         simulator_config=simulator_config)
+
+                results, algorithm, simulator_details = future.result()
+                if log:
+                    log.algorithm = algorithm
+                    log.simulator_details = simulator_details
+                return results, log
+
+            task_executer = exec_sed_task_with_worker_results
+
+    # execute repeated tasks with :obj:`exec_repeated_sed_task` so that their iterations can share a compiled simulation,
+    # and trace the generation of reports and plots
+    with trace_span('exec_sed_doc', document=rel_out_path):
+        with sed_doc_execution_context(context):
+            return base_exec_sed_doc(task_executer, doc, working_dir, base_out_path,
+                                     rel_out_path=rel_out_path,
+                                     apply_xml_model_changes=apply_xml_model_changes,
+                                     log=log,
+                                     indent=indent,
+                                     pretty_print_modified_xml_models=pretty_print_modified_xml_models,
+                                     log_level=log_level,
+                                     config=config)
+
+
+class SedDocExecutionContext(object):
+    """ State of the execution of a SED document by :obj:`exec_sed_doc`
+
+    Attributes:
+        repeated_task_depth (:obj:`int`): number of repeated tasks which are being executed, which is used to
+            distinguish the basic tasks of the document from the sub-tasks of its repeated tasks
+    """
+
+    def __init__(self):
+        self.repeated_task_depth = 0
+
+
+_sed_doc_execution_context = contextvars.ContextVar('sed_doc_execution_context', default=None)
+
+
+@contextlib.contextmanager
+def sed_doc_execution_context(context):
+    """ Execute SED documents in the current thread with a context, so that
+    :obj:`biosimulators_utils.sedml.exec.exec_sed_doc` executes their repeated tasks with
+    :obj:`exec_repeated_sed_task` and traces the generation of their reports and plots
+
+    Args:
+        context (:obj:`SedDocExecutionContext`): context
+
+    While any thread is executing a SED document with a context, the executers for repeated tasks, reports, and plots
+    of :obj:`biosimulators_utils.sedml.exec` are replaced with dispatchers (see :obj:`_patch_base_sedml_exec`).
+
+    Yields:
+        :obj:`SedDocExecutionContext`: context
+    """
+    with _patch_base_sedml_exec():
+        token = _sed_doc_execution_context.set(context)
+        try:
+            yield context
+        finally:
+            _sed_doc_execution_context.reset(token)
+
+
+_base_sedml_exec = {}
+_base_sedml_exec_lock = threading.Lock()
+_base_sedml_exec_num_patches = 0
+
+BASE_SEDML_EXEC_DISPATCHED_EXECUTERS = ['exec_repeated_task', 'exec_report', 'exec_plot_2d', 'exec_plot_3d']
+# :obj:`list` of :obj:`str`: names of the executers of :obj:`biosimulators_utils.sedml.exec` which are replaced with
+# dispatchers while SED documents are executed with :obj:`exec_sed_doc`
+
+
+def _import_base_sedml_exec():
+    """ Import the executers for SED documents and repeated tasks of BioSimulators utils on first use
+
+    The executers are imported lazily because they import the writers for every report and visualization format.
+    The original executers are kept in the returned dictionary, together with dispatchers for the executers for
+    repeated tasks, reports, and plots (keys ``dispatch_{name}``), which use the executers of this module in threads
+    which are executing a SED document with :obj:`exec_sed_doc` (see :obj:`sed_doc_execution_context`), and the
+    original executers otherwise.
+
+    Returns:
+        :obj:`dict`: dictionary which maps the names of the executers to the executers
+    """
+    with _base_sedml_exec_lock:
+        if not _base_sedml_exec:
+            from biosimulators_utils.sedml import exec as sedml_exec
+            base_sedml_exec = {
+                name: getattr(sedml_exec, name)
+                for name in ['exec_sed_doc'] + BASE_SEDML_EXEC_DISPATCHED_EXECUTERS
+            }
+
+            executers = {
+                'exec_repeated_task': exec_repeated_sed_task,
+                'exec_report': exec_report,
+                'exec_plot_2d': exec_plot_2d,
+                'exec_plot_3d': exec_plot_3d,
+            }
+            for name, executer in executers.items():
+                base_sedml_exec['dispatch_' + name] = _get_sedml_exec_dispatcher(executer, base_sedml_exec[name])
+
+            _base_sedml_exec.update(base_sedml_exec)
+    return _base_sedml_exec
+
+
+@contextlib.contextmanager
+def _patch_base_sedml_exec():
+    """ Replace the executers for repeated tasks, reports, and plots of :obj:`biosimulators_utils.sedml.exec` with
+    dispatchers (see :obj:`_import_base_sedml_exec`) while SED documents are executed with :obj:`exec_sed_doc`
+
+    :obj:`biosimulators_utils.sedml.exec.exec_sed_doc` calls these executers through the globals of its module, so
+    they can only be replaced for the whole process. The executers are therefore only replaced while at least one
+    thread is executing a SED document with :obj:`exec_sed_doc`, and the original executers are restored once the
+    last of these threads has finished. Meanwhile, the dispatchers use the original executers in other threads, so
+    that other simulators and callers in the same process aren't affected.
+    """
+    global _base_sedml_exec_num_patches
+
+    base_sedml_exec = _import_base_sedml_exec()
+    from biosimulators_utils.sedml import exec as sedml_exec
+
+    with _base_sedml_exec_lock:
+        if _base_sedml_exec_num_patches == 0:
+            for name in BASE_SEDML_EXEC_DISPATCHED_EXECUTERS:
+                setattr(sedml_exec, name, base_sedml_exec['dispatch_' + name])
+        _base_sedml_exec_num_patches += 1
+
+    try:
+        yield
+    finally:
+        with _base_sedml_exec_lock:
+            _base_sedml_exec_num_patches -= 1
+            if _base_sedml_exec_num_patches == 0:
+                for name in BASE_SEDML_EXEC_DISPATCHED_EXECUTERS:
+                    setattr(sedml_exec, name, base_sedml_exec[name])
+
+
+def _get_sedml_exec_dispatcher(executer, base_executer):
+    """ Get a function which calls an executer of this module in threads which are executing a SED document
+    with :obj:`exec_sed_doc`, and the corresponding executer of BioSimulators utils otherwise
+
+    Args:
+        executer (:obj:`types.FunctionType`): executer of this module
+        base_executer (:obj:`types.FunctionType`): executer of BioSimulators utils
+
+    Returns:
+        :obj:`types.FunctionType`: dispatcher
+    """
+    @functools.wraps(base_executer)
+    def dispatch(*args, **kwargs):
+        if _sed_doc_execution_context.get() is None:
+            return base_executer(*args, **kwargs)
+        return executer(*args, **kwargs)
+    return dispatch
+
 
+def base_exec_sed_doc(*args, **kwargs):
+    """ Execute a SED document with :obj:`biosimulators_utils.sedml.exec.exec_sed_doc` """
+    return _import_base_sedml_exec()['exec_sed_doc'](*args, **kwargs)
 
-def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None):
+
+def base_exec_repeated_task(*args, **kwargs):
+    """ Execute a repeated task with :obj:`biosimulators_utils.sedml.exec.exec_repeated_task` """
+    return _import_base_sedml_exec()['exec_repeated_task'](*args, **kwargs)
+
+
+def exec_report(report, *args, **kwargs):
+    """ Generate and save a report with :obj:`biosimulators_utils.sedml.exec.exec_report`, tracing its generation """
+    with trace_span('writeReport', output=report.id):
+        return _import_base_sedml_exec()['exec_report'](report, *args, **kwargs)
+
+
+def exec_plot_2d(plot, *args, **kwargs):
+    """ Generate and save a 2D plot with :obj:`biosimulators_utils.sedml.exec.exec_plot_2d`, tracing its generation """
+    with trace_span('writePlot', output=plot.id):
+        return _import_base_sedml_exec()['exec_plot_2d'](plot, *args, **kwargs)
+
+
+def exec_plot_3d(plot, *args, **kwargs):
+    """ Generate and save a 3D plot with :obj:`biosimulators_utils.sedml.exec.exec_plot_3d`, tracing its generation """
+    with trace_span('writePlot', output=plot.id):
+        return _import_base_sedml_exec()['exec_plot_3d'](plot, *args, **kwargs)
+
+
+def exec_repeated_sed_task(task, task_executer, task_vars, doc, apply_xml_model_changes=False, model_etrees=None,
+                           pretty_print_modified_xml_models=False, config=None):
+    """ Execute a repeated SED task
+
+    Repeated tasks which iterate a single basic task over values of attributes of its model
+    (see :obj:`is_repeated_task_executable_with_single_simulation`) are executed with a single compiled
+    OpenCOR simulation, which is reset and whose attributes are set for each iteration. All other
+    repeated tasks are executed with :obj:`biosimulators_utils.sedml.exec.exec_repeated_task`.
+
+    Args:
+        task (:obj:`RepeatedTask`): task
+        task_executer (:obj:`types.FunctionType`): function to execute each task in the SED-ML file
+            (e.g., :obj:`exec_sed_task`)
+        task_vars (:obj:`list` of :obj:`Variable`): variables that task must record
+        doc (:obj:`SedDocument`): SED document
+        apply_xml_model_changes (:obj:`bool`, optional): if :obj:`True`, apply any model changes specified in the SED-ML file before
+            calling :obj:`task_executer`.
+        model_etrees (:obj:`dict` of :obj:`str` to :obj:`etree._Element`, optional): map from the ids of models to element
+            trees of their sources
+        pretty_print_modified_xml_models (:obj:`bool`, optional): if :obj:`True`, pretty print modified XML models
+        config (:obj:`Config`, optional): BioSimulators common configuration
+
+    Returns:
+        :obj:`VariableResults`: results of the variables, with shape (number of iterations, number of sub-tasks, number of points)
+    """
+    # track whether basic tasks are being executed as sub-tasks of repeated tasks (rather than as tasks of the document)
+    context = _sed_doc_execution_context.get() or SedDocExecutionContext()
+    context.repeated_task_depth += 1
+    try:
+        return _exec_repeated_sed_task(task, task_executer, task_vars, doc,
+                                       apply_xml_model_changes=apply_xml_model_changes,
+                                       model_etrees=model_etrees,
+                                       pretty_print_modified_xml_models=pretty_print_modified_xml_models,
+                                       config=config)
+    finally:
+        context.repeated_task_depth -= 1
+
+
+def _exec_repeated_sed_task(task, task_executer, task_vars, doc, apply_xml_model_changes=False, model_etrees=None,
+                            pretty_print_modified_xml_models=False, config=None):
+    from biosimulators_utils.sedml.utils import resolve_range, calc_compute_model_change_new_value
+
+    if not is_repeated_task_executable_with_single_simulation(task):
+        return base_exec_repeated_task(task, task_executer, task_vars, doc,
+                                       apply_xml_model_changes=apply_xml_model_changes,
+                                       model_etrees=model_etrees,
+                                       pretty_print_modified_xml_models=pretty_print_modified_xml_models,
+                                       config=config)
+
+    if not task.reset_model_for_each_iteration:
+        msg = (
+            'Only independent execution of iterations of repeated tasks is supported. '
+            'Successive iterations will not be executed starting from the end state of the previous iteration.'
+        )
+        warn(msg, SedmlFeatureNotSupportedWarning)
+
+    # resolve the ranges
+    range_values = {}
+    range_values[task.range.id] = resolve_range(task.range, model_etrees=model_etrees)
+    for task_range in task.ranges:
+        range_values[task_range.id] = resolve_range(task_range, model_etrees=model_etrees)
+    for change in task.changes:
+        if change.range:
+            range_values[change.range.id] = resolve_range(change.range, model_etrees=model_etrees)
+    num_iterations = len(range_values[task.range.id])
+
+    # execute the iterations, applying the changes to the same compiled simulation
+    sub_task = task.sub_tasks[0].task
+    preprocessed_task = None
+
+    variable_results = VariableResults()
+    for var in task_vars:
+        variable_results[var.id] = []
+
+    for i_iteration in range(num_iterations):
+        current_range_values = {range_id: values[i_iteration] for range_id, values in range_values.items()}
+
+        iteration_task = copy.copy(sub_task)
+        iteration_task.model = copy.copy(sub_task.model)
+        iteration_task.model.changes = list(sub_task.model.changes)
+        for change in task.changes:
+            new_value = calc_compute_model_change_new_value(change, range_values=current_range_values)
+            if not math.isfinite(new_value):
+                msg = 'The value of the change of `{}` of iteration {} of repeated task `{}` must be finite, not `{}`.'.format(
+                    change.target, i_iteration + 1, task.id, new_value)
+                raise ValueError(msg)
+            if new_value == int(new_value):
+                new_value = str(int(new_value))
+            else:
+                new_value = str(new_value)
+            iteration_task.model.changes.append(ModelAttributeChange(
+                target=change.target, target_namespaces=change.target_namespaces, new_value=new_value))
+
+        if preprocessed_task is None:
+            preprocessed_task = preprocess_sed_task(iteration_task, task_vars, config=config)
+
+        iteration_results, _ = task_executer(iteration_task, task_vars, preprocessed_task=preprocessed_task, config=config)
+        for var in task_vars:
+            variable_results[var.id].append([iteration_results.get(var.id, None)])
+
+    # stack the results of the iterations into arrays of consistent shape
+    arrays = []
+    for var in task_vars:
+        for i_iteration in range(num_iterations):
+            arrays.append(variable_results[var.id][i_iteration][0])
+
+    padded_arrays = pad_arrays_to_consistent_shapes(arrays)
+
+    i_array = 0
+    for var in task_vars:
+        for i_iteration in range(num_iterations):
+            variable_results[var.id][i_iteration][0] = padded_arrays[i_array]
+            i_array += 1
+        variable_results[var.id] = numpy.array(variable_results[var.id])
+
+    return variable_results
+
+
+def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None, simulator_config=None, stream_to=None):
     ''' Execute a task and save its results
 
+    Optionally, the results of the variables can be streamed to an HDF5 file, rather than accumulated in memory.
+    In this mode, the time course is integrated in segments of at most :obj:`SimulatorConfig.STREAMING_SEGMENT_STEPS`
+    steps, each segment starts from the final state of the previous segment, and the results of each segment are
+    appended to chunked datasets of the file. The memory required to execute the task then depends on the size
+    of the segments, rather than on the number of steps of the simulation.
+
+    The wall time, CPU time, and change of the memory of each phase of the execution (``validate``, ``resolveModelChanges``,
+    ``writeModel``, ``load``, ``run``, ``extractResults``, ``writeResults``, and ``release``) are recorded in the
+    ``phases`` attribute of the simulator details of the log (see :obj:`PhaseTimer`). When tracing is enabled,
+    spans are also recorded for the task and its phases (see :obj:`biosimulators_opencor.tracing`).
+
     Args:
         task (:obj:`Task`): task
         variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
@@ -109,11 +516,14 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
             for repeated calls to this method.
         log (:obj:`TaskLog`, optional): log for the task
         config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+        stream_to (:obj:`str`, optional): path to an HDF5 file to stream the results of the variables to
 
     Returns:
         :obj:`tuple`:
 
-            :obj:`VariableResults`: results of variables
+            :obj:`VariableResults`: results of variables (if :obj:`stream_to` is set, a :obj:`StreamedVariableResults`
+                with the path to the HDF5 file and the number of points of the results; the file isn't kept open)
             :obj:`TaskLog`: log
 
     Raises:
@@ -124,68 +534,197 @@ def exec_sed_task(task, variables, preprocessed_task=None, log=None, config=None
     if not config:
         config = get_config()
 
+    # configure tracing with the OpenCOR configuration, or reuse the configuration of the calling archive or document
+    get_tracer(simulator_config)
+
+    if not simulator_config:
+        simulator_config = get_simulator_config()
+
     # initialize a log of the execution of this task
     if config.LOG and not log:
         log = TaskLog()
 
+    with trace_span('exec_sed_task', task=task.id, numberOfSteps=task.simulation.number_of_steps,
+                    numVariables=len(variables)) as span:
+        return _exec_sed_task(task, variables, preprocessed_task, log, config, simulator_config, stream_to, span)
+
+
+def _exec_sed_task(task, variables, preprocessed_task, log, config, simulator_config, stream_to, span):
+    # measure the time and memory of each phase of the execution of the task
+    timer = PhaseTimer()
+
     if preprocessed_task is None:
-        preprocessed_task = preprocess_sed_task(task, variables, config=config)
+        with timer.measure('validate'):
+            preprocessed_task = preprocess_sed_task(task, variables, config=config)
+    span['modelHash'] = preprocessed_task.get('model_hash', None)
+
+    # set up OpenCOR task
+    opencor_task = get_opencor_task(task, preprocessed_task, simulator_config=simulator_config)
+    span['algorithm'] = opencor_task.simulation.algorithm.kisao_id
+
+    simulation_pool = get_simulation_pool(simulator_config)
 
-    # modify model
+    # if possible, apply the changes to the model to a compiled simulation of the unmodified model
     if task.model.changes:
+        from biosimulators_utils.sedml import validation
         raise_errors_warnings(validation.validate_model_change_types(task.model.changes, (ModelAttributeChange,)),
                               error_summary='Changes for model `{}` are not supported.'.format(task.model.id))
+        with timer.measure('resolveModelChanges'):
+            model_change_values = get_opencor_model_change_values(task.model.changes, preprocessed_task['model_etree'],
+                                                                  model_index=preprocessed_task['model_index'])
+    else:
+        model_change_values = {}
+
+    opencor_sim = None
+    model_changes_applied_to_simulation = False
+    if model_change_values is not None:
+        with timer.measure('load'):
+            opencor_sim, simulation_pool_key, simulation_pool_hit = load_pooled_opencor_simulation(
+                opencor_task, variables, simulation_pool)
+            try:
+                values_set = set_opencor_simulation_values(opencor_sim, model_change_values)
+            except Exception:
+                # close the simulation rather than returning it to the pool, because its state is unknown
+                simulation_pool.on_evict(simulation_pool_key, opencor_sim)
+                raise
+
+        if not values_set:
+            simulation_pool.set(simulation_pool_key, opencor_sim,
+                                size=estimate_opencor_simulation_size(opencor_sim, opencor_task.simulation))
+            opencor_sim = None
+        else:
+            model_changes_applied_to_simulation = True
+
+    # otherwise, apply the changes to a copy of the model file and compile the modified model
+    if opencor_sim is None:
+        with timer.measure('writeModel'):
+            opencor_task.model.source = write_xml_model_with_changes(task.model, preprocessed_task['model_etree'])
+        try:
+            with timer.measure('load'):
+                opencor_sim, simulation_pool_key, simulation_pool_hit = load_pooled_opencor_simulation(
+                    opencor_task, variables, simulation_pool)
+        finally:
+            # clean up temporary model
+            os.remove(opencor_task.model.source)
+
+    # the simulation is checked out of the pool until it is returned to the pool; if the execution fails before then,
+    # the simulation is closed rather than leaked
+    returned_to_pool = False
+    try:
+        # execute the simulation, in segments if its results are streamed to a file
+        if stream_to:
+            from .streaming import get_simulation_segments, Hdf5VariableResultsWriter
+
+            segments = get_simulation_segments(opencor_task.simulation, simulator_config.STREAMING_SEGMENT_STEPS)
+            writer = Hdf5VariableResultsWriter(stream_to, variables, segments[0].number_of_steps + 1)
+        else:
+            segments = [opencor_task.simulation]
+            writer = None
+
+        results_index_cache = get_results_index_cache()
+        results_index = results_index_cache.get(simulation_pool_key)
+        segment_task = copy.copy(task)
+
+        try:
+            for i_segment, segment in enumerate(segments):
+                with timer.measure('run'):
+                    if i_segment == 0:
+                        succeeded = run_opencor_simulation(opencor_sim, segment)
+                    else:
+                        succeeded = continue_opencor_simulation(opencor_sim, segment)
+                if not succeeded:
+                    raise RuntimeError('OpenCOR failed unexpectedly.')
+
+                # collect the results of the simulation, using the index of the variables of the compiled model
+                with timer.measure('extractResults'):
+                    if results_index is None:
+                        results_index = get_opencor_results_index(opencor_sim)
+                        # estimate ~100 bytes for the name and dictionary entry of each variable
+                        results_index_cache.set(simulation_pool_key, results_index, size=100 * len(results_index))
+                    segment_task.simulation = segment
+                    variable_results = get_results_from_opencor_simulation(opencor_sim, segment_task, variables,
+                                                                           preprocessed_task['variable_names'],
+                                                                           opencor_results_index=results_index)
+
+                # append the results of the segment, except for the point which duplicates the end of the previous segment
+                if writer:
+                    with timer.measure('writeResults'):
+                        if i_segment > 0:
+                            variable_results = VariableResults(
+                                (variable_id, values[1:]) for variable_id, values in variable_results.items())
+                        writer.append(variable_results)
+
+        finally:
+            if writer:
+                writer.close()
+
+        # collect the settings of the solver
+        solver_settings = get_opencor_solver_settings(opencor_task.simulation.algorithm)
+
+        with timer.measure('release'):
+            # release the trajectories which OpenCOR recorded for the other variables of the model
+            results_memory = release_opencor_simulation_results(opencor_sim, segments[-1], variable_results)
+
+            # return the simulation to the pool for reuse by subsequent tasks
+            simulation_pool.set(simulation_pool_key, opencor_sim,
+                                size=estimate_opencor_simulation_size(opencor_sim, segments[-1]))
+            returned_to_pool = True
+
+        if writer:
+            from .streaming import StreamedVariableResults
+            variable_results = StreamedVariableResults(stream_to, variables, writer.num_points)
+
+        # log action
+        if config.LOG:
+            details = {
+                'simulationPool': dict(hit=simulation_pool_hit, **simulation_pool.get_stats()),
+                'modelCache': get_parsed_model_cache(simulator_config).get_stats(),
+                'resultsMemory': results_memory,
+                'phases': timer.to_dict(),
+                'solverSettings': solver_settings,
+            }
+            if task.model.changes:
+                details['modelChangesAppliedToSimulation'] = model_changes_applied_to_simulation
+            if writer:
+                details['streaming'] = {
+                    'filename': stream_to,
+                    'segments': len(segments),
+                    'points': writer.num_points,
+                }
+            log_opencor_execution(opencor_task, log, details=details)
+    finally:
+        if not returned_to_pool:
+            # close the simulation rather than returning it to the pool, because its state is unknown
+            simulation_pool.on_evict(simulation_pool_key, opencor_sim)
 
-        model_etree = preprocessed_task['model_etree']
-        working_dir = os.path.dirname(task.model.source)
+    # return results and log
+    return variable_results, log
 
-        model = copy.deepcopy(task.model)
-        for change in model.changes:
-            change.new_value = str(change.new_value)
 
-        apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=None)
+def get_opencor_task(task, preprocessed_task, simulator_config=None):
+    """ Get the task for OpenCOR to execute for the time course of a SED task, without the changes to its model
 
-        model_file, model_filename = tempfile.mkstemp(suffix='.xml', dir=working_dir)
-        os.close(model_file)
+    Args:
+        task (:obj:`Task`): task
+        preprocessed_task (:obj:`dict`): preprocessed information about the task (see :obj:`preprocess_sed_task`)
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
 
-        model_etree.write(model_filename,
-                          xml_declaration=True,
-                          encoding="utf-8",
-                          standalone=False,
-                          pretty_print=False)
-    else:
-        model_filename = task.model.source
+    Returns:
+        :obj:`Task`: task for OpenCOR
+    """
+    if not simulator_config:
+        simulator_config = get_simulator_config()
 
-    # set up OpenCOR task
     opencor_task = copy.deepcopy(preprocessed_task['task'])
-    opencor_task.model.source = model_filename
+    opencor_task.model.source = task.model.source
     opencor_task.model.changes = []
     opencor_task.simulation.initial_time = task.simulation.initial_time
     opencor_task.simulation.output_start_time = task.simulation.output_start_time
     opencor_task.simulation.output_end_time = task.simulation.output_end_time
     opencor_task.simulation.number_of_steps = task.simulation.number_of_steps
-    opencor_task.simulation = validate_simulation(opencor_task.simulation)
-
-    # load an OpenCOR simulation
-    opencor_sim = load_opencor_simulation(opencor_task, variables)
-
-    # clean up temporary model
-    if task.model.changes:
-        os.remove(model_filename)
-
-    # execute the simulation
-    if not opencor_sim.run():
-        raise RuntimeError('OpenCOR failed unexpectedly.')
-
-    # collect the results of the simulation
-    variable_results = get_results_from_opencor_simulation(opencor_sim, task, variables, preprocessed_task['variable_names'])
-
-    # log action
-    if config.LOG:
-        log_opencor_execution(opencor_task, log)
-
-    # return results and log
-    return variable_results, log
+    opencor_task.simulation = validate_simulation(opencor_task.simulation,
+                                                  skip_transient_output=simulator_config.SKIP_TRANSIENT_OUTPUT)
+    return opencor_task
 
 
 def preprocess_sed_task(task, variables, config=None):
@@ -204,10 +743,16 @@ def preprocess_sed_task(task, variables, config=None):
         config = get_config()
 
     opencor_task, model_etree, opencor_variable_names = validate_task(task, variables, config=config)
+    _, model_hash = get_parsed_model_cache().get_model(task.model.source)
+
+    # index the model, including the components which it imports
+    model_index = get_cellml_model_index(get_flattened_cellml_model(task.model.source))
 
     # return preprocessed information
     return {
         'task': opencor_task,
         'model_etree': model_etree,
+        'model_hash': model_hash,
+        'model_index': model_index,
         'variable_names': opencor_variable_names,
     }
@@ -0,0 +1,518 @@
+""" Daemon which keeps OpenCOR loaded and executes jobs submitted through a localhost HTTP API
+
+The API has the following endpoints:
+
+* ``GET /health``: whether the daemon is alive
+* ``GET /ready``: whether the daemon can accept jobs (i.e., its workers have loaded OpenCOR and its queue isn't full)
+* ``POST /jobs``: submit a job, described by a JSON object with either
+
+    * ``archive`` and ``outDir``: paths to a COMBINE/OMEX archive and a directory to save its outputs, or
+    * ``sedml`` and ``task``: path to a SED-ML file and the id of a basic task in the file, and, optionally,
+      ``workingDir``: the directory relative to which models are located (default: the directory of the SED-ML file)
+
+  and, optionally, ``wait``: whether to respond once the job has finished rather than once it has been queued
+* ``GET /jobs``: status of each job
+* ``GET /jobs/{id}``: status, timing, and result of a job
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .batch import exec_archive_in_worker
+from .parallel import create_worker_pool, exec_sed_task_in_worker
+from biosimulators_utils.log.data_model import Status
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import collections
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+
+__all__ = [
+    'Job',
+    'warm_up_worker',
+    'exec_task_job_in_worker',
+    'SimulationDaemon',
+    'DaemonRequestHandler',
+    'DaemonHTTPServer',
+    'serve',
+    'main',
+]
+
+
+class Job(object):
+    """ Job submitted to a :obj:`SimulationDaemon`
+
+    Attributes:
+        id (:obj:`str`): id
+        spec (:obj:`dict`): description of the job (see the documentation of this module)
+        status (:obj:`Status`): status
+        result (:obj:`dict`): result (status of the execution of an archive, or the results of the variables of a task)
+        exception (:obj:`str`): description of the error of the job
+        submitted (:obj:`float`): time when the job was submitted
+        started (:obj:`float`): time when the execution of the job started
+        finished (:obj:`float`): time when the execution of the job finished
+        done (:obj:`threading.Event`): event which is set when the job has finished
+    """
+
+    def __init__(self, spec):
+        """
+        Args:
+            spec (:obj:`dict`): description of the job
+        """
+        self.id = uuid.uuid4().hex
+        self.spec = spec
+        self.status = Status.QUEUED
+        self.result = None
+        self.exception = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+
+    def to_dict(self):
+        """ Get a JSON-serializable description of the job
+
+        Returns:
+            :obj:`dict`: description of the job
+        """
+        return {
+            'id': self.id,
+            'spec': self.spec,
+            'status': self.status.value,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished,
+            'queueDuration': (self.started or time.time()) - self.submitted,
+            'runDuration': (self.finished or time.time()) - self.started if self.started else None,
+            'result': self.result,
+            'exception': self.exception,
+        }
+
+
+def warm_up_worker():
+    """ Import OpenCOR and the modules for executing tasks, archives, and their outputs, so that the first job of
+    a process doesn't pay for loading them
+    """
+    import opencor  # noqa: F401
+    from . import core
+    from biosimulators_utils.combine import exec  # noqa: F401
+
+    core._import_base_sedml_exec()
+
+
+def exec_task_job_in_worker(sedml_filename, task_id, working_dir):
+    """ Execute a basic task of a SED-ML file in a worker process
+
+    The SED-ML file is read by the worker, rather than by the daemon, because reading SED-ML files requires replacing
+    libCellML with a mock (see :obj:`get_mock_libcellml`) in :obj:`sys.modules`, which isn't safe while other threads
+    of the daemon are importing modules. Workers execute a single job at a time.
+
+    Args:
+        sedml_filename (:obj:`str`): path to the SED-ML file
+        task_id (:obj:`str`): id of the task
+        working_dir (:obj:`str`): directory relative to which models are located
+
+    Returns:
+        :obj:`dict`: duration of the execution of the task, and the results of its variables
+
+    Raises:
+        :obj:`ValueError`: if the SED-ML file doesn't have a basic task with the id
+    """
+    from .utils import get_mock_libcellml
+    from biosimulators_utils.sedml.data_model import Task
+    from biosimulators_utils.sedml.io import SedmlSimulationReader
+    from biosimulators_utils.sedml.utils import get_variables_for_task
+    from unittest import mock
+
+    with mock.patch.dict('sys.modules', libcellml=get_mock_libcellml()):
+        doc = SedmlSimulationReader().run(sedml_filename)
+    task = next((task for task in doc.tasks if task.id == task_id), None)
+    if not isinstance(task, Task):
+        raise ValueError('`{}` does not have a basic task with id `{}`.'.format(sedml_filename, task_id))
+    variables = get_variables_for_task(doc, task)
+    task.model.source = os.path.abspath(os.path.join(working_dir, task.model.source))
+
+    start_time = time.perf_counter()
+    results, _, _ = exec_sed_task_in_worker(task, variables)
+    return {
+        'duration': time.perf_counter() - start_time,
+        'variables': {variable_id: result.tolist() for variable_id, result in results.items()},
+    }
+
+
+class SimulationDaemon(object):
+    """ Queue of jobs which are executed by a pool of long-lived OpenCOR worker processes
+
+    Attributes:
+        max_concurrent_jobs (:obj:`int`): maximum number of jobs to execute simultaneously
+        max_queued_jobs (:obj:`int`): maximum number of jobs waiting to be executed
+        max_finished_jobs (:obj:`int`): maximum number of finished jobs whose status is retained
+        jobs (:obj:`collections.OrderedDict`): dictionary which maps the id of each job to the job
+        _queue (:obj:`queue.Queue`): jobs waiting to be executed
+        _lock (:obj:`threading.Lock`): lock for :obj:`jobs` and the pool of worker processes
+        _dispatchers (:obj:`list` of :obj:`threading.Thread`): threads which hand jobs to worker processes
+        _worker_pool (:obj:`concurrent.futures.ProcessPoolExecutor`): pool of worker processes, which the daemon owns
+            from when it is started until it is stopped
+        _broken_worker_pool (:obj:`concurrent.futures.ProcessPoolExecutor`): broken pool of worker processes which
+            should be replaced (see :obj:`replace_broken_worker_pool`)
+        _workers_ready (:obj:`threading.Event`): event which is set while the pool of worker processes has loaded
+            OpenCOR
+        _stopped (:obj:`threading.Event`): event which is set once the daemon has been stopped
+    """
+
+    def __init__(self, max_concurrent_jobs=1, max_queued_jobs=100, max_finished_jobs=1000):
+        """
+        Args:
+            max_concurrent_jobs (:obj:`int`, optional): maximum number of jobs to execute simultaneously
+            max_queued_jobs (:obj:`int`, optional): maximum number of jobs waiting to be executed
+            max_finished_jobs (:obj:`int`, optional): maximum number of finished jobs whose status is retained
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queued_jobs = max_queued_jobs
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = collections.OrderedDict()
+        self._queue = queue.Queue(maxsize=max_queued_jobs)
+        self._lock = threading.Lock()
+        self._dispatchers = []
+        self._worker_pool = None
+        self._broken_worker_pool = None
+        self._workers_ready = threading.Event()
+        self._stopped = threading.Event()
+
+    def start(self):
+        """ Load OpenCOR, and start the pool of worker processes and the threads which hand jobs to them
+
+        OpenCOR is loaded (:obj:`warm_up_worker`) before the workers are forked so that the workers, including
+        the workers which replace crashed workers, inherit it, and each worker loads anything else that it is
+        missing before the daemon reports that it is ready.
+
+        The daemon should be started before the threads of its server, so that its workers are forked from a process
+        without other threads (see :obj:`create_worker_pool`). Pools whose workers crash are replaced by
+        :obj:`replace_broken_worker_pool`.
+        """
+        self._stopped.clear()
+        warm_up_worker()
+        worker_pool = self._create_worker_pool()
+        with self._lock:
+            self._worker_pool = worker_pool
+            self._workers_ready.set()
+        for _ in range(self.max_concurrent_jobs):
+            dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+            dispatcher.start()
+            self._dispatchers.append(dispatcher)
+
+    def stop(self):
+        """ Stop executing jobs and shut down the pool of worker processes """
+        self._stopped.set()
+        for _ in self._dispatchers:
+            self._queue.put(None)
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        self._dispatchers = []
+        with self._lock:
+            self._workers_ready.clear()
+            worker_pools = [self._worker_pool, self._broken_worker_pool]
+            self._worker_pool = None
+            self._broken_worker_pool = None
+        for worker_pool in worker_pools:
+            if worker_pool is not None:
+                worker_pool.shutdown(wait=True)
+
+    def is_ready(self):
+        """ Determine whether the daemon can accept jobs
+
+        Returns:
+            :obj:`bool`: whether the daemon can accept jobs
+        """
+        return self._workers_ready.is_set() and bool(self._dispatchers) and not self._queue.full()
+
+    def submit(self, spec):
+        """ Queue a job
+
+        Args:
+            spec (:obj:`dict`): description of the job
+
+        Returns:
+            :obj:`Job`: job
+
+        Raises:
+            :obj:`ValueError`: if the description of the job is invalid
+            :obj:`queue.Full`: if the queue is full
+        """
+        if not isinstance(spec, dict):
+            raise ValueError('Job must be a JSON object.')
+        if 'archive' in spec:
+            if not isinstance(spec['archive'], str) or not isinstance(spec.get('outDir', None), str):
+                raise ValueError('Archive jobs must have `archive` and `outDir` paths.')
+        elif 'sedml' in spec:
+            if not isinstance(spec['sedml'], str) or not isinstance(spec.get('task', None), str):
+                raise ValueError('Task jobs must have a `sedml` path and a `task` id.')
+        else:
+            raise ValueError('Job must have an `archive` or a `sedml` attribute.')
+
+        job = Job(spec)
+        self._queue.put_nowait(job)
+        with self._lock:
+            self.jobs[job.id] = job
+        return job
+
+    def get_job(self, id):
+        """ Get a job
+
+        Args:
+            id (:obj:`str`): id of the job
+
+        Returns:
+            :obj:`Job`: job, or :obj:`None` if there is no job with the id
+        """
+        with self._lock:
+            return self.jobs.get(id, None)
+
+    def _dispatch(self):
+        """ Hand jobs to worker processes until the daemon is stopped """
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            # wait for a broken pool of worker processes to be replaced
+            while not self._workers_ready.wait(timeout=0.1):
+                if self._stopped.is_set():
+                    break
+
+            job.status = Status.RUNNING
+            job.started = time.time()
+            with self._lock:
+                worker_pool = self._worker_pool
+            try:
+                if worker_pool is None:
+                    raise RuntimeError('The daemon has been stopped.')
+                job.result = self._exec_job(job, worker_pool)
+                job.status = Status.FAILED if job.result.get('status', None) == Status.FAILED.value else Status.SUCCEEDED
+                job.exception = job.result.get('exception', None)
+            except BrokenProcessPool as exception:
+                self._request_worker_pool_replacement(worker_pool)
+                job.status = Status.FAILED
+                job.exception = '{}: {}'.format(exception.__class__.__name__, str(exception))
+            except Exception as exception:
+                job.status = Status.FAILED
+                job.exception = '{}: {}'.format(exception.__class__.__name__, str(exception))
+            job.finished = time.time()
+            job.done.set()
+
+            self._forget_finished_jobs()
+
+    def _request_worker_pool_replacement(self, worker_pool):
+        """ Request the replacement of a pool of worker processes once one of its workers has terminated abruptly
+
+        Args:
+            worker_pool (:obj:`concurrent.futures.ProcessPoolExecutor`): broken pool of worker processes
+        """
+        with self._lock:
+            # the pool may already have been replaced at the request of another dispatcher, or shut down
+            if self._worker_pool is worker_pool:
+                self._workers_ready.clear()
+                self._worker_pool = None
+                self._broken_worker_pool = worker_pool
+
+    def replace_broken_worker_pool(self):
+        """ Replace the pool of worker processes if one of its workers has terminated abruptly
+
+        Worker processes are forked (see :obj:`create_worker_pool`), and forked workers inherit the locks which
+        the forking thread holds. So that the replacement workers aren't forked by a dispatcher while it holds the
+        lock of the daemon, pools are replaced by the thread which owns the daemon (e.g., the main thread, which
+        runs its server, see :obj:`DaemonHTTPServer`), which should call this method periodically. Meanwhile, the
+        dispatchers wait for the pool to be replaced.
+
+        Returns:
+            :obj:`bool`: whether the pool was replaced
+        """
+        with self._lock:
+            broken_worker_pool = self._broken_worker_pool
+            self._broken_worker_pool = None
+        if broken_worker_pool is None:
+            return False
+
+        broken_worker_pool.shutdown(wait=True)
+        worker_pool = self._create_worker_pool()
+        with self._lock:
+            replaced = not self._stopped.is_set()
+            if replaced:
+                self._worker_pool = worker_pool
+                self._workers_ready.set()
+        if not replaced:
+            worker_pool.shutdown(wait=True)
+        return replaced
+
+    def _create_worker_pool(self):
+        """ Create a pool of worker processes which load OpenCOR before they execute jobs
+
+        Returns:
+            :obj:`concurrent.futures.ProcessPoolExecutor`: pool of worker processes
+        """
+        return create_worker_pool(self.max_concurrent_jobs, initializer=warm_up_worker)
+
+    def _exec_job(self, job, worker_pool):
+        """ Execute a job with a worker process
+
+        Args:
+            job (:obj:`Job`): job
+            worker_pool (:obj:`concurrent.futures.ProcessPoolExecutor`): pool of worker processes
+
+        Returns:
+            :obj:`dict`: result
+        """
+        spec = job.spec
+        if 'archive' in spec:
+            return worker_pool.submit(exec_archive_in_worker, spec['archive'], spec['outDir']).result()
+
+        sedml_filename = spec['sedml']
+        working_dir = spec.get('workingDir', None) or os.path.dirname(sedml_filename)
+        return worker_pool.submit(exec_task_job_in_worker, sedml_filename, spec['task'], working_dir).result()
+
+    def _forget_finished_jobs(self):
+        """ Discard the oldest finished jobs beyond :obj:`max_finished_jobs` """
+        with self._lock:
+            finished_job_ids = [id for id, job in self.jobs.items() if job.done.is_set()]
+            for id in finished_job_ids[:max(len(finished_job_ids) - self.max_finished_jobs, 0)]:
+                self.jobs.pop(id)
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """ Handler for requests to the HTTP API of a :obj:`SimulationDaemon` (``self.server.daemon``) """
+
+    def do_GET(self):
+        daemon = self.server.daemon
+        path = urllib.parse.urlsplit(self.path).path
+        if path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif path == '/ready':
+            ready = daemon.is_ready()
+            self._send(200 if ready else 503, {'ready': ready})
+        elif path == '/jobs':
+            with daemon._lock:
+                jobs = list(daemon.jobs.values())
+            self._send(200, [job.to_dict() for job in jobs])
+        elif path.startswith('/jobs/'):
+            job = daemon.get_job(urllib.parse.unquote(path[len('/jobs/'):]))
+            if job:
+                self._send(200, job.to_dict())
+            else:
+                self._send(404, {'error': 'Job not found.'})
+        else:
+            self._send(404, {'error': 'Endpoint not found.'})
+
+    def do_POST(self):
+        if urllib.parse.urlsplit(self.path).path != '/jobs':
+            self._send(404, {'error': 'Endpoint not found.'})
+            return
+
+        try:
+            spec = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'null')
+            job = self.server.daemon.submit(spec)
+        except ValueError as exception:
+            self._send(400, {'error': str(exception)})
+            return
+        except queue.Full:
+            self._send(503, {'error': 'The queue of jobs is full.'})
+            return
+
+        if spec.get('wait', False):
+            job.done.wait()
+            self._send(200, job.to_dict())
+        else:
+            self._send(202, job.to_dict())
+
+    def _send(self, code, body):
+        """ Send a JSON response
+
+        Args:
+            code (:obj:`int`): HTTP status code
+            body (:obj:`object`): JSON-serializable body
+        """
+        content = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super(DaemonRequestHandler, self).log_message(format, *args)
+
+
+class DaemonHTTPServer(ThreadingHTTPServer):
+    """ HTTP server for the API of a :obj:`SimulationDaemon` (:obj:`daemon`), which replaces the broken pools of
+    worker processes of the daemon from the thread which runs the server (:obj:`serve_forever`)
+
+    Attributes:
+        daemon (:obj:`SimulationDaemon`): daemon
+        quiet (:obj:`bool`): if :obj:`True`, don't log requests
+    """
+
+    def service_actions(self):
+        self.daemon.replace_broken_worker_pool()
+
+
+def serve(daemon, host='127.0.0.1', port=8000, quiet=False):
+    """ Create an HTTP server for a daemon
+
+    Args:
+        daemon (:obj:`SimulationDaemon`): daemon
+        host (:obj:`str`, optional): host to listen on
+        port (:obj:`int`, optional): port to listen on (``0`` selects an unused port)
+        quiet (:obj:`bool`, optional): if :obj:`True`, don't log requests
+
+    Returns:
+        :obj:`DaemonHTTPServer`: server
+    """
+    server = DaemonHTTPServer((host, port), DaemonRequestHandler)
+    server.daemon = daemon
+    server.quiet = quiet
+    return server
+
+
+def main(args=None):
+    """ Run a daemon configured by command-line arguments until it is interrupted
+
+    Args:
+        args (:obj:`list` of :obj:`str`, optional): command-line arguments (default: :obj:`sys.argv` after the ``daemon``
+            sub-command)
+
+    Returns:
+        :obj:`int`: exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog='biosimulators-opencor daemon',
+        description='Keep OpenCOR loaded and execute jobs submitted through a localhost HTTP API.')
+    parser.add_argument('--host', default='127.0.0.1', help='Host to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('-n', '--max-concurrent-jobs', type=int, default=1,
+                        help='Maximum number of jobs to execute simultaneously (default: 1)')
+    parser.add_argument('--max-queued-jobs', type=int, default=100,
+                        help='Maximum number of jobs waiting to be executed (default: 100)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Do not log requests')
+    args = parser.parse_args(sys.argv[2:] if args is None else args)
+
+    daemon = SimulationDaemon(max_concurrent_jobs=args.max_concurrent_jobs, max_queued_jobs=args.max_queued_jobs)
+    daemon.start()
+    server = serve(daemon, host=args.host, port=args.port, quiet=args.quiet)
+    print('Listening on http://{}:{}/'.format(*server.server_address[0:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.stop()
+    return 0
@@ -60,22 +60,27 @@ class KinsolLinearSolver(str, enum.Enum):
 KISAO_ALGORITHM_MAP = collections.OrderedDict([
     ('KISAO_0000019', {
         'kisao_id': 'KISAO_0000019',
+        'opencor_solver_type': 'ode',
+        'opencor_solver_name': 'CVODE',
         'name': 'CVODE',
         'parameters': {
             'KISAO_0000467': {
                 'id': 'MaximumStepId',
+                'opencor_id': 'MaximumStep',
                 'name': 'maximum step',
                 'type': ValueType.float,
                 'default': 0.,
             },
             'KISAO_0000415': {
                 'id': 'MaximumNumberOfStepsId',
+                'opencor_id': 'MaximumNumberOfSteps',
                 'name': 'maximum number of steps',
                 'type': ValueType.integer,
                 'default': 500,
             },
             'KISAO_0000475': {
                 'id': 'IntegrationMethodId',
+                'opencor_id': 'IntegrationMethod',
                 'name': 'integration method',
                 'type': ValueType.string,
                 'default': CvodeIntegrationMethod.KISAO_0000288.name,
@@ -83,6 +88,7 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
             },
             'KISAO_0000476': {
                 'id': 'IterationTypeId',
+                'opencor_id': 'IterationType',
                 'name': 'iteration type',
                 'type': ValueType.string,
                 'default': CvodeIterationType.KISAO_0000408.name,
@@ -90,6 +96,7 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
             },
             'KISAO_0000477': {
                 'id': 'LinearSolverId',
+                'opencor_id': 'LinearSolver',
                 'name': 'linear solver',
                 'type': ValueType.string,
                 'default': CvodeLinearSolver.KISAO_0000625.name,
@@ -97,6 +104,7 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
             },
             'KISAO_0000478': {
                 'id': 'PreconditionerId',
+                'opencor_id': 'Preconditioner',
                 'name': 'preconditioner',
                 'type': ValueType.string,
                 'default': CvodePreconditioner.KISAO_0000626.name,
@@ -104,30 +112,35 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
             },
             'KISAO_0000479': {
                 'id': 'UpperHalfBandwidthId',
+                'opencor_id': 'UpperHalfBandwidth',
                 'name': 'upper half-bandwith',
                 'type': ValueType.integer,
                 'default': 0,
             },
             'KISAO_0000480': {
                 'id': 'LowerHalfBandwidthId',
+                'opencor_id': 'LowerHalfBandwidth',
                 'name': 'lower half-bandwith',
                 'type': ValueType.integer,
                 'default': 0,
             },
             'KISAO_0000209': {
                 'id': 'RelativeToleranceId',
+                'opencor_id': 'RelativeTolerance',
                 'name': 'relative tolerance',
                 'type': ValueType.float,
                 'default': 1e-7,
             },
             'KISAO_0000211': {
                 'id': 'AbsoluteToleranceId',
+                'opencor_id': 'AbsoluteTolerance',
                 'name': 'absolute tolerance',
                 'type': ValueType.float,
                 'default': 1e-7,
             },
             'KISAO_0000481': {
                 'id': 'InterpolateSolutionId',
+                'opencor_id': 'InterpolateSolution',
                 'name': 'iterpolate solution',
                 'type': ValueType.boolean,
                 'default': True,
@@ -136,11 +149,14 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
     }),
     ('KISAO_0000030', {
         'kisao_id': 'KISAO_0000030',
+        'opencor_solver_type': 'ode',
+        'opencor_solver_name': 'Euler (forward)',
         'id': 'forward-euler',
         'name': 'Forward Euler method',
         'parameters': {
             'KISAO_0000483': {
                 'id': 'step',
+                'opencor_id': 'Step',
                 'name': 'step',
                 'type': ValueType.float,
                 'default': 1.,
@@ -149,11 +165,14 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
     }),
     ('KISAO_0000032', {
         'kisao_id': 'KISAO_0000032',
+        'opencor_solver_type': 'ode',
+        'opencor_solver_name': 'Runge-Kutta (4th order)',
         'id': 'rk4',
         'name': 'Explicit fourth-order Runge-Kutta method',
         'parameters': {
             'KISAO_0000483': {
                 'id': 'step',
+                'opencor_id': 'Step',
                 'name': 'step',
                 'type': ValueType.float,
                 'default': 1.,
@@ -162,11 +181,14 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
     }),
     ('KISAO_0000381', {
         'kisao_id': 'KISAO_0000381',
+        'opencor_solver_type': 'ode',
+        'opencor_solver_name': 'Runge-Kutta (2nd order)',
         'id': 'rk2',
         'name': 'Second-order Runge-Kutta method',
         'parameters': {
             'KISAO_0000483': {
                 'id': 'step',
+                'opencor_id': 'Step',
                 'name': 'step',
                 'type': ValueType.float,
                 'default': 1.,
@@ -175,11 +197,14 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
     }),
     ('KISAO_0000301', {
         'kisao_id': 'KISAO_0000301',
+        'opencor_solver_type': 'ode',
+        'opencor_solver_name': 'Heun',
         'id': 'heun',
         'name': 'Heun method',
         'parameters': {
             'KISAO_0000483': {
                 'id': 'step',
+                'opencor_id': 'Step',
                 'name': 'step',
                 'type': ValueType.float,
                 'default': 1.,
@@ -188,17 +213,21 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
     }),
     ('KISAO_0000282', {
         'kisao_id': 'KISAO_0000282',
+        'opencor_solver_type': 'nla',
+        'opencor_solver_name': 'KINSOL',
         'id': 'kinsol',
         'name': 'KINSOL',
         'parameters': {
             'KISAO_0000486': {
                 'id': 'MaximumNumberOfIterationsId',
+                'opencor_id': 'MaximumNumberOfIterations',
                 'name': 'maximum number of iterations',
                 'type': ValueType.integer,
                 'default': 200,
             },
             'KISAO_0000477': {
                 'id': 'LinearSolverId',
+                'opencor_id': 'LinearSolver',
                 'name': 'linear solver',
                 'type': ValueType.string,
                 'default': KinsolLinearSolver.KISAO_0000625.name,
@@ -206,12 +235,14 @@ KISAO_ALGORITHM_MAP = collections.OrderedDict([
             },
             'KISAO_0000479': {
                 'id': 'UpperHalfBandwidthId',
+                'opencor_id': 'UpperHalfBandwidth',
                 'name': 'upper half-bandwith',
                 'type': ValueType.integer,
                 'default': 0,
             },
             'KISAO_0000480': {
                 'id': 'LowerHalfBandwidthId',
+                'opencor_id': 'LowerHalfBandwidth',
                 'name': 'lower half-bandwith',
                 'type': ValueType.integer,
                 'default': 0,
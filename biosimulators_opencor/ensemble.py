@@ -0,0 +1,597 @@
+""" Execution of SED tasks for ensembles of values of the parameters of their models (e.g., for calibration and
+uncertainty quantification)
+
+The model of the task is compiled once, and the compiled simulation is executed for each set of values of the
+parameters, rather than executing the task for each set with :obj:`exec_sed_task`, which writes and compiles a
+modified copy of the model whenever changes can't be applied to a compiled simulation. Ensembles can be divided
+among the pool of OpenCOR worker processes, each of which compiles the model once and writes its results into a
+shared memory block.
+
+:obj:`CompiledTask` provides the compiled simulation of a task directly, for callers such as optimizers which
+determine each set of values from the results of the previous sets.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .cache import get_simulation_pool, get_results_index_cache
+from .config import get_simulator_config
+from .core import get_opencor_task, preprocess_sed_task
+from .model_index import get_cellml_model_index
+from .parallel import create_worker_pool, get_worker_pool, shutdown_worker_pool
+from .tracing import trace_span
+from .utils import (get_opencor_model_change_values, write_xml_model_with_changes, load_pooled_opencor_simulation,
+                    reset_opencor_simulation, set_opencor_simulation_values,
+                    run_opencor_simulation, estimate_opencor_simulation_size, get_opencor_results_index)
+from biosimulators_utils.config import get_config, Config  # noqa: F401
+from biosimulators_utils.sedml.data_model import Task, ModelAttributeChange, Variable  # noqa: F401
+from biosimulators_utils.utils.core import raise_errors_warnings
+from multiprocessing import shared_memory
+from unittest import mock
+import concurrent.futures
+import lxml.etree
+import math
+import numpy
+import os
+
+__all__ = [
+    'get_opencor_parameter_names',
+    'exec_sed_task_ensemble',
+    'CompiledTask',
+    'get_ensemble_chunks',
+    'exec_sed_task_ensemble_chunk_in_worker',
+]
+
+
+def get_opencor_parameter_names(targets, target_namespaces, model_etree, model_index=None):
+    """ Get the names that OpenCOR uses to reference the CellML variables which are the parameters of an ensemble
+
+    Args:
+        targets (:obj:`list` of :obj:`str`): XPaths to the variables (e.g.,
+            ``/cellml:model/cellml:component[@name='main']/cellml:variable[@name='sigma']``), optionally followed by
+            ``/@initial_value``
+        target_namespaces (:obj:`dict`): dictionary that maps the prefixes of the namespaces of the XPaths to their URIs
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for model
+        model_index (:obj:`CellmlModelIndex`, optional): index of the model (default: the cached index of
+            :obj:`model_etree`, see :obj:`get_cellml_model_index`)
+
+    Returns:
+        :obj:`list` of :obj:`str`: name that OpenCOR uses to reference each variable
+
+    Raises:
+        :obj:`ValueError`: if a target doesn't match a single CellML variable
+    """
+    if model_index is None:
+        model_index = get_cellml_model_index(model_etree)
+
+    names = []
+    invalid_targets = []
+    for target in targets:
+        obj_target, _, attrib_target = target.partition('/@')
+        try:
+            xml_objs = model_index.xpath(obj_target, namespaces=target_namespaces)
+        except lxml.etree.XPathError:
+            xml_objs = []
+
+        name = None
+        if (
+            attrib_target in ['', 'initial_value']
+            and len(xml_objs) == 1
+            and isinstance(xml_objs[0], lxml.etree._Element)
+            and isinstance(xml_objs[0].tag, str)
+            and xml_objs[0].tag.rpartition('}')[2] == 'variable'
+        ):
+            name = model_index.get_name(xml_objs[0])
+
+        if name is None:
+            invalid_targets.append(target)
+        else:
+            names.append(name)
+
+    if invalid_targets:
+        raise ValueError('The target of each parameter must be a single CellML variable. '
+                         'The following targets are not valid:\n  {}'.format('\n  '.join(invalid_targets)))
+
+    return names
+
+
+def exec_sed_task_ensemble(task, variables, parameter_targets, parameter_values, target_namespaces=None,
+                           preprocessed_task=None, config=None, simulator_config=None, num_workers=None, chunk_size=None,
+                           out=None):
+    """ Execute a SED task for each of a set of values of the constants or initial values of the states of its model
+
+    When more than one worker is requested, the parameter sets are divided into chunks, which are executed by the pool
+    of OpenCOR worker processes (see :obj:`biosimulators_opencor.parallel.get_worker_pool`). Each worker compiles the
+    model once, and writes the results of its chunks directly into a shared memory block rather than returning them
+    to this process. When a worker crashes, the chunks which the workers were executing are executed again, each on its
+    own in a new pool with a single worker, so that only the chunk which caused the crash is retried, up to
+    :obj:`SimulatorConfig.ENSEMBLE_MAX_RETRIES` times. The chunks which the workers hadn't started are resubmitted to
+    the pool without counting as retries.
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        parameter_targets (:obj:`list` of :obj:`str`): XPaths to the CellML variables whose values are varied (see
+            :obj:`get_opencor_parameter_names`)
+        parameter_values (:obj:`numpy.ndarray`): matrix (number of parameter sets x number of parameters) of the
+            values of the parameters
+        target_namespaces (:obj:`dict`, optional): dictionary that maps the prefixes of the namespaces of
+            :obj:`parameter_targets` to their URIs (default: the namespaces of the targets of the first variable)
+        preprocessed_task (:obj:`dict`, optional): preprocessed information about the task, including possible
+            model changes and variables. This can be used to avoid repeatedly executing the same initialization
+            for repeated calls to this method.
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+        num_workers (:obj:`int`, optional): number of worker processes (default: :obj:`SimulatorConfig.NUM_WORKERS`;
+            ``1`` executes the parameter sets in the current process)
+        chunk_size (:obj:`int`, optional): number of parameter sets of each chunk which is submitted to the worker
+            processes (default: :obj:`SimulatorConfig.ENSEMBLE_CHUNK_SIZE`, see :obj:`get_ensemble_chunks`)
+        out (:obj:`numpy.ndarray`, optional): array to save the results to
+
+    Returns:
+        :obj:`numpy.ndarray`: results (number of parameter sets x number of variables x number of time points), in
+            the order of :obj:`variables`
+
+    Raises:
+        :obj:`ValueError`: if the task, its variables, or its parameters are not valid
+        :obj:`RuntimeError`: if OpenCOR fails to execute the simulation for a set of values, or a chunk of parameter
+            sets couldn't be executed because its worker processes repeatedly crashed
+    """
+    if not config:
+        config = get_config()
+    if not simulator_config:
+        simulator_config = get_simulator_config()
+    if num_workers is None:
+        num_workers = simulator_config.NUM_WORKERS
+    if chunk_size is None:
+        chunk_size = simulator_config.ENSEMBLE_CHUNK_SIZE
+
+    parameter_values = numpy.asarray(parameter_values, dtype=numpy.float64)
+    if parameter_values.ndim != 2 or parameter_values.shape[1] != len(parameter_targets):
+        raise ValueError('The values of the parameters must be a matrix with one column for each of the {} parameters.'.format(
+            len(parameter_targets)))
+
+    shape = (parameter_values.shape[0], len(variables), task.simulation.number_of_steps + 1)
+    if out is None:
+        out = numpy.empty(shape)
+    elif out.shape != shape:
+        raise ValueError('The shape of the array for the results must be {}, not {}.'.format(shape, out.shape))
+
+    if target_namespaces is None:
+        target_namespaces = variables[0].target_namespaces if variables else {}
+
+    if preprocessed_task is None:
+        preprocessed_task = preprocess_sed_task(task, variables, config=config)
+
+    # validate the parameters before the ensemble is divided among the worker processes
+    parameter_names = get_opencor_parameter_names(parameter_targets, target_namespaces, preprocessed_task['model_etree'],
+                                                  model_index=preprocessed_task['model_index'])
+
+    with trace_span('exec_sed_task_ensemble', task=task.id, numParameterSets=parameter_values.shape[0],
+                    numParameters=len(parameter_names), numVariables=len(variables),
+                    modelHash=preprocessed_task.get('model_hash', None), numWorkers=num_workers):
+        if num_workers > 1 and parameter_values.shape[0] > 1:
+            _exec_sed_task_ensemble_in_worker_pool(task, variables, parameter_targets, parameter_values, target_namespaces,
+                                                   out, num_workers, chunk_size, config, simulator_config)
+        else:
+            with CompiledTask(task, variables, parameter_targets, target_namespaces=target_namespaces,
+                              preprocessed_task=preprocessed_task, config=config,
+                              simulator_config=simulator_config) as compiled_task:
+                for i_set, values in enumerate(parameter_values):
+                    try:
+                        compiled_task.simulate(values, out=out[i_set])
+                    except RuntimeError:
+                        raise RuntimeError('OpenCOR failed to execute the simulation for parameter set {}.'.format(i_set))
+
+    return out
+
+
+class CompiledTask(object):
+    """ Compiled simulation of a SED task which can be executed repeatedly for different values of the parameters of its
+    model (e.g., by optimizers for parameter estimation)
+
+    The task is validated, its model is compiled, and its parameters and variables are resolved to the constants,
+    states, and results of the OpenCOR simulation once. Each call of :obj:`simulate` only resets the simulation, sets
+    the values of the parameters, recomputes the computed constants and algebraic variables of the simulation from
+    them, executes the simulation, and copies the trajectories of the variables into an array. Parameters which
+    define the initial values of other variables can't be varied, because OpenCOR doesn't recompute initial values.
+    The compiled simulation is removed from the pool of simulations until the compiled task is closed.
+
+    Attributes:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that are recorded
+        parameter_names (:obj:`list` of :obj:`str`): names that OpenCOR uses to reference the parameters
+        num_points (:obj:`int`): number of time points of the results
+    """
+
+    def __init__(self, task, variables, parameter_targets, target_namespaces=None, preprocessed_task=None, config=None,
+                 simulator_config=None):
+        """
+        Args:
+            task (:obj:`Task`): task
+            variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+            parameter_targets (:obj:`list` of :obj:`str`): XPaths to the CellML variables whose values are varied (see
+                :obj:`get_opencor_parameter_names`)
+            target_namespaces (:obj:`dict`, optional): dictionary that maps the prefixes of the namespaces of
+                :obj:`parameter_targets` to their URIs (default: the namespaces of the targets of the first variable)
+            preprocessed_task (:obj:`dict`, optional): preprocessed information about the task
+                (see :obj:`preprocess_sed_task`)
+            config (:obj:`Config`, optional): BioSimulators common configuration
+            simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+
+        Raises:
+            :obj:`ValueError`: if the task, its variables, or its parameters are not valid
+        """
+        if not config:
+            config = get_config()
+        if not simulator_config:
+            simulator_config = get_simulator_config()
+        if target_namespaces is None:
+            target_namespaces = variables[0].target_namespaces if variables else {}
+        if preprocessed_task is None:
+            preprocessed_task = preprocess_sed_task(task, variables, config=config)
+
+        self.task = task
+        self.variables = variables
+        self.parameter_names = get_opencor_parameter_names(parameter_targets, target_namespaces,
+                                                           preprocessed_task['model_etree'],
+                                                           model_index=preprocessed_task['model_index'])
+        self.num_points = task.simulation.number_of_steps + 1
+
+        # OpenCOR doesn't recompute the initial values of variables when the values of the variables which define them
+        # change, so these variables can't be varied
+        invalid_names = [name for name in self.parameter_names if name in preprocessed_task['model_index'].initial_value_names]
+        if invalid_names:
+            raise ValueError(('The parameters must not define the initial values of other variables of the model. '
+                              'The following parameters define initial values:\n  {}').format('\n  '.join(invalid_names)))
+
+        self._simulation_pool = get_simulation_pool(simulator_config)
+        self._opencor_task = get_opencor_task(task, preprocessed_task, simulator_config=simulator_config)
+        self._opencor_sim, self._simulation_pool_key, self._model_change_values = _load_ensemble_simulation(
+            task, self._opencor_task, variables, preprocessed_task, simulator_config)
+
+        # the simulation stays checked out of the pool until the task is closed, so that other tasks don't reset it
+
+        opencor_states = self._opencor_sim.data().states()
+        opencor_constants = self._opencor_sim.data().constants()
+        invalid_names = [name for name in self.parameter_names if name not in opencor_states and name not in opencor_constants]
+        if invalid_names:
+            self.close()
+            raise ValueError(('The parameters must be constants or the initial values of states of the model. '
+                              'The following parameters are computed:\n  {}').format('\n  '.join(invalid_names)))
+        self._parameter_slots = [(name in opencor_states, name) for name in self.parameter_names]
+
+        # the groups of the results of the variables are resolved once the simulation has been executed
+        self._variable_names = [preprocessed_task['variable_names'][variable.id] for variable in variables]
+        self._output_slots = None
+        self._executed = False
+
+    def simulate(self, parameter_values, out=None):
+        """ Execute the simulation for values of the parameters
+
+        Args:
+            parameter_values (:obj:`numpy.ndarray`): values of the parameters, in the order of :obj:`parameter_names`
+            out (:obj:`numpy.ndarray`, optional): array (number of variables x number of time points) to save the
+                results to
+
+        Returns:
+            :obj:`numpy.ndarray`: results (number of variables x number of time points), in the order of
+                :obj:`variables`
+
+        Raises:
+            :obj:`ValueError`: if the number of values doesn't match the number of parameters
+            :obj:`RuntimeError`: if OpenCOR fails to execute the simulation, or the compiled task has been closed
+        """
+        opencor_sim = self._opencor_sim
+        if opencor_sim is None:
+            raise RuntimeError('The compiled task has been closed.')
+        if len(parameter_values) != len(self._parameter_slots):
+            raise ValueError('{} values are required for the parameters, not {}.'.format(
+                len(self._parameter_slots), len(parameter_values)))
+        if out is None:
+            out = numpy.empty((len(self.variables), self.num_points))
+
+        # restore the initial values of the simulation, and apply the changes to the model and the values of the
+        # parameters
+        if self._executed:
+            reset_opencor_simulation(opencor_sim)
+            set_opencor_simulation_values(opencor_sim, self._model_change_values)
+
+        opencor_data = opencor_sim.data()
+        opencor_states = opencor_data.states()
+        opencor_constants = opencor_data.constants()
+        for (is_state, name), value in zip(self._parameter_slots, parameter_values):
+            if is_state:
+                opencor_states[name] = value
+            else:
+                opencor_constants[name] = value
+
+        # configure the time course of the simulation, recompute its computed constants and algebraic variables from the
+        # values of the parameters, and execute it
+        self._executed = True
+        if not run_opencor_simulation(opencor_sim, self._opencor_task.simulation):
+            self._discard()
+            raise RuntimeError('OpenCOR failed unexpectedly.')
+
+        # copy the trajectories of the variables
+        if self._output_slots is None:
+            self._output_slots = self._get_output_slots()
+
+        opencor_results = opencor_sim.results()
+        opencor_groups = {}
+        for i_variable, (group, name) in enumerate(self._output_slots):
+            if group == 'voi':
+                values = opencor_results.voi().values()
+            else:
+                if group not in opencor_groups:
+                    opencor_groups[group] = getattr(opencor_results, group)()
+                values = opencor_groups[group][name].values()
+            out[i_variable, :] = values[-self.num_points:]
+
+        return out
+
+    def _get_output_slots(self):
+        """ Get the group of the results of the simulation which contains the trajectory of each variable
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of :obj:`str`: group and name of each variable
+
+        Raises:
+            :obj:`ValueError`: if a variable isn't an observable of the simulation
+        """
+        results_index_cache = get_results_index_cache()
+        results_index = results_index_cache.get(self._simulation_pool_key)
+        if results_index is None:
+            results_index = get_opencor_results_index(self._opencor_sim)
+            # estimate ~100 bytes for the name and dictionary entry of each variable
+            results_index_cache.set(self._simulation_pool_key, results_index, size=100 * len(results_index))
+
+        invalid_variables = [
+            '{}: {}'.format(variable.id, variable.target)
+            for variable, name in zip(self.variables, self._variable_names)
+            if name not in results_index
+        ]
+        if invalid_variables:
+            msg = (
+                'The target of each variable must be a valid observable. '
+                'The targets of the following variables are not valid observables.\n  {}'
+            ).format('\n  '.join(invalid_variables))
+            raise ValueError(msg)
+
+        return [(results_index[name], name) for name in self._variable_names]
+
+    def _discard(self):
+        """ Close the simulation without returning it to the pool of simulations """
+        if self._opencor_sim is not None:
+            self._simulation_pool.on_evict(self._simulation_pool_key, self._opencor_sim)
+            self._opencor_sim = None
+
+    def close(self):
+        """ Return the compiled simulation to the pool of simulations for reuse by subsequent tasks """
+        if self._opencor_sim is not None:
+            reset_opencor_simulation(self._opencor_sim)
+            self._simulation_pool.set(self._simulation_pool_key, self._opencor_sim,
+                                      size=estimate_opencor_simulation_size(self._opencor_sim, self._opencor_task.simulation))
+            self._opencor_sim = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def get_ensemble_chunks(num_parameter_sets, num_workers, chunk_size=0):
+    """ Divide the parameter sets of an ensemble into chunks for a pool of worker processes
+
+    Args:
+        num_parameter_sets (:obj:`int`): number of parameter sets
+        num_workers (:obj:`int`): number of worker processes
+        chunk_size (:obj:`int`, optional): number of parameter sets of each chunk (``0`` divides the parameter sets
+            into about four chunks per worker, which balances the load of the workers when the durations of the
+            simulations vary)
+
+    Returns:
+        :obj:`list` of :obj:`tuple` of :obj:`int`: index of the first parameter set of each chunk and the index after
+            its last parameter set
+    """
+    if chunk_size <= 0:
+        chunk_size = int(math.ceil(num_parameter_sets / (4 * max(num_workers, 1))))
+    chunk_size = max(chunk_size, 1)
+    return [(start, min(start + chunk_size, num_parameter_sets)) for start in range(0, num_parameter_sets, chunk_size)]
+
+
+def _exec_sed_task_ensemble_in_worker_pool(task, variables, parameter_targets, parameter_values, target_namespaces, out,
+                                           num_workers, chunk_size, config, simulator_config):
+    """ Execute a SED task for each of a set of values of its parameters with a pool of worker processes
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        parameter_targets (:obj:`list` of :obj:`str`): XPaths to the CellML variables whose values are varied
+        parameter_values (:obj:`numpy.ndarray`): matrix (number of parameter sets x number of parameters) of the
+            values of the parameters
+        target_namespaces (:obj:`dict`): dictionary that maps the prefixes of the namespaces of
+            :obj:`parameter_targets` to their URIs
+        out (:obj:`numpy.ndarray`): array to save the results to
+        num_workers (:obj:`int`): number of worker processes
+        chunk_size (:obj:`int`): number of parameter sets of each chunk (see :obj:`get_ensemble_chunks`)
+        config (:obj:`Config`): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`): OpenCOR configuration
+
+    Raises:
+        :obj:`RuntimeError`: if a chunk couldn't be executed because its worker processes repeatedly crashed
+    """
+    chunks = get_ensemble_chunks(parameter_values.shape[0], num_workers, chunk_size)
+    pending_chunks = list(range(len(chunks)))
+
+    def submit_chunk(worker_pool, i_chunk):
+        start, end = chunks[i_chunk]
+        return worker_pool.submit(exec_sed_task_ensemble_chunk_in_worker, task, variables, parameter_targets,
+                                  parameter_values[start:end], target_namespaces, results_memory.name, out.shape, start,
+                                  config, simulator_config, started_memory_name=started_memory.name, i_chunk=i_chunk)
+
+    results_memory = shared_memory.SharedMemory(create=True, size=max(out.nbytes, 1))
+    # flags which the workers set when they start to execute each chunk
+    started_memory = shared_memory.SharedMemory(create=True, size=len(chunks))
+    try:
+        started_memory.buf[:len(chunks)] = bytes(len(chunks))
+
+        while pending_chunks:
+            worker_pool = get_worker_pool(num_workers)
+            futures = {submit_chunk(worker_pool, i_chunk): i_chunk for i_chunk in pending_chunks}
+
+            crashed_chunks = []
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except concurrent.futures.process.BrokenProcessPool:
+                        crashed_chunks.append(futures[future])
+            finally:
+                for future in futures:
+                    future.cancel()
+
+            # replace the pool, whose workers were terminated when one of them crashed, and resubmit the chunks which
+            # the workers hadn't started
+            if crashed_chunks:
+                shutdown_worker_pool()
+            started_chunks = sorted(i_chunk for i_chunk in crashed_chunks if started_memory.buf[i_chunk])
+            pending_chunks = sorted(i_chunk for i_chunk in crashed_chunks if not started_memory.buf[i_chunk])
+            if pending_chunks and not started_chunks:
+                started_chunks = pending_chunks
+                pending_chunks = []
+
+            # execute each chunk which was being executed when a worker crashed on its own, so that only the chunk which
+            # caused the crash is retried
+            for i_chunk in started_chunks:
+                num_crashes = 1
+                while True:
+                    with create_worker_pool(1) as isolated_worker_pool:
+                        try:
+                            submit_chunk(isolated_worker_pool, i_chunk).result()
+                            break
+                        except concurrent.futures.process.BrokenProcessPool:
+                            num_crashes += 1
+                    if num_crashes > simulator_config.ENSEMBLE_MAX_RETRIES:
+                        raise RuntimeError(('Parameter sets {} to {} could not be executed because worker processes crashed {} times '
+                                            'while executing them.').format(chunks[i_chunk][0], chunks[i_chunk][1] - 1, num_crashes))
+
+        results = numpy.ndarray(out.shape, dtype=numpy.float64, buffer=results_memory.buf)
+        out[...] = results
+        del results
+
+    finally:
+        results_memory.close()
+        results_memory.unlink()
+        started_memory.close()
+        started_memory.unlink()
+
+
+def exec_sed_task_ensemble_chunk_in_worker(task, variables, parameter_targets, parameter_values, target_namespaces,
+                                           shared_memory_name, shape, start, config=None, simulator_config=None,
+                                           started_memory_name=None, i_chunk=None):
+    """ Execute a chunk of the parameter sets of an ensemble in a worker process, and write its results to the shared
+    memory block of the results of the ensemble
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        parameter_targets (:obj:`list` of :obj:`str`): XPaths to the CellML variables whose values are varied
+        parameter_values (:obj:`numpy.ndarray`): matrix (number of parameter sets of the chunk x number of parameters)
+            of the values of the parameters
+        target_namespaces (:obj:`dict`): dictionary that maps the prefixes of the namespaces of
+            :obj:`parameter_targets` to their URIs
+        shared_memory_name (:obj:`str`): name of the shared memory block of the results of the ensemble
+        shape (:obj:`tuple` of :obj:`int`): shape of the results of the ensemble
+        start (:obj:`int`): index of the first parameter set of the chunk within the ensemble
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+        started_memory_name (:obj:`str`, optional): name of the shared memory block of the flags which indicate which
+            chunks the workers have started to execute
+        i_chunk (:obj:`int`, optional): index of the flag of the chunk within :obj:`started_memory_name`
+    """
+    if started_memory_name is not None:
+        started_memory = _attach_shared_memory(started_memory_name)
+        started_memory.buf[i_chunk] = 1
+        started_memory.close()
+
+    results_memory = _attach_shared_memory(shared_memory_name)
+    results = numpy.ndarray(shape, dtype=numpy.float64, buffer=results_memory.buf)
+    try:
+        exec_sed_task_ensemble(task, variables, parameter_targets, parameter_values, target_namespaces=target_namespaces,
+                               config=config, simulator_config=simulator_config, num_workers=1,
+                               out=results[start:start + parameter_values.shape[0]])
+    finally:
+        del results
+        try:
+            results_memory.close()
+        except BufferError:  # pragma: no cover: the traceback of an exception still references the results
+            pass
+
+
+def _attach_shared_memory(name):
+    """ Attach to a shared memory block which another process owns
+
+    Args:
+        name (:obj:`str`): name of the block
+
+    Returns:
+        :obj:`multiprocessing.shared_memory.SharedMemory`: block
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # pragma: no cover: Python < 3.13 always registers blocks with the resource tracker
+        # don't register the block, otherwise the resource tracker of the worker would unlink it when the worker exits
+        with mock.patch('multiprocessing.resource_tracker.register'):
+            return shared_memory.SharedMemory(name=name)
+
+
+def _load_ensemble_simulation(task, opencor_task, variables, preprocessed_task, simulator_config):
+    """ Get a compiled OpenCOR simulation of the model of a task, including the changes to the model
+
+    Args:
+        task (:obj:`Task`): task
+        opencor_task (:obj:`Task`): task for OpenCOR (see :obj:`get_opencor_task`)
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        preprocessed_task (:obj:`dict`): preprocessed information about the task
+        simulator_config (:obj:`SimulatorConfig`): OpenCOR configuration
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`PythonQt.private.SimulationSupport.Simulation`: OpenCOR simulation
+            * :obj:`str`: key of the simulation in the pool of simulations
+            * :obj:`dict`: values of the changes to the model which must be applied to the simulation before each
+              execution
+    """
+    simulation_pool = get_simulation_pool(simulator_config)
+
+    # if possible, apply the changes to the model to a compiled simulation of the unmodified model
+    if task.model.changes:
+        from biosimulators_utils.sedml import validation
+        raise_errors_warnings(validation.validate_model_change_types(task.model.changes, (ModelAttributeChange,)),
+                              error_summary='Changes for model `{}` are not supported.'.format(task.model.id))
+        model_change_values = get_opencor_model_change_values(task.model.changes, preprocessed_task['model_etree'],
+                                                              model_index=preprocessed_task['model_index'])
+    else:
+        model_change_values = {}
+
+    if model_change_values is not None:
+        opencor_sim, simulation_pool_key, _ = load_pooled_opencor_simulation(opencor_task, variables, simulation_pool)
+        if set_opencor_simulation_values(opencor_sim, model_change_values):
+            return opencor_sim, simulation_pool_key, model_change_values
+
+        simulation_pool.set(simulation_pool_key, opencor_sim,
+                            size=estimate_opencor_simulation_size(opencor_sim, opencor_task.simulation))
+
+    # otherwise, apply the changes to a copy of the model file and compile the modified model
+    opencor_task.model.source = write_xml_model_with_changes(task.model, preprocessed_task['model_etree'])
+    try:
+        opencor_sim, simulation_pool_key, _ = load_pooled_opencor_simulation(opencor_task, variables, simulation_pool)
+    finally:
+        # clean up temporary model
+        os.remove(opencor_task.model.source)
+    return opencor_sim, simulation_pool_key, {}
@@ -0,0 +1,263 @@
+""" Measurement of the wall time, CPU time and memory of the phases of the execution of SED tasks, and summaries of
+the measurements and of the settings of the solvers of the tasks of archives
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .tracing import trace_span
+import contextlib
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover: resource is not available on Windows
+    resource = None
+
+__all__ = [
+    'PHASES_SUMMARY_FILENAME',
+    'get_rss',
+    'get_peak_rss',
+    'PhaseTimer',
+    'summarize_task_phases',
+    'write_task_phases_summary',
+    'SOLVER_SETTINGS_SUMMARY_FILENAME',
+    'summarize_solver_settings',
+    'write_solver_settings_summary',
+]
+
+PHASES_SUMMARY_FILENAME = 'opencor-phases.json'
+# :obj:`str`: name of the file in the output directory of an archive to which the summary of the phases of its tasks is saved
+
+SOLVER_SETTINGS_SUMMARY_FILENAME = 'opencor-solver-settings.json'
+# :obj:`str`: name of the file in the output directory of an archive to which the summary of the settings of the solvers
+# of its tasks is saved
+
+
+def get_rss():
+    """ Get the current resident set size of the current process (from ``/proc/self/statm``)
+
+    Returns:
+        :obj:`int`: resident set size in bytes, or :obj:`None` if the platform doesn't report it
+    """
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            resident_pages = int(file.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):  # pragma: no cover: /proc is only available on Linux
+        return None
+
+
+def get_peak_rss():
+    """ Get the peak resident set size of the current process over its lifetime
+
+    Returns:
+        :obj:`int`: peak resident set size in bytes, or :obj:`None` if the platform doesn't report it
+    """
+    if resource is None:
+        return None  # pragma: no cover
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss  # pragma: no cover
+    return peak_rss * 1024
+
+
+class PhaseTimer(object):
+    """ Timer which measures the wall time, CPU time and change of the resident set size of each phase of the
+    execution of a task
+
+    Phases which are measured repeatedly (e.g., the integration of each segment of a streamed simulation) are
+    accumulated. When tracing is enabled, a span is also recorded for each measurement (see
+    :obj:`biosimulators_opencor.tracing`).
+
+    Attributes:
+        phases (:obj:`dict`): dictionary which maps the name of each phase to its number of measurements (``count``),
+            its wall and CPU times in seconds (``wallTime``, ``cpuTime``), the change of the resident set size of the
+            process in bytes from the start to the end of the phase (``rssDelta``, see :obj:`get_rss`), and the peak
+            resident set size of the process over its lifetime in bytes at the end of the phase (``processPeakRss``,
+            see :obj:`get_peak_rss`), which isn't specific to the phase
+    """
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def measure(self, phase):
+        """ Measure a phase
+
+        Args:
+            phase (:obj:`str`): name of the phase
+        """
+        start_rss = get_rss()
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            with trace_span(phase):
+                yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+            end_rss = get_rss()
+
+            stats = self.phases.get(phase, None)
+            if stats is None:
+                stats = self.phases[phase] = {'count': 0, 'wallTime': 0., 'cpuTime': 0., 'rssDelta': None,
+                                              'processPeakRss': None}
+            stats['count'] += 1
+            stats['wallTime'] += wall_time
+            stats['cpuTime'] += cpu_time
+            if start_rss is not None and end_rss is not None:
+                stats['rssDelta'] = (stats['rssDelta'] or 0) + end_rss - start_rss
+            stats['processPeakRss'] = get_peak_rss()
+
+    def to_dict(self):
+        """ Get the measurements of the phases
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each phase to its measurements
+        """
+        return {phase: dict(stats) for phase, stats in self.phases.items()}
+
+
+def summarize_task_phases(log):
+    """ Aggregate the measurements of the phases of the tasks of an archive (see :obj:`PhaseTimer`)
+
+    Args:
+        log (:obj:`CombineArchiveLog`): log of the archive
+
+    Returns:
+        :obj:`dict`: number of tasks which reported measurements, and for each phase, its total number of
+            measurements, total wall and CPU times, the maximum change of the resident set size of a task
+            (``maxRssDelta``), and the maximum peak resident set size of the processes (``processPeakRss``)
+    """
+    num_tasks = 0
+    phases = {}
+    for task_phases in _get_simulator_details(log, 'phases'):
+        num_tasks += 1
+        for phase, task_stats in task_phases.items():
+            stats = phases.get(phase, None)
+            if stats is None:
+                stats = phases[phase] = {'count': 0, 'wallTime': 0., 'cpuTime': 0., 'maxRssDelta': None,
+                                         'processPeakRss': None}
+            stats['count'] += task_stats['count']
+            stats['wallTime'] += task_stats['wallTime']
+            stats['cpuTime'] += task_stats['cpuTime']
+            rss_delta = task_stats.get('rssDelta', None)
+            if rss_delta is not None and (stats['maxRssDelta'] is None or rss_delta > stats['maxRssDelta']):
+                stats['maxRssDelta'] = rss_delta
+            if task_stats.get('processPeakRss', None) is not None:
+                stats['processPeakRss'] = max(stats['processPeakRss'] or 0, task_stats['processPeakRss'])
+
+    return {
+        'numTasks': num_tasks,
+        'wallTime': sum(stats['wallTime'] for stats in phases.values()),
+        'cpuTime': sum(stats['cpuTime'] for stats in phases.values()),
+        'phases': phases,
+    }
+
+
+def write_task_phases_summary(log, out_dir):
+    """ Save a summary of the measurements of the phases of the tasks of an archive to its output directory
+    (``{ out_dir }/opencor-phases.json``)
+
+    Args:
+        log (:obj:`CombineArchiveLog`): log of the archive
+        out_dir (:obj:`str`): directory where the outputs of the archive were saved
+
+    Returns:
+        :obj:`str`: path to the summary
+    """
+    filename = os.path.join(out_dir, PHASES_SUMMARY_FILENAME)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    with open(filename, 'w') as file:
+        json.dump(summarize_task_phases(log), file, indent=2)
+    return filename
+
+
+def summarize_solver_settings(log):
+    """ Aggregate the settings of the solvers of the tasks of an archive
+    (see :obj:`biosimulators_opencor.utils.get_opencor_solver_settings`)
+
+    The Python binding of OpenCOR doesn't expose the counters of its solvers (e.g., the numbers of steps and of
+    evaluations of the right-hand sides and Jacobians of models), so the summary reports the configured solvers,
+    and the measured wall times of their executions.
+
+    Args:
+        log (:obj:`CombineArchiveLog`): log of the archive
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each solver to the number of tasks which it executed, the names
+            of the linear solvers which the tasks configured, and the total and maximum measured wall times of the
+            ``run`` phases of the tasks (see :obj:`PhaseTimer`)
+    """
+    solvers = {}
+    for details in _get_simulator_details(log):
+        task_settings = details.get('solverSettings', None)
+        if not task_settings:
+            continue
+
+        stats = solvers.get(task_settings['solver'], None)
+        if stats is None:
+            stats = solvers[task_settings['solver']] = {
+                'numTasks': 0, 'configuredLinearSolvers': [], 'runTime': 0., 'maxRunTime': 0.}
+
+        stats['numTasks'] += 1
+        linear_solver = task_settings.get('configuredLinearSolver', None)
+        if linear_solver is not None and linear_solver not in stats['configuredLinearSolvers']:
+            stats['configuredLinearSolvers'].append(linear_solver)
+
+        run_stats = (details.get('phases', None) or {}).get('run', None)
+        if run_stats:
+            stats['runTime'] += run_stats['wallTime']
+            stats['maxRunTime'] = max(stats['maxRunTime'], run_stats['wallTime'])
+
+    return solvers
+
+
+def write_solver_settings_summary(log, out_dir):
+    """ Save a summary of the settings of the solvers of the tasks of an archive to its output directory
+    (``{ out_dir }/opencor-solver-settings.json``)
+
+    Args:
+        log (:obj:`CombineArchiveLog`): log of the archive
+        out_dir (:obj:`str`): directory where the outputs of the archive were saved
+
+    Returns:
+        :obj:`str`: path to the summary
+    """
+    filename = os.path.join(out_dir, SOLVER_SETTINGS_SUMMARY_FILENAME)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    with open(filename, 'w') as file:
+        json.dump(summarize_solver_settings(log), file, indent=2)
+    return filename
+
+
+def _get_simulator_details(log, key=None):
+    """ Get the simulator details, or an attribute of the simulator details, of each task of an archive
+
+    Args:
+        log (:obj:`CombineArchiveLog`): log of the archive
+        key (:obj:`str`, optional): attribute of the simulator details (e.g., ``phases``)
+
+    Returns:
+        :obj:`list`: simulator details, or values of the attribute, for the tasks which logged them
+    """
+    values = []
+    for doc_log in (log.sed_documents or {}).values():
+        if doc_log is None:
+            continue
+        for task_log in (doc_log.tasks or {}).values():
+            value = (task_log.simulator_details or {}) if task_log else {}
+            if key is not None:
+                value = value.get(key, None)
+            if value:
+                values.append(value)
+    return values
@@ -0,0 +1,163 @@
+""" Index of the elements of CellML models and of the XPath targets of SED variables and model changes
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .cache import get_model_index_cache
+import functools
+import lxml.etree
+
+__all__ = [
+    'get_compiled_xpath',
+    'CellmlModelIndex',
+    'get_cellml_model_index',
+]
+
+CELLML_NAMESPACE_PREFIX = 'http://www.cellml.org/cellml/'
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_xpath(expression, namespaces):
+    return lxml.etree.XPath(expression, namespaces=dict(namespaces))
+
+
+def get_compiled_xpath(expression, namespaces=None):
+    """ Get a compiled XPath expression, compiling each combination of an expression and namespaces once per process
+
+    Args:
+        expression (:obj:`str`): XPath expression
+        namespaces (:obj:`dict`, optional): dictionary that maps the prefixes of namespaces to their URIs; the
+            default namespace (prefix :obj:`None`) is ignored
+
+    Returns:
+        :obj:`lxml.etree.XPath`: compiled XPath expression
+
+    Raises:
+        :obj:`lxml.etree.XPathSyntaxError`: if the expression is invalid
+    """
+    namespaces = tuple(sorted((prefix, uri) for prefix, uri in (namespaces or {}).items() if prefix is not None))
+    return _compile_xpath(expression, namespaces)
+
+
+class CellmlModelIndex(object):
+    """ Index of a parsed CellML model, which maps its elements to the names that OpenCOR uses to refer to them, and
+    XPath expressions to the elements which they select
+
+    The index assumes that the model is not modified after the index is created.
+
+    Attributes:
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for the model
+        names (:obj:`dict`): dictionary that maps each variable of the model (:obj:`lxml.etree._Element`) to the name
+            that OpenCOR uses to refer to it (e.g., ``component/variable``)
+        has_variable_initial_values (:obj:`bool`): whether the initial value of at least one variable of the model is
+            defined by another variable rather than a number
+        initial_value_names (:obj:`set` of :obj:`str`): names of the variables which define the initial values of
+            other variables
+        _xpath_results (:obj:`dict`): dictionary that maps pairs of XPath expressions and namespaces to the elements
+            which they select
+    """
+
+    def __init__(self, model_etree):
+        """
+        Args:
+            model_etree (:obj:`lxml.etree._ElementTree`): element tree for the model
+        """
+        self.model_etree = model_etree
+        self.names = {}
+        self.has_variable_initial_values = False
+        self.initial_value_names = set()
+        self._xpath_results = {}
+
+        root = model_etree.getroot()
+        if isinstance(root.tag, str) and root.tag.startswith('{' + CELLML_NAMESPACE_PREFIX):
+            for component in root:
+                component_name = component.attrib.get('name', None) if isinstance(component.tag, str) else None
+                if not component_name or not component.tag.startswith('{' + CELLML_NAMESPACE_PREFIX):
+                    continue
+                for variable in component:
+                    variable_name = variable.attrib.get('name', None) if isinstance(variable.tag, str) else None
+                    if variable_name:
+                        self.names[variable] = component_name + '/' + variable_name
+                        initial_value = variable.attrib.get('initial_value', '0')
+                        if not _is_number(initial_value):
+                            self.has_variable_initial_values = True
+                            self.initial_value_names.add(component_name + '/' + initial_value)
+
+    def xpath(self, expression, namespaces=None):
+        """ Get the elements of the model selected by an XPath expression
+
+        Args:
+            expression (:obj:`str`): XPath expression
+            namespaces (:obj:`dict`, optional): dictionary that maps the prefixes of namespaces to their URIs
+
+        Returns:
+            :obj:`list`: selected elements
+
+        Raises:
+            :obj:`lxml.etree.XPathError`: if the expression is invalid
+        """
+        key = (expression, tuple(sorted((prefix, uri) for prefix, uri in (namespaces or {}).items() if prefix is not None)))
+        results = self._xpath_results.get(key, None)
+        if results is None:
+            results = self._xpath_results[key] = get_compiled_xpath(expression, namespaces)(self.model_etree)
+        return results
+
+    def get_name(self, xml_obj):
+        """ Get the name that OpenCOR uses to refer to an element of the model (e.g., ``component/variable``)
+
+        Args:
+            xml_obj (:obj:`lxml.etree._Element`): element of the model
+
+        Returns:
+            :obj:`str`: name that OpenCOR uses to refer to the element, or :obj:`None` if the element is not
+                a named descendant of a CellML model
+        """
+        name = self.names.get(xml_obj, None)
+        if name is None:
+            from .utils import get_opencor_name
+            name = get_opencor_name(xml_obj)
+        return name
+
+    def estimate_size(self):
+        """ Estimate the memory that the index occupies
+
+        Returns:
+            :obj:`int`: estimated size in bytes
+        """
+        return 200 * (len(self.names) + sum(len(results) for results in self._xpath_results.values()))
+
+
+def _is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def get_cellml_model_index(model_etree):
+    """ Get the index of a parsed CellML model, reusing the index of the same element tree from previous calls
+
+    Indices are cached alongside their element trees, so that tasks which share a parsed model
+    (e.g., the iterations of a repeated task) share its index.
+
+    Args:
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for the model
+
+    Returns:
+        :obj:`CellmlModelIndex`: index
+    """
+    cache = get_model_index_cache()
+    key = id(model_etree)
+    entry = cache.get(key)
+
+    # the cache keeps its element trees alive, so their ids are not reused while they are cached
+    if entry is not None and entry[0] is model_etree:
+        return entry[1]
+
+    index = CellmlModelIndex(model_etree)
+    cache.set(key, (model_etree, index), size=index.estimate_size())
+    return index
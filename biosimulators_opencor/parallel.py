@@ -0,0 +1,271 @@
+""" Methods for executing the tasks of SED documents in parallel with a pool of OpenCOR worker processes
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.sedml.data_model import Task, RepeatedTask, ModelAttributeChange, Report, Plot2D, Plot3D
+from biosimulators_utils.warnings import warn, BioSimulatorsWarning
+import atexit
+import concurrent.futures
+import copy
+import multiprocessing
+import os
+import threading
+
+__all__ = [
+    'get_sed_doc_dependency_graph',
+    'get_independent_tasks',
+    'create_worker_pool',
+    'get_worker_pool',
+    'is_worker_pool_broken',
+    'shutdown_worker_pool',
+    'submit_tasks_to_worker_pool',
+]
+
+
+def get_sed_doc_dependency_graph(doc):
+    """ Get the graph of the dependencies among the tasks, data generators, and outputs of a SED document
+
+    Args:
+        doc (:obj:`SedDocument`): SED document
+
+    Returns:
+        :obj:`dict`: dictionary that maps each task, data generator, and output (as a tuple of its type
+            (``task``, ``data_generator``, or ``output``) and id) to the set of nodes which it depends on
+    """
+    graph = {}
+
+    for task in doc.tasks:
+        graph[('task', task.id)] = set()
+        if isinstance(task, RepeatedTask):
+            for sub_task in task.sub_tasks:
+                graph[('task', task.id)].add(('task', sub_task.task.id))
+
+    for data_gen in doc.data_generators:
+        graph[('data_generator', data_gen.id)] = set(('task', variable.task.id) for variable in data_gen.variables if variable.task)
+
+    for output in doc.outputs:
+        if isinstance(output, Report):
+            data_gens = [data_set.data_generator for data_set in output.data_sets]
+        elif isinstance(output, Plot2D):
+            data_gens = [data_gen for curve in output.curves for data_gen in (curve.x_data_generator, curve.y_data_generator)]
+        elif isinstance(output, Plot3D):
+            data_gens = [data_gen
+                         for surface in output.surfaces
+                         for data_gen in (surface.x_data_generator, surface.y_data_generator, surface.z_data_generator)]
+        else:
+            data_gens = []
+        graph[('output', output.id)] = set(('data_generator', data_gen.id) for data_gen in data_gens if data_gen)
+
+    return graph
+
+
+def get_independent_tasks(doc, working_dir):
+    """ Get the basic tasks of a SED document which don't depend on other tasks and which can be executed
+    independently of the execution of the document (i.e., in another process)
+
+    Args:
+        doc (:obj:`SedDocument`): SED document
+        working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
+
+    Returns:
+        :obj:`list` of :obj:`Task`: tasks, in the order in which the SED document executes them
+    """
+    graph = get_sed_doc_dependency_graph(doc)
+
+    tasks = []
+    for task in doc.tasks:
+        if not isinstance(task, Task) or graph[('task', task.id)]:
+            continue
+
+        # only models which are local files whose changes can be applied by the task executer are supported
+        model = task.model
+        if (
+            not model.source
+            or not os.path.isfile(os.path.join(working_dir, model.source))
+            or any(not isinstance(change, ModelAttributeChange) for change in model.changes)
+        ):
+            continue
+
+        tasks.append(task)
+
+    return tasks
+
+
+def create_worker_pool(num_workers, initializer=None, initargs=()):
+    """ Create a pool of OpenCOR worker processes, which the caller owns and must shut down
+
+    Worker processes are forked from the current process so that they inherit its OpenCOR environment
+    and imported modules; OpenCOR's embedded Python interpreter can't start fresh interpreters for other start
+    methods. Workers are long-lived, which enables them to reuse their compiled simulations across tasks.
+    All of the workers are forked when the pool is created, from the calling thread. Workers don't inherit the shared
+    pool of worker processes of the current process (see :obj:`get_worker_pool`).
+
+    Forked workers only inherit the calling thread, and locks which other threads of the current process hold when
+    it forks remain locked in the workers. Pools should therefore be created before a process starts other threads
+    (e.g., the threads of a server). A warning is issued when a pool is created while other threads are running.
+
+    Args:
+        num_workers (:obj:`int`): number of worker processes
+        initializer (:obj:`types.FunctionType`, optional): function which each worker calls once it has started
+        initargs (:obj:`tuple`, optional): arguments for :obj:`initializer`
+
+    Returns:
+        :obj:`concurrent.futures.ProcessPoolExecutor`: pool of worker processes
+    """
+    if threading.active_count() > 1:
+        warn(('Worker processes are being forked while {} other threads are running. Locks which these threads hold '
+              'will remain locked in the workers.').format(threading.active_count() - 1), BioSimulatorsWarning)
+
+    worker_pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers,
+                                                         mp_context=multiprocessing.get_context('fork'),
+                                                         initializer=initializer,
+                                                         initargs=initargs)
+
+    # fork the workers now, rather than when tasks are first submitted from possibly other threads
+    worker_pool.submit(os.getpid).result()
+
+    return worker_pool
+
+
+_worker_pool = None
+_worker_pool_size = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool(num_workers):
+    """ Get the pool of OpenCOR worker processes which this process shares among the documents and ensembles which
+    it executes in parallel (see :obj:`create_worker_pool`)
+
+    The pool is owned by this module. It lives until it is shut down (:obj:`shutdown_worker_pool`), a pool with
+    a different number of workers is requested, one of its workers terminates abruptly (which breaks the pool), or
+    the process exits. Broken pools are replaced with new pools. Child processes which are forked from this process
+    (e.g., workers) don't inherit the pool.
+
+    Args:
+        num_workers (:obj:`int`): number of worker processes
+
+    Returns:
+        :obj:`concurrent.futures.ProcessPoolExecutor`: pool of worker processes
+    """
+    global _worker_pool
+    global _worker_pool_size
+
+    with _worker_pool_lock:
+        if _worker_pool is not None and (_worker_pool_size != num_workers or is_worker_pool_broken(_worker_pool)):
+            _worker_pool.shutdown(wait=True)
+            _worker_pool = None
+
+        if _worker_pool is None:
+            _worker_pool = create_worker_pool(num_workers)
+            _worker_pool_size = num_workers
+
+        return _worker_pool
+
+
+def is_worker_pool_broken(worker_pool):
+    """ Determine whether a pool of worker processes is broken (i.e., one of its workers terminated abruptly),
+    in which case it can't execute any more tasks
+
+    Args:
+        worker_pool (:obj:`concurrent.futures.ProcessPoolExecutor`): pool of worker processes
+
+    Returns:
+        :obj:`bool`: :obj:`True`, if the pool is broken
+    """
+    return bool(getattr(worker_pool, '_broken', False))
+
+
+@atexit.register
+def shutdown_worker_pool():
+    """ Shut down the shared pool of OpenCOR worker processes of this process (see :obj:`get_worker_pool`) """
+    global _worker_pool
+    global _worker_pool_size
+
+    with _worker_pool_lock:
+        if _worker_pool is not None:
+            _worker_pool.shutdown(wait=True)
+            _worker_pool = None
+            _worker_pool_size = None
+
+
+def _forget_worker_pool():
+    """ Discard the reference to the shared pool of worker processes which a child process inherited from its parent,
+    without shutting the pool down
+    """
+    global _worker_pool
+    global _worker_pool_size
+    global _worker_pool_lock
+
+    _worker_pool = None
+    _worker_pool_size = None
+    _worker_pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_worker_pool)
+
+
+def submit_tasks_to_worker_pool(tasks, doc, working_dir, worker_pool, config=None, simulator_config=None, profiles_dirname=None):
+    """ Submit basic tasks of a SED document to a pool of OpenCOR worker processes
+
+    Args:
+        tasks (:obj:`list` of :obj:`Task`): tasks
+        doc (:obj:`SedDocument`): SED document
+        working_dir (:obj:`str`): working directory of the SED document (path relative to which models are located)
+        worker_pool (:obj:`concurrent.futures.Executor`): pool of worker processes
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+        profiles_dirname (:obj:`str`, optional): directory to save profiles of the execution of the tasks
+            (see :obj:`biosimulators_opencor.profiling`)
+
+    Returns:
+        :obj:`dict`: dictionary that maps the id of each task to a future for a tuple of its :obj:`VariableResults`,
+            the KiSAO id of the algorithm that was executed, and additional information about its execution
+    """
+    from biosimulators_utils.sedml.utils import get_variables_for_task
+
+    futures = {}
+    for task in tasks:
+        variables = get_variables_for_task(doc, task)
+
+        task = copy.deepcopy(task)
+        task.model.source = os.path.abspath(os.path.join(working_dir, task.model.source))
+
+        futures[task.id] = worker_pool.submit(exec_sed_task_in_worker, task, variables, config, simulator_config,
+                                              profiles_dirname)
+
+    return futures
+
+
+def exec_sed_task_in_worker(task, variables, config=None, simulator_config=None, profiles_dirname=None):
+    """ Execute a task in a worker process
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables that should be recorded
+        config (:obj:`Config`, optional): BioSimulators common configuration
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration
+        profiles_dirname (:obj:`str`, optional): directory to save a profile of the execution of the task
+            (see :obj:`biosimulators_opencor.profiling`)
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`VariableResults`: results of the variables
+            * :obj:`str`: KiSAO id of the algorithm that was executed
+            * :obj:`dict`: additional information about the execution of the task
+    """
+    from .core import exec_sed_task
+    from biosimulators_utils.log.data_model import TaskLog
+
+    task_executer = exec_sed_task
+    if profiles_dirname:
+        from .profiling import profile_task_executer
+        task_executer = profile_task_executer(exec_sed_task, profiles_dirname,
+                                              memory=simulator_config.PROFILE_MEMORY if simulator_config else False)
+
+    results, log = task_executer(task, variables, log=TaskLog(), config=config, simulator_config=simulator_config)
+    return results, log.algorithm if log else None, log.simulator_details if log else None
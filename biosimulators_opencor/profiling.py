@@ -0,0 +1,179 @@
+""" Opt-in profiling of the execution of individual SED tasks
+
+When :obj:`SimulatorConfig.PROFILE_TASKS` is enabled (e.g., with the environment variable ``PROFILE_TASKS=1``), the
+execution of each basic task is profiled with :obj:`cProfile`, and the profile is saved to the ``profiles``
+subdirectory of the output directory of its SED document:
+
+* ``{ task.id }.prof``: statistics of the profiler, which can be loaded with :obj:`pstats` or viewers such as
+  SnakeViz
+* ``{ task.id }.json``: summary of the duration of the task and the functions with the largest cumulative times,
+  and, when :obj:`SimulatorConfig.PROFILE_MEMORY` is enabled, the peak memory allocated by Python and the lines which
+  allocated the most memory (measured with :obj:`tracemalloc`)
+
+Tasks which are executed repeatedly (e.g., the iterations of repeated tasks) are saved to
+``{ task.id }-{ i }.prof`` and ``{ task.id }-{ i }.json`` for the second and subsequent executions.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+__all__ = [
+    'PROFILES_DIRNAME',
+    'get_profiles_dirname',
+    'get_profile_filename',
+    'profile_task',
+    'profile_task_executer',
+]
+
+PROFILES_DIRNAME = 'profiles'
+# :obj:`str`: name of the subdirectory of the output directory of each SED document to which profiles are saved
+
+NUM_PROFILED_FUNCTIONS = 25
+# :obj:`int`: number of functions and lines with the largest cumulative times and allocations to summarize
+
+
+def get_profiles_dirname(base_out_path, rel_out_path=None):
+    """ Get the directory to which the profiles of the tasks of a SED document are saved
+
+    Args:
+        base_out_path (:obj:`str`): path to store the outputs
+        rel_out_path (:obj:`str`, optional): path relative to :obj:`base_out_path` to store the outputs
+
+    Returns:
+        :obj:`str`: directory
+    """
+    return os.path.join(base_out_path, rel_out_path or '', PROFILES_DIRNAME)
+
+
+def get_profile_filename(dirname, task_id):
+    """ Get a path, without an extension, to which a profile of a task can be saved without overwriting previous
+    profiles of the task
+
+    The path is reserved by creating its ``.prof`` file exclusively, so that processes which profile the same task
+    concurrently (e.g., worker processes, see :obj:`biosimulators_opencor.parallel`) save their profiles to different
+    paths.
+
+    Args:
+        dirname (:obj:`str`): directory to save the profile
+        task_id (:obj:`str`): id of the task
+
+    Returns:
+        :obj:`str`: path without extension (e.g., ``{ dirname }/{ task_id }``)
+    """
+    filename = os.path.join(dirname, task_id)
+    i_profile = 1
+    while True:
+        try:
+            open(filename + '.prof', 'x').close()
+            return filename
+        except FileExistsError:
+            i_profile += 1
+            filename = os.path.join(dirname, '{}-{}'.format(task_id, i_profile))
+
+
+@contextlib.contextmanager
+def profile_task(task_id, dirname, memory=False):
+    """ Profile the execution of a task, and save the profile to a directory
+
+    Args:
+        task_id (:obj:`str`): id of the task
+        dirname (:obj:`str`): directory to save the profile
+        memory (:obj:`bool`, optional): whether to also trace the memory allocated by Python
+    """
+    trace_memory = memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+
+    finally:
+        profiler.disable()
+        duration = time.perf_counter() - start_time
+
+        if memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if trace_memory:
+                tracemalloc.stop()
+        else:
+            snapshot = None
+
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        filename = get_profile_filename(dirname, task_id)
+        profiler.dump_stats(filename + '.prof')
+
+        summary = {
+            'task': task_id,
+            'duration': duration,
+            'profile': os.path.basename(filename + '.prof'),
+            'functions': _summarize_profile(profiler),
+        }
+        if snapshot is not None:
+            summary['memory'] = {
+                'peak': peak_memory,
+                'allocations': [
+                    {
+                        'filename': stat.traceback[0].filename,
+                        'line': stat.traceback[0].lineno,
+                        'size': stat.size,
+                        'count': stat.count,
+                    }
+                    for stat in snapshot.statistics('lineno')[:NUM_PROFILED_FUNCTIONS]
+                ],
+            }
+        with open(filename + '.json', 'w') as file:
+            json.dump(summary, file, indent=2)
+
+
+def _summarize_profile(profiler):
+    """ Get the functions of a profile with the largest cumulative times
+
+    Args:
+        profiler (:obj:`cProfile.Profile`): profiler
+
+    Returns:
+        :obj:`list` of :obj:`dict`: number of calls, and the total and cumulative time of each function
+    """
+    stats = pstats.Stats(profiler).stats
+    functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:NUM_PROFILED_FUNCTIONS]
+    return [
+        {
+            'function': '{}:{}({})'.format(filename, line, name),
+            'calls': num_calls,
+            'totalTime': total_time,
+            'cumulativeTime': cumulative_time,
+        }
+        for (filename, line, name), (_, num_calls, total_time, cumulative_time, _) in functions
+    ]
+
+
+def profile_task_executer(task_executer, dirname, memory=False):
+    """ Wrap a function which executes tasks (e.g., :obj:`exec_sed_task`) so that each execution is profiled
+
+    Args:
+        task_executer (:obj:`types.FunctionType`): function to execute tasks
+        dirname (:obj:`str`): directory to save the profiles
+        memory (:obj:`bool`, optional): whether to also trace the memory allocated by Python
+
+    Returns:
+        :obj:`types.FunctionType`: function to execute and profile tasks
+    """
+    def exec_and_profile_task(task, variables, *args, **kwargs):
+        with profile_task(task.id, dirname, memory=memory):
+            return task_executer(task, variables, *args, **kwargs)
+    return exec_and_profile_task
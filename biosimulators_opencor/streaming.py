@@ -0,0 +1,171 @@
+""" Methods for streaming the results of long time courses to HDF5 files in segments
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_utils.report.data_model import VariableResults
+import contextlib
+import copy
+import h5py
+
+__all__ = [
+    'get_simulation_segments',
+    'Hdf5VariableResultsWriter',
+    'StreamedVariableResults',
+    'read_streamed_variable_results',
+]
+
+
+def get_simulation_segments(simulation, max_steps):
+    """ Divide the time course of a simulation into consecutive segments
+
+    The first segment has the initial time of the simulation. Each subsequent segment begins at the end of the
+    previous segment, and its initial and output start times are equal. As a result, the first point of each
+    subsequent segment duplicates the last point of the previous segment. The times of the points of the
+    segments are calculated from the time course of the entire simulation to avoid accumulating rounding errors.
+
+    Args:
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation
+        max_steps (:obj:`int`): maximum number of steps of each segment
+
+    Returns:
+        :obj:`list` of :obj:`UniformTimeCourseSimulation`: segments
+    """
+    max_steps = max(int(max_steps), 1)
+    num_steps = simulation.number_of_steps
+    if num_steps <= max_steps:
+        return [copy.copy(simulation)]
+
+    start = simulation.output_start_time
+    duration = simulation.output_end_time - simulation.output_start_time
+
+    segments = []
+    for first_step in range(0, num_steps, max_steps):
+        last_step = min(first_step + max_steps, num_steps)
+
+        segment = copy.copy(simulation)
+        if first_step > 0:
+            segment.initial_time = start + duration * first_step / num_steps
+            segment.output_start_time = segment.initial_time
+        segment.output_end_time = start + duration * last_step / num_steps
+        segment.number_of_steps = last_step - first_step
+        segments.append(segment)
+
+    return segments
+
+
+class Hdf5VariableResultsWriter(object):
+    """ Writer which appends the results of SED variables to chunked, resizable datasets of an HDF5 file
+
+    The results of each variable are saved to a one-dimensional dataset whose name is the id of the variable.
+
+    Attributes:
+        filename (:obj:`str`): path to the HDF5 file
+        variables (:obj:`list` of :obj:`Variable`): variables
+        num_points (:obj:`int`): number of points which have been written for each variable
+    """
+
+    def __init__(self, filename, variables, chunk_size):
+        """
+        Args:
+            filename (:obj:`str`): path to the HDF5 file; any existing file is overwritten
+            variables (:obj:`list` of :obj:`Variable`): variables
+            chunk_size (:obj:`int`): number of points of each chunk of the datasets
+        """
+        self.filename = filename
+        self.variables = variables
+        self.num_points = 0
+
+        self._file = h5py.File(filename, 'w')
+        for variable in variables:
+            dataset = self._file.create_dataset(variable.id, shape=(0,), maxshape=(None,), dtype='float64',
+                                                chunks=(max(int(chunk_size), 1),))
+            if variable.target:
+                dataset.attrs['target'] = variable.target
+            if variable.symbol:
+                dataset.attrs['symbol'] = variable.symbol
+
+    def append(self, variable_results):
+        """ Append the results of the variables of a segment of a simulation
+
+        Args:
+            variable_results (:obj:`VariableResults`): results of each variable for the segment
+        """
+        num_points = None
+        for variable in self.variables:
+            values = variable_results[variable.id]
+            num_points = values.shape[0]
+
+            dataset = self._file[variable.id]
+            dataset.resize((self.num_points + num_points,))
+            dataset[self.num_points:] = values
+
+        if num_points is not None:
+            self.num_points += num_points
+
+    def close(self):
+        """ Close the HDF5 file """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class StreamedVariableResults(object):
+    """ Location of the results of SED variables which were streamed to an HDF5 file
+
+    The file isn't kept open. Its results can be read with :obj:`open`.
+
+    Attributes:
+        filename (:obj:`str`): path to the HDF5 file
+        variables (:obj:`list` of :obj:`Variable`): variables
+        num_points (:obj:`int`): number of points of the results of each variable
+    """
+
+    def __init__(self, filename, variables, num_points):
+        """
+        Args:
+            filename (:obj:`str`): path to the HDF5 file
+            variables (:obj:`list` of :obj:`Variable`): variables
+            num_points (:obj:`int`): number of points of the results of each variable
+        """
+        self.filename = filename
+        self.variables = variables
+        self.num_points = num_points
+
+    def open(self):
+        """ Open the results of the variables (see :obj:`read_streamed_variable_results`)
+
+        Returns:
+            :obj:`contextlib.AbstractContextManager`: context manager for the results of the variables
+        """
+        return read_streamed_variable_results(self.filename, self.variables)
+
+
+@contextlib.contextmanager
+def read_streamed_variable_results(filename, variables):
+    """ Open the results of SED variables which were streamed to an HDF5 file
+
+    The file is opened read-only and the results of the variables are loaded lazily. The file is closed when the
+    context exits, after which the datasets can no longer be read.
+
+    Args:
+        filename (:obj:`str`): path to the HDF5 file
+        variables (:obj:`list` of :obj:`Variable`): variables
+
+    Yields:
+        :obj:`VariableResults`: dictionary which maps the id of each variable to its dataset (:obj:`h5py.Dataset`)
+    """
+    with h5py.File(filename, 'r') as file:
+        variable_results = VariableResults()
+        for variable in variables:
+            variable_results[variable.id] = file[variable.id]
+        yield variable_results
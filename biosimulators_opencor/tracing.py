@@ -0,0 +1,196 @@
+""" Local tracing of the execution of archives, SED documents, tasks, and the phases of tasks
+
+When :obj:`SimulatorConfig.TRACE_FILENAME` is set (e.g., with the environment variable ``TRACE_FILENAME``), a span is
+recorded for the execution of each archive, SED document, task, and phase of each task (e.g., ``load``, ``run``,
+``extractResults``), and for the generation of each report and plot. The spans are appended to the file as JSON lines.
+Each line is a complete event (``"ph": "X"``) of the
+`Trace Event Format <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_, with the
+attributes of the span (e.g., the hash of the model, the number of steps, the number of variables, and the algorithm
+of each task) in its ``args``. Spans which are recorded by worker processes are appended to the same file.
+
+Traces can be converted to JSON documents which trace and flame graph viewers (e.g., Perfetto, ``chrome://tracing``,
+and speedscope) can load with :obj:`export_chrome_trace`.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from .config import get_simulator_config
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+
+__all__ = [
+    'Tracer',
+    'get_tracer',
+    'set_tracer',
+    'trace_span',
+    'read_trace',
+    'export_chrome_trace',
+]
+
+
+class Tracer(object):
+    """ Tracer which appends spans to a JSON lines file
+
+    Attributes:
+        filename (:obj:`str`): path to the file
+        _parents (:obj:`threading.local`): stack of the ids of the open spans of each thread
+        _ids (:obj:`itertools.count`): counter of the spans of the process
+        _lock (:obj:`threading.Lock`): lock for writing spans
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename (:obj:`str`): path to the file
+        """
+        self.filename = filename
+        self._parents = threading.local()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        """ Record a span
+
+        Args:
+            name (:obj:`str`): name of the span
+            **attributes: attributes of the span
+
+        Yields:
+            :obj:`dict`: attributes of the span, to which attributes which are determined during the span can be added
+        """
+        parents = getattr(self._parents, 'stack', None)
+        if parents is None:
+            parents = self._parents.stack = []
+
+        pid = os.getpid()
+        span_id = '{}-{}'.format(pid, next(self._ids))
+        parent_id = parents[-1] if parents else None
+        parents.append(span_id)
+
+        start_timestamp = time.time_ns() // 1000
+        start_time = time.perf_counter()
+        try:
+            yield attributes
+
+        except BaseException as exception:
+            attributes['error'] = exception.__class__.__name__
+            raise
+
+        finally:
+            duration = time.perf_counter() - start_time
+            parents.pop()
+
+            args = dict(attributes)
+            args['spanId'] = span_id
+            if parent_id:
+                args['parentId'] = parent_id
+            self.write({
+                'name': name,
+                'cat': 'biosimulators_opencor',
+                'ph': 'X',
+                'ts': start_timestamp,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': threading.get_ident(),
+                'args': args,
+            })
+
+    def write(self, event):
+        """ Append an event to the file
+
+        Args:
+            event (:obj:`dict`): event
+        """
+        line = json.dumps(event, default=str) + '\n'
+        with self._lock:
+            with open(self.filename, 'a') as file:
+                file.write(line)
+
+
+_tracer = None
+_tracer_configured = False
+
+
+def get_tracer(simulator_config=None):
+    """ Get the tracer of the current process
+
+    Args:
+        simulator_config (:obj:`SimulatorConfig`, optional): OpenCOR configuration; if provided, the tracer is
+            (re)configured to write to :obj:`SimulatorConfig.TRACE_FILENAME`. Otherwise, the tracer which was last
+            configured is returned, or, if no tracer has been configured, a tracer configured from the environment
+
+    Returns:
+        :obj:`Tracer`: tracer, or :obj:`None` if tracing is disabled
+    """
+    if simulator_config is None:
+        if _tracer_configured:
+            return _tracer
+        simulator_config = get_simulator_config()
+
+    filename = simulator_config.TRACE_FILENAME
+    if not _tracer_configured or (_tracer.filename if _tracer else None) != filename:
+        set_tracer(Tracer(filename) if filename else None)
+    return _tracer
+
+
+def set_tracer(tracer):
+    """ Set the tracer of the current process
+
+    Args:
+        tracer (:obj:`Tracer`): tracer, or :obj:`None` to disable tracing
+    """
+    global _tracer, _tracer_configured
+    _tracer = tracer
+    _tracer_configured = True
+
+
+@contextlib.contextmanager
+def trace_span(name, **attributes):
+    """ Record a span with the tracer of the current process (see :obj:`get_tracer`), if tracing is enabled
+
+    Args:
+        name (:obj:`str`): name of the span
+        **attributes: attributes of the span
+
+    Yields:
+        :obj:`dict`: attributes of the span, to which attributes which are determined during the span can be added
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield attributes
+    else:
+        with tracer.span(name, **attributes) as span_attributes:
+            yield span_attributes
+
+
+def read_trace(filename):
+    """ Read the spans of a trace
+
+    Args:
+        filename (:obj:`str`): path to the trace
+
+    Returns:
+        :obj:`list` of :obj:`dict`: spans, in the order in which they ended
+    """
+    with open(filename, 'r') as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def export_chrome_trace(filename, out_filename):
+    """ Convert a trace to a JSON document in the Trace Event Format, which trace and flame graph viewers can load
+
+    Args:
+        filename (:obj:`str`): path to the trace
+        out_filename (:obj:`str`): path to save the JSON document
+    """
+    events = sorted(read_trace(filename), key=lambda event: (event['ts'], -event['dur']))
+    with open(out_filename, 'w') as file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
@@ -6,39 +6,61 @@
 :License: MIT
 """
 
+from .algorithms import get_substitute_algorithm_id, get_memoized_parameter_value
+from .cache import get_simulation_pool_key, get_parsed_model_cache
+from .cellml_imports import get_flattened_cellml_model, has_relative_cellml_imports
 from .data_model import KISAO_ALGORITHM_MAP
+from .model_index import get_cellml_model_index
+from .tracing import trace_span
 from biosimulators_utils.config import get_config, Config  # noqa: F401
 from biosimulators_utils.data_model import ValueType  # noqa: F401
 from biosimulators_utils.log.data_model import TaskLog  # noqa: F401
 from biosimulators_utils.report.data_model import VariableResults  # noqa: F401
 from biosimulators_utils.sedml.data_model import (  # noqa: F401
-    SedDocument, ModelLanguage, ModelAttributeChange, UniformTimeCourseSimulation, Algorithm, Task, RepeatedTask,
-    VectorRange, SubTask, DataGenerator, Variable)
-from biosimulators_utils.sedml.io import SedmlSimulationWriter
-from biosimulators_utils.sedml import validation
+    SedDocument, ModelLanguage, ModelAttributeChange, SetValueComputeModelChange, UniformTimeCourseSimulation, Algorithm,
+    Task, RepeatedTask, UniformRange, VectorRange, FunctionalRange, SubTask, DataGenerator, Variable)
 from biosimulators_utils.simulator.utils import get_algorithm_substitution_policy
 from biosimulators_utils.utils.core import validate_str_value, raise_errors_warnings
 from biosimulators_utils.warnings import warn, BioSimulatorsWarning
 from kisao.data_model import AlgorithmSubstitutionPolicy, ALGORITHM_SUBSTITUTION_POLICY_LEVELS
-from kisao.utils import get_preferred_substitute_algorithm_by_ids
 from unittest import mock
+import collections
 import copy
 import lxml.etree
-import opencor
+import numpy
 import os
+import shutil
 import tempfile
 
 
 __all__ = [
     'validate_task',
+    'is_repeated_task_executable_with_single_simulation',
+    'are_model_changes_applicable_to_simulations',
     'validate_variable_xpaths',
+    'get_opencor_name',
+    'get_opencor_model_change_values',
     'validate_simulation',
     'get_opencor_algorithm',
     'get_opencor_parameter_value',
+    'write_xml_model_with_changes',
     'build_opencor_sedml_doc',
     'save_task_to_opencor_sedml_file',
     'load_opencor_simulation',
+    'copy_model_file',
+    'configure_opencor_simulation_algorithm',
+    'load_pooled_opencor_simulation',
+    'configure_opencor_simulation',
+    'run_opencor_simulation',
+    'continue_opencor_simulation',
+    'reset_opencor_simulation',
+    'set_opencor_simulation_values',
+    'estimate_opencor_simulation_size',
+    'release_opencor_simulation_results',
+    'get_opencor_solver_settings',
     'validate_opencor_simulation',
+    'get_opencor_results_index',
+    'get_opencor_result_window',
     'get_results_from_opencor_simulation',
     'log_opencor_execution',
     'get_mock_libcellml',
@@ -57,7 +79,8 @@ def validate_task(task, variables, config=None):
         :obj:`tuple:`:
 
             * :obj:`Task`: possibly alternate task that OpenCOR should execute
-            * :obj:`lxml.etree._ElementTree`: element tree for model
+            * :obj:`lxml.etree._ElementTree`: element tree for model, which is shared with other tasks (see
+              :obj:`get_parsed_model_cache`) and must not be modified
             * :obj:`dict`: dictionary that maps the id of each SED variable to the name that OpenCOR uses to reference it
     """
     config = config or get_config()
@@ -65,6 +88,7 @@ def validate_task(task, variables, config=None):
     sim = task.simulation
 
     if config.VALIDATE_SEDML:
+        from biosimulators_utils.sedml import validation
         raise_errors_warnings(validation.validate_task(task),
                               error_summary='Task `{}` is invalid.'.format(task.id))
         raise_errors_warnings(validation.validate_model_language(model.language, ModelLanguage.CellML),
@@ -80,11 +104,12 @@ def validate_task(task, variables, config=None):
         raise_errors_warnings(*validation.validate_data_generator_variables(variables),
                               error_summary='Data generator variables for task `{}` are invalid.'.format(task.id))
 
-    # read model; TODO: support imports
-    model_etree = lxml.etree.parse(model.source)
+    # read model, reusing the parsed model of previous tasks; the parsed model is shared and must not be modified
+    model_etree, _ = get_parsed_model_cache().get_model(model.source)
 
-    # validate variables
-    opencor_variable_names = validate_variable_xpaths(variables, model_etree)
+    # validate variables against the model, including the components which it imports
+    model_index = get_cellml_model_index(get_flattened_cellml_model(model.source))
+    opencor_variable_names = validate_variable_xpaths(variables, model_etree, model_index=model_index)
 
     # validate simulation
     opencor_simulation = validate_simulation(task.simulation)
@@ -100,27 +125,96 @@ def validate_task(task, variables, config=None):
     return opencor_task, model_etree, opencor_variable_names
 
 
-def validate_variable_xpaths(sed_variables, model_etree):
+def is_repeated_task_executable_with_single_simulation(task):
+    """ Determine whether all of the iterations of a repeated task can be executed with a single compiled OpenCOR
+    simulation, by setting the values of model attributes and resetting the simulation between iterations. This
+    requires that the repeated task
+
+    * Has a single sub-task, which is a basic task
+    * Has only uniform, vector, and functional ranges
+    * Only sets the values of attributes of the model of its sub-task, independently of the values of model variables
+
+    Args:
+        task (:obj:`RepeatedTask`): repeated task
+
+    Returns:
+        :obj:`bool`: whether the iterations of the repeated task can be executed with a single compiled OpenCOR simulation
+    """
+    if len(task.sub_tasks) != 1 or not isinstance(task.sub_tasks[0].task, Task):
+        return False
+
+    ranges = [task.range] + list(task.ranges) + [change.range for change in task.changes if change.range]
+    if any(not isinstance(task_range, (UniformRange, VectorRange, FunctionalRange)) for task_range in ranges):
+        return False
+
+    model = task.sub_tasks[0].task.model
+    for change in task.changes:
+        if (
+            not isinstance(change, SetValueComputeModelChange)
+            or change.symbol
+            or not change.target
+            or change.variables
+            or change.model is not model
+        ):
+            return False
+
+    return True
+
+
+def are_model_changes_applicable_to_simulations(doc):
+    """ Determine whether the changes to the models of a SED document can be applied by :obj:`exec_sed_task`,
+    rather than to copies of the model files before the tasks are executed. This requires that
+
+    * The models are only changed by changes to the values of their attributes
+    * The changes of repeated tasks and their functional ranges don't depend on the values of model variables
+
+    Args:
+        doc (:obj:`SedDocument`): SED document
+
+    Returns:
+        :obj:`bool`: whether the changes to the models can be applied by :obj:`exec_sed_task`
+    """
+    for model in doc.models:
+        if any(not isinstance(change, ModelAttributeChange) for change in model.changes):
+            return False
+
+    for task in doc.tasks:
+        if not isinstance(task, RepeatedTask):
+            continue
+
+        ranges = [task.range] + list(task.ranges) + [change.range for change in task.changes if change.range]
+        if any(isinstance(task_range, FunctionalRange) and task_range.variables for task_range in ranges):
+            return False
+
+        if any(change.variables for change in task.changes):
+            return False
+
+    return True
+
+
+def validate_variable_xpaths(sed_variables, model_etree, model_index=None):
     """ Get the names OpenCOR uses to refer to model variable
 
     Args:
         model_etree (:obj:`lxml.etree._ElementTree`): element tree for model
         sed_variables (:obj:`list` of :obj:`Variable`): SED variables
+        model_index (:obj:`CellmlModelIndex`, optional): index of the model (default: the cached index of
+            :obj:`model_etree`, see :obj:`get_cellml_model_index`)
 
     Returns:
         :obj:`dict`: dictionary that maps the id of each SED variable to the name that OpenCOR uses to reference it
     """
+    if model_index is None:
+        model_index = get_cellml_model_index(model_etree)
+
     opencor_variable_names = {}
     for sed_variable in sed_variables:
         if not sed_variable.target:
             msg = 'Symbols are not supported.'
             raise NotImplementedError(msg)
 
-        namespaces = copy.copy(sed_variable.target_namespaces)
-        namespaces.pop(None, None)
-
         obj_target, _, attrib_target = sed_variable.target.partition('/@')
-        xml_objs = model_etree.xpath(obj_target, namespaces=namespaces)
+        xml_objs = model_index.xpath(obj_target, namespaces=sed_variable.target_namespaces)
 
         if len(xml_objs) == 0:
             msg = (
@@ -136,62 +230,129 @@ def validate_variable_xpaths(sed_variables, model_etree):
             ).format(sed_variable.target, sed_variable.id)
             raise ValueError(msg)
 
-        xml_obj = xml_objs[0]
-
-        names = []
-        while True:
-            name = xml_obj.attrib.get('name', None)
-            names.append(name)
-            xml_obj = xml_obj.getparent()
-            ns, _, tag = xml_obj.tag[1:].partition('}')
-            if not name or not ns.startswith('http://www.cellml.org/cellml/'):
-                msg = 'Target `{}` of variable `{}` is not a valid observable.'.format(sed_variable.target, sed_variable.id)
-                raise ValueError(msg)
-            if tag == 'model':
-                break
+        opencor_name = model_index.get_name(xml_objs[0])
+        if opencor_name is None:
+            msg = 'Target `{}` of variable `{}` is not a valid observable.'.format(sed_variable.target, sed_variable.id)
+            raise ValueError(msg)
 
         if attrib_target:
-            names.insert(0, attrib_target)
-        opencor_variable_names[sed_variable.id] = '/'.join(reversed(names))
+            opencor_name += '/' + attrib_target
+        opencor_variable_names[sed_variable.id] = opencor_name
 
     return opencor_variable_names
 
 
-def validate_simulation(simulation):
+def get_opencor_name(xml_obj):
+    """ Get the name that OpenCOR uses to refer to an element of a CellML model (e.g., ``component/variable``)
+
+    Args:
+        xml_obj (:obj:`lxml.etree._Element`): element of a CellML model
+
+    Returns:
+        :obj:`str`: name that OpenCOR uses to refer to the element, or :obj:`None` if the element is not
+            a named descendant of a CellML model
+    """
+    names = []
+    while True:
+        name = xml_obj.attrib.get('name', None)
+        names.append(name)
+        xml_obj = xml_obj.getparent()
+        if xml_obj is None or not isinstance(xml_obj.tag, str):
+            return None
+        ns, _, tag = xml_obj.tag[1:].partition('}')
+        if not name or not ns.startswith('http://www.cellml.org/cellml/'):
+            return None
+        if tag == 'model':
+            break
+
+    return '/'.join(reversed(names))
+
+
+def get_opencor_model_change_values(changes, model_etree, model_index=None):
+    """ Get the names and new values of the constants and initial values of states targeted by model changes,
+    so that the changes can be applied to a compiled OpenCOR simulation rather than to its model file
+
+    Args:
+        changes (:obj:`list` of :obj:`ModelAttributeChange`): model changes
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for model
+        model_index (:obj:`CellmlModelIndex`, optional): index of the model (default: the cached index of
+            :obj:`model_etree`, see :obj:`get_cellml_model_index`)
+
+    Returns:
+        :obj:`collections.OrderedDict`: dictionary that maps the name that OpenCOR uses to reference each targeted variable
+            to its new value, or :obj:`None` if at least one of the changes doesn't target the initial value of a CellML
+            variable or its new value isn't a number, or if the initial values of some variables of the model are
+            defined by other variables
+    """
+    if model_index is None:
+        model_index = get_cellml_model_index(model_etree)
+
+    # OpenCOR only evaluates initial values which are defined by other variables when a simulation is reset, which
+    # discards the values of constants which were set in memory
+    if model_index.has_variable_initial_values:
+        return None
+
+    values = collections.OrderedDict()
+    for change in changes:
+        obj_target, _, attrib_target = change.target.partition('/@')
+        if attrib_target != 'initial_value':
+            return None
+
+        try:
+            new_value = float(change.new_value)
+        except (TypeError, ValueError):
+            return None
+
+        try:
+            xml_objs = model_index.xpath(obj_target, namespaces=change.target_namespaces)
+        except lxml.etree.XPathError:
+            return None
+        if len(xml_objs) != 1:
+            return None
+
+        xml_obj = xml_objs[0]
+        if not isinstance(xml_obj, lxml.etree._Element) or not isinstance(xml_obj.tag, str) or xml_obj.tag.rpartition('}')[2] != 'variable':
+            return None
+
+        opencor_name = model_index.get_name(xml_obj)
+        if opencor_name is None:
+            return None
+
+        values[opencor_name] = new_value
+
+    return values
+
+
+def validate_simulation(simulation, skip_transient_output=True):
     """ Validate a simulation
 
+    By default, simulations whose outputs start after their initial times are executed in two phases
+    (see :obj:`run_opencor_simulation`) so that OpenCOR doesn't record the transient before the output start time.
+    Alternatively, OpenCOR can record the simulation from its initial time with the same step size, and the results
+    before the output start time are discarded. This is only possible when the output interval evenly divides the
+    duration of the transient; otherwise the simulation is executed in two phases.
+
     Args:
         simulation (:obj:`UniformTimeCourseSimulation`): requested simulation
+        skip_transient_output (:obj:`bool`, optional): whether to integrate the transient without recording it
 
     Returns:
         :obj:`UniformTimeCourseSimulation`: simulation instructions for OpenCOR
     """
+    opencor_simulation = copy.deepcopy(simulation)
+
+    if skip_transient_output or simulation.output_start_time == simulation.initial_time:
+        return opencor_simulation
+
     number_of_steps = (
         simulation.output_end_time - simulation.initial_time
     ) / (
         simulation.output_end_time - simulation.output_start_time
     ) * simulation.number_of_steps
-    output_start_time = simulation.initial_time
 
-    if abs(number_of_steps - round(number_of_steps)) > 1e-8:
-        msg = (
-            'Number of steps must be an integer, not `{}`:'
-            '\n  Initial time: {}'
-            '\n  Output start time: {}'
-            '\n  Output end time: {}'
-            '\n  Number of steps (output start - end time) time: {}'
-        ).format(
-            number_of_steps, simulation.initial_time,
-            simulation.output_start_time, simulation.output_end_time,
-            simulation.number_of_steps,
-        )
-        raise NotImplementedError(msg)
-    else:
-        number_of_steps = round(number_of_steps)
-
-    opencor_simulation = copy.deepcopy(simulation)
-    opencor_simulation.number_of_steps = number_of_steps
-    opencor_simulation.output_start_time = output_start_time
+    if abs(number_of_steps - round(number_of_steps)) <= 1e-8:
+        opencor_simulation.number_of_steps = round(number_of_steps)
+        opencor_simulation.output_start_time = simulation.initial_time
 
     return opencor_simulation
 
@@ -199,6 +360,9 @@ def validate_simulation(simulation):
 def get_opencor_algorithm(requested_alg, config=None):
     """ Get a possibly alternative algorithm that OpenCOR should execute
 
+    The substitutions of algorithms and the translations of the values of their parameters are memoized
+    (see :obj:`biosimulators_opencor.algorithms`).
+
     Args:
         requested_alg (:obj:`Algorithm`): requested algorithm
         config (:obj:`Config`, optional): configuration
@@ -209,9 +373,7 @@ def get_opencor_algorithm(requested_alg, config=None):
     exec_alg = copy.deepcopy(requested_alg)
 
     algorithm_substitution_policy = get_algorithm_substitution_policy(config=config)
-    exec_alg.kisao_id = get_preferred_substitute_algorithm_by_ids(
-        requested_alg.kisao_id, KISAO_ALGORITHM_MAP.keys(),
-        substitution_policy=algorithm_substitution_policy)
+    exec_alg.kisao_id = get_substitute_algorithm_id(requested_alg.kisao_id, algorithm_substitution_policy)
 
     if exec_alg.kisao_id == requested_alg.kisao_id:
         alg_specs = KISAO_ALGORITHM_MAP[exec_alg.kisao_id]
@@ -220,8 +382,8 @@ def get_opencor_algorithm(requested_alg, config=None):
         for change in list(exec_alg.changes):
             param_specs = params_specs.get(change.kisao_id, None)
             if param_specs:
-                is_valid, change.new_value = get_opencor_parameter_value(
-                    change.new_value, param_specs['type'], param_specs.get('enum', None))
+                is_valid, change.new_value = get_memoized_parameter_value(
+                    change.new_value, param_specs['type'], param_specs.get('enum', None), get_opencor_parameter_value)
 
                 if not is_valid:
                     if (
@@ -298,6 +460,39 @@ def get_opencor_parameter_value(value, value_type, enum_cls=None):
         return True, value
 
 
+def write_xml_model_with_changes(model, model_etree):
+    """ Save a copy of a model with changes to a temporary file alongside the model, such that the
+    copy can import the same files as the original model
+
+    Args:
+        model (:obj:`Model`): SED model
+        model_etree (:obj:`lxml.etree._ElementTree`): element tree for the unmodified model
+
+    Returns:
+        :obj:`str`: path to the modified model; the caller is responsible for removing the file
+    """
+    from biosimulators_utils.sedml.utils import apply_changes_to_xml_model
+
+    model = copy.deepcopy(model)
+    for change in model.changes:
+        change.new_value = str(change.new_value)
+
+    # the unmodified model may be shared with other tasks (see :obj:`get_parsed_model_cache`); apply the changes to a copy
+    model_etree = copy.deepcopy(model_etree)
+    apply_changes_to_xml_model(model, model_etree, sed_doc=None, working_dir=None)
+
+    model_file, model_filename = tempfile.mkstemp(suffix='.xml', dir=os.path.dirname(model.source))
+    os.close(model_file)
+
+    model_etree.write(model_filename,
+                      xml_declaration=True,
+                      encoding="utf-8",
+                      standalone=False,
+                      pretty_print=False)
+
+    return model_filename
+
+
 def build_opencor_sedml_doc(task, variables, include_data_generators=False):
     """ Create an OpenCOR-compatible SED-ML document for a task and its output variables
 
@@ -316,8 +511,11 @@ def build_opencor_sedml_doc(task, variables, include_data_generators=False):
     model_copy.source = os.path.abspath(model_copy.source)
     doc.models.append(model_copy)
 
+    # OpenCOR can't execute simulations whose outputs start after their initial times; the time course is
+    # configured when the simulation is run (see :obj:`run_opencor_simulation`)
     sim_copy = copy.deepcopy(task.simulation)
     sim_copy.id = 'simulation1'
+    sim_copy.output_start_time = sim_copy.initial_time
     doc.simulations.append(sim_copy)
 
     basic_task = Task(id='task1', model=model_copy, simulation=sim_copy)
@@ -367,6 +565,7 @@ def save_task_to_opencor_sedml_file(task, variables, include_data_generators=Fal
     doc.models[0].source = os.path.relpath(doc.models[0].source, os.path.dirname(sed_filename))
 
     # use a mocked version because libCellML cannot be installed into the OpenCOR docker image
+    from biosimulators_utils.sedml.io import SedmlSimulationWriter
     with mock.patch.dict('sys.modules', libcellml=get_mock_libcellml()):
         SedmlSimulationWriter().run(doc, sed_filename, validate_models_with_languages=False)
 
@@ -376,6 +575,14 @@ def save_task_to_opencor_sedml_file(task, variables, include_data_generators=Fal
 def load_opencor_simulation(task, variables, include_data_generators=False):
     """ Load an OpenCOR simulation
 
+    By default, the model of the task is opened, and the algorithm and time course of the simulation are
+    configured through the API of OpenCOR. If :obj:`include_data_generators` is :obj:`True`, the task and its data
+    generators are saved to a temporary SED-ML file, which OpenCOR then opens.
+
+    OpenCOR keeps one simulation for each file that it opens. So that each loaded simulation (e.g., each simulation
+    in a pool of simulations, see :obj:`load_pooled_opencor_simulation`) is independent of the others, the model
+    is opened through a temporary copy (see :obj:`copy_model_file`), as the SED-ML file is.
+
     Args:
         task (:obj:`Task`): SED task
         variables (:obj:`list` of :obj:`Variable`): SED variables
@@ -384,12 +591,33 @@ def load_opencor_simulation(task, variables, include_data_generators=False):
     Returns:
         :obj:`PythonQt.private.SimulationSupport.Simulation`: OpenCOR simulation
     """
+    import opencor
+
+    if not include_data_generators:
+        filename = copy_model_file(task.model.source)
+
+        try:
+            with trace_span('open', model=task.model.source):
+                opencor_sim = opencor.open_simulation(filename)
+        finally:
+            # clean up temporary copy of the model
+            os.remove(filename)
+
+        validate_opencor_simulation(opencor_sim)
+
+        configure_opencor_simulation_algorithm(opencor_sim, task.simulation.algorithm)
+        configure_opencor_simulation(opencor_sim, task.simulation)
+
+        return opencor_sim
+
     # save SED-ML to a file
-    filename = save_task_to_opencor_sedml_file(task, variables, include_data_generators=include_data_generators)
+    with trace_span('writeSedml'):
+        filename = save_task_to_opencor_sedml_file(task, variables, include_data_generators=include_data_generators)
 
     # Read the SED-ML file
     try:
-        opencor_sim = opencor.open_simulation(filename)
+        with trace_span('open', model=task.model.source):
+            opencor_sim = opencor.open_simulation(filename)
     finally:
         # clean up temporary SED-ML file
         os.remove(filename)
@@ -399,6 +627,316 @@ def load_opencor_simulation(task, variables, include_data_generators=False):
     return opencor_sim
 
 
+def copy_model_file(model_filename):
+    """ Save a temporary copy of a model file
+
+    Models which import other files by relative paths (see :obj:`has_relative_cellml_imports`) are copied into their
+    directories, so that their imports are still resolved. Other models, and models whose directories can't be written
+    (e.g., read-only directories), are copied into the system temporary directory.
+
+    Args:
+        model_filename (:obj:`str`): path to the model
+
+    Returns:
+        :obj:`str`: path to the copy of the model, which the caller must remove
+    """
+    model_filename = os.path.abspath(model_filename)
+    suffix = os.path.splitext(model_filename)[1]
+
+    dirnames = [tempfile.gettempdir()]
+    if has_relative_cellml_imports(model_filename):
+        dirnames.insert(0, os.path.dirname(model_filename))
+
+    for i_dirname, dirname in enumerate(dirnames):
+        try:
+            model_file, filename = tempfile.mkstemp(suffix=suffix, dir=dirname)
+        except OSError:
+            if i_dirname == len(dirnames) - 1:
+                raise
+            continue
+        os.close(model_file)
+
+        try:
+            shutil.copyfile(model_filename, filename)
+        except Exception:
+            os.remove(filename)
+            raise
+        return filename
+
+
+def configure_opencor_simulation_algorithm(opencor_sim, algorithm):
+    """ Set the solver of an OpenCOR simulation and the values of the properties of the solver
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        algorithm (:obj:`Algorithm`): algorithm that OpenCOR should execute, with the OpenCOR representations of the
+            values of its parameters (see :obj:`get_opencor_algorithm`)
+    """
+    alg_specs = KISAO_ALGORITHM_MAP[algorithm.kisao_id]
+
+    opencor_data = opencor_sim.data()
+    if alg_specs['opencor_solver_type'] == 'nla':
+        opencor_data.setNlaSolverName(alg_specs['opencor_solver_name'])
+        add_solver_property = opencor_data.addNlaSolverProperty
+    else:
+        opencor_data.setOdeSolverName(alg_specs['opencor_solver_name'])
+        add_solver_property = opencor_data.addOdeSolverProperty
+
+    for change in algorithm.changes:
+        param_specs = alg_specs['parameters'][change.kisao_id]
+        value = change.new_value
+        if param_specs['type'] == ValueType.float:
+            value = float(value)
+        elif param_specs['type'] == ValueType.integer:
+            value = int(value)
+        elif param_specs['type'] == ValueType.boolean:
+            value = value.lower() in ['1', 'true']
+        add_solver_property(param_specs['opencor_id'], value)
+
+
+def load_pooled_opencor_simulation(task, variables, pool):
+    """ Get an OpenCOR simulation from a pool of opened simulations, or load it if the pool doesn't contain
+    a simulation of the model of the task with the same algorithm. Simulations obtained from the pool are
+    checked out of the pool (:obj:`SimulationPool.checkout`), so that they can't be evicted while they are in use,
+    and they are reset and reconfigured for the simulation of the task. Callers should return simulations to the pool
+    (:obj:`SimulationPool.set`) once they are done with them.
+
+    Args:
+        task (:obj:`Task`): SED task
+        variables (:obj:`list` of :obj:`Variable`): SED variables
+        pool (:obj:`SimulationPool`): pool of opened OpenCOR simulations
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`PythonQt.private.SimulationSupport.Simulation`: OpenCOR simulation
+            * :obj:`str`: key of the simulation in the pool
+            * :obj:`bool`: whether the simulation was obtained from the pool
+    """
+    key = get_simulation_pool_key(task.model.source, task.simulation.algorithm)
+
+    opencor_sim = pool.checkout(key)
+    if opencor_sim is None:
+        return load_opencor_simulation(task, variables), key, False
+
+    reset_opencor_simulation(opencor_sim)
+    configure_opencor_simulation(opencor_sim, task.simulation)
+    return opencor_sim, key, True
+
+
+def configure_opencor_simulation(opencor_sim, simulation, recompute=True):
+    """ Configure the time course of an OpenCOR simulation to record its outputs
+
+    The computed constants and algebraic variables are recomputed at the initial time of the simulation, regardless
+    of whether it is a new simulation or a simulation from the pool (:obj:`load_pooled_opencor_simulation`).
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation instructions for OpenCOR
+        recompute (:obj:`bool`, optional): whether to recompute the computed constants and algebraic variables of the
+            simulation at its initial time
+    """
+    opencor_data = opencor_sim.data()
+    if recompute:
+        opencor_data.setStartingPoint(simulation.initial_time, True)
+    opencor_data.setStartingPoint(simulation.output_start_time, False)
+    opencor_data.setEndingPoint(simulation.output_end_time)
+    opencor_data.setPointInterval(
+        (simulation.output_end_time - simulation.output_start_time) / simulation.number_of_steps)
+
+
+def run_opencor_simulation(opencor_sim, simulation):
+    """ Execute an OpenCOR simulation from the current values of its states
+
+    Simulations whose outputs start after their initial times are executed in two phases. First, the simulation is
+    integrated from its initial time to the output start time with a single output interval, so that OpenCOR
+    doesn't record the transient. Second, the results of the transient are discarded, and the simulation is
+    integrated over its output interval, starting from the final values of the states of the transient.
+
+    Before the simulation is executed, its computed constants and algebraic variables are recomputed at its initial
+    time from the current values of its constants and states, so that they reflect values which were set after the
+    simulation was configured (e.g., by :obj:`set_opencor_simulation_values`).
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation instructions for OpenCOR
+
+    Returns:
+        :obj:`bool`: whether the simulation succeeded
+    """
+    if simulation.output_start_time > simulation.initial_time:
+        opencor_data = opencor_sim.data()
+        opencor_data.setStartingPoint(simulation.initial_time, True)
+        opencor_data.setEndingPoint(simulation.output_start_time)
+        opencor_data.setPointInterval(simulation.output_start_time - simulation.initial_time)
+        if not opencor_sim.run():
+            return False
+
+        return continue_opencor_simulation(opencor_sim, simulation)
+
+    configure_opencor_simulation(opencor_sim, simulation)
+    return opencor_sim.run()
+
+
+def continue_opencor_simulation(opencor_sim, simulation):
+    """ Execute an OpenCOR simulation from the final values of the states of its previous execution
+
+    The results of the previous execution are discarded. The time course of the simulation should begin where the
+    time course of the previous execution ended.
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): executed OpenCOR simulation
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation instructions for OpenCOR
+
+    Returns:
+        :obj:`bool`: whether the simulation succeeded
+    """
+    opencor_states_results = opencor_sim.results().states()
+    end_values = {name: opencor_states_results[name].values()[-1] for name in opencor_states_results}
+    opencor_sim.clear_results()
+
+    configure_opencor_simulation(opencor_sim, simulation, recompute=False)
+    opencor_states = opencor_sim.data().states()
+    for name, value in end_values.items():
+        opencor_states[name] = value
+
+    return opencor_sim.run()
+
+
+def reset_opencor_simulation(opencor_sim):
+    """ Discard the results of an OpenCOR simulation and reset its states and constants to their initial values
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+    """
+    opencor_sim.clear_results()
+    opencor_sim.reset(True)
+
+
+def set_opencor_simulation_values(opencor_sim, values):
+    """ Set the values of constants and the initial values of states of a compiled OpenCOR simulation
+
+    The computed constants and algebraic variables of the simulation are not recomputed until the simulation is
+    executed (:obj:`run_opencor_simulation`).
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        values (:obj:`dict`): dictionary that maps the name that OpenCOR uses to reference each constant or state
+            to its new value
+
+    Returns:
+        :obj:`bool`: whether all of the values could be set; no values are set unless all of the names refer to
+            constants or states of the simulation
+    """
+    opencor_data = opencor_sim.data()
+    opencor_states = opencor_data.states()
+    opencor_constants = opencor_data.constants()
+
+    if any(name not in opencor_states and name not in opencor_constants for name in values.keys()):
+        return False
+
+    for name, value in values.items():
+        if name in opencor_states:
+            opencor_states[name] = value
+        else:
+            opencor_constants[name] = value
+
+    return True
+
+
+def estimate_opencor_simulation_size(opencor_sim, simulation):
+    """ Estimate the memory that an OpenCOR simulation occupies once it has been executed
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation instructions for OpenCOR
+
+    Returns:
+        :obj:`int`: estimated size in bytes
+    """
+    opencor_data = opencor_sim.data()
+    num_variables = (
+        1
+        + len(opencor_data.states())
+        + len(opencor_data.rates())
+        + len(opencor_data.constants())
+        + len(opencor_data.algebraic())
+    )
+    return 8 * num_variables * (simulation.number_of_steps + 2)
+
+
+def get_opencor_solver_settings(algorithm):
+    """ Get the settings of the solver which executed an OpenCOR simulation
+
+    The name of the solver and its linear solver are the values configured by the executed algorithm, rather than
+    statistics of the execution. The Python binding of OpenCOR doesn't expose the counters of its solvers (e.g., the
+    number of internal steps), and the time of the execution is measured by the ``run`` phase of :obj:`PhaseTimer`.
+
+    Args:
+        algorithm (:obj:`Algorithm`): algorithm that OpenCOR executed (see :obj:`get_opencor_algorithm`)
+
+    Returns:
+        :obj:`dict`: name of the solver (``solver``), and, for solvers which have linear solvers, the name of the
+            configured linear solver (``configuredLinearSolver``)
+    """
+    alg_specs = KISAO_ALGORITHM_MAP[algorithm.kisao_id]
+    settings = {
+        'solver': alg_specs['opencor_solver_name'],
+    }
+
+    for param_kisao_id, param_specs in alg_specs['parameters'].items():
+        if param_specs['name'] == 'linear solver':
+            settings['configuredLinearSolver'] = param_specs['enum'][param_specs['default']].value
+            for change in algorithm.changes:
+                if change.kisao_id == param_kisao_id:
+                    settings['configuredLinearSolver'] = change.new_value
+
+    return settings
+
+
+def release_opencor_simulation_results(opencor_sim, simulation, variable_results):
+    """ Discard the results of an executed OpenCOR simulation once the results of the SED variables have been
+    extracted from them
+
+    OpenCOR records the trajectory of every state, rate, constant, and algebraic variable of a simulation. Only the
+    trajectories of the requested variables are needed, so the other trajectories are released immediately, rather
+    than when the simulation is next reset (e.g., while it is kept in a pool for reuse).
+
+    The Python API of OpenCOR can't restrict which trajectories are recorded, so all of them are still held in memory
+    while the simulation runs and while the results of the variables are extracted. Releasing them reduces the memory
+    which is held after the execution of a task, not the peak memory of the execution.
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): OpenCOR simulation
+        simulation (:obj:`UniformTimeCourseSimulation`): simulation instructions for OpenCOR
+        variable_results (:obj:`VariableResults`): results of the SED variables
+
+    Returns:
+        :obj:`dict`: estimated memory (in bytes) of the results recorded by OpenCOR, retained for the SED variables,
+            and released after the results of the SED variables were extracted
+    """
+    opencor_data = opencor_sim.data()
+    num_recorded_variables = (
+        1
+        + len(opencor_data.states())
+        + len(opencor_data.rates())
+        + len(opencor_data.constants())
+        + len(opencor_data.algebraic())
+    )
+    recorded_bytes = 8 * num_recorded_variables * (simulation.number_of_steps + 1)
+    retained_bytes = sum(result.nbytes for result in variable_results.values())
+
+    opencor_sim.clear_results()
+
+    return {
+        'recordedVariables': num_recorded_variables,
+        'retainedVariables': len(variable_results),
+        'recordedBytes': recorded_bytes,
+        'retainedBytes': retained_bytes,
+        'releasedAfterExtractionBytes': max(recorded_bytes - retained_bytes, 0),
+    }
+
+
 def validate_opencor_simulation(sim):
     """ Validate an OpenCOR simulation
 
@@ -418,7 +956,46 @@ def validate_opencor_simulation(sim):
         raise ValueError(msg)
 
 
-def get_results_from_opencor_simulation(opencor_sim, sed_task, sed_variables, opencor_variable_names):
+def get_opencor_results_index(opencor_sim):
+    """ Get an index from the name that OpenCOR uses to reference each variable of a simulation to the group of
+    results (``voi``, ``states``, ``rates``, ``constants``, or ``algebraic``) which contains its trajectory
+
+    Args:
+        opencor_sim (:obj:`PythonQt.private.SimulationSupport.Simulation`): executed OpenCOR simulation
+
+    Returns:
+        :obj:`dict`: dictionary that maps the name of each variable to the name of its group of results
+    """
+    opencor_results = opencor_sim.results()
+
+    index = {}
+    for group in ['algebraic', 'constants', 'rates', 'states']:
+        for name in getattr(opencor_results, group)():
+            index[name] = group
+    index[opencor_results.voi().uri()] = 'voi'
+    return index
+
+
+def get_opencor_result_window(values, num_points):
+    """ Get the last points of the trajectory of a variable
+
+    If NumPy owns the memory of the trajectory (i.e., OpenCOR already copied it), the entire trajectory is
+    returned without copying it. Otherwise, the window is copied once, either to release the remainder of the
+    trajectory or because the trajectory is a view of memory which OpenCOR will reuse once its results are cleared.
+
+    Args:
+        values (:obj:`numpy.ndarray`): trajectory
+        num_points (:obj:`int`): number of points
+
+    Returns:
+        :obj:`numpy.ndarray`: last :obj:`num_points` points of the trajectory
+    """
+    if values.shape[0] == num_points and values.flags.owndata:
+        return values
+    return numpy.array(values[-num_points:])
+
+
+def get_results_from_opencor_simulation(opencor_sim, sed_task, sed_variables, opencor_variable_names, opencor_results_index=None):
     """ Get the results of SED variables from an OpenCOR simulation
 
     Args:
@@ -426,39 +1003,37 @@ def get_results_from_opencor_simulation(opencor_sim, sed_task, sed_variables, op
         sed_task (:obj:`Task`): requested SED task
         sed_variables (:obj:`list` of :obj:`Variable`): SED variables
         opencor_variable_names (:obj:`dict`): dictionary that maps the id of each SED variable to the name that OpenCOR uses to reference it)
+        opencor_results_index (:obj:`dict`, optional): index from the name of each variable of the simulation to its
+            group of results (see :obj:`get_opencor_results_index`)
 
     Returns:
         :obj:`VariableResults`: results of the SED variables
     """
+    if opencor_results_index is None:
+        opencor_results_index = get_opencor_results_index(opencor_sim)
+
     opencor_results = opencor_sim.results()
-    opencor_voi_results = opencor_results.voi()
-    opencor_states_results = opencor_results.states()
-    opencor_rates_results = opencor_results.rates()
-    opencor_constants_results = opencor_results.constants()
-    opencor_algebraic_results = opencor_results.algebraic()
+    opencor_groups = {}
+    num_points = sed_task.simulation.number_of_steps + 1
 
     sed_results = VariableResults()
     invalid_variables = []
     for sed_variable in sed_variables:
         opencor_name = opencor_variable_names[sed_variable.id]
+        group = opencor_results_index.get(opencor_name, None)
 
-        if opencor_name == opencor_voi_results.uri():
-            sed_results[sed_variable.id] = opencor_voi_results.values()[-(sed_task.simulation.number_of_steps + 1):]
-
-        elif opencor_name in opencor_states_results:
-            sed_results[sed_variable.id] = opencor_states_results[opencor_name].values()[-(sed_task.simulation.number_of_steps + 1):]
-
-        elif opencor_name in opencor_rates_results:
-            sed_results[sed_variable.id] = opencor_rates_results[opencor_name].values()[-(sed_task.simulation.number_of_steps + 1):]
-
-        elif opencor_name in opencor_constants_results:
-            sed_results[sed_variable.id] = opencor_constants_results[opencor_name].values()[-(sed_task.simulation.number_of_steps + 1):]
-
-        elif opencor_name in opencor_algebraic_results:
-            sed_results[sed_variable.id] = opencor_algebraic_results[opencor_name].values()[-(sed_task.simulation.number_of_steps + 1):]
+        if group is None:
+            invalid_variables.append('{}: {}'.format(sed_variable.id, sed_variable.target))
+            continue
 
+        if group == 'voi':
+            values = opencor_results.voi().values()
         else:
-            invalid_variables.append('{}: {}'.format(sed_variable.id, sed_variable.target))
+            if group not in opencor_groups:
+                opencor_groups[group] = getattr(opencor_results, group)()
+            values = opencor_groups[group][opencor_name].values()
+
+        sed_results[sed_variable.id] = get_opencor_result_window(values, num_points)
 
     if invalid_variables:
         msg = (
@@ -470,12 +1045,14 @@ def get_results_from_opencor_simulation(opencor_sim, sed_task, sed_variables, op
     return sed_results
 
 
-def log_opencor_execution(task, log):
+def log_opencor_execution(task, log, details=None):
     """ Log information about how OpenCOR was used to execute the simulation
 
     Args:
         task (:obj:`Task`): SED task
         log (:obj:`TaskLog`): execution log
+        details (:obj:`dict`, optional): additional information about the execution (e.g., usage of the pool
+            of opened simulations)
     """
     log.algorithm = task.simulation.algorithm.kisao_id
     log.simulator_details = {
@@ -485,6 +1062,8 @@ def log_opencor_execution(task, log):
             for change in task.simulation.algorithm.changes
         ],
     }
+    if details:
+        log.simulator_details.update(details)
 
 
 def get_mock_libcellml():
@@ -0,0 +1,180 @@
+""" Benchmark of the number of simulations per second which :obj:`biosimulators_opencor.ensemble.CompiledTask`
+achieves for optimizer loops, compared with executing each set of values of the parameters with
+:obj:`biosimulators_opencor.core.exec_sed_task`
+
+The simulations are benchmarked for the Lorenz model and for synthetic models of uncoupled ODEs with varying
+numbers of variables (see ``exec_sed_task_phases.py``). The results are printed as JSON, so that they can be saved and
+compared across commits.
+
+Usage::
+
+    python tests/benchmarks/compiled_task_simulate.py [--num-calls 1000] [--num-steps 100] [--synthetic-sizes 10 100]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor.core import exec_sed_task, preprocess_sed_task
+from biosimulators_opencor.ensemble import CompiledTask
+from biosimulators_utils.sedml.data_model import ModelAttributeChange
+from biosimulators_utils.warnings import BioSimulatorsWarning
+from exec_sed_task_phases import FIXTURES_DIRNAME, build_task, write_synthetic_model, get_commit
+import argparse
+import json
+import numpy
+import os
+import platform
+import shutil
+import tempfile
+import time
+import warnings
+
+
+def get_cases(dirname, synthetic_sizes, number_of_steps):
+    """ Get the tasks to benchmark, and the targets of their parameters
+
+    Args:
+        dirname (:obj:`str`): directory to save the synthetic models
+        synthetic_sizes (:obj:`list` of :obj:`int`): numbers of variables of the synthetic models
+        number_of_steps (:obj:`int`): number of steps of the simulations
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each case to its task, variables, targets of its parameters,
+            and the nominal values of its parameters
+    """
+    cellml_1_0 = 'http://www.cellml.org/cellml/1.0#'
+    target = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='{}']"
+
+    task, variables = build_task(os.path.join(FIXTURES_DIRNAME, 'lorenz.cellml'), cellml_1_0,
+                                 [('main', 't'), ('main', 'x'), ('main', 'y'), ('main', 'z')],
+                                 number_of_steps=number_of_steps)
+    cases = {
+        'lorenz': (task, variables, [target.format(name) for name in ['sigma', 'rho', 'beta']], [10., 28., 2.66667]),
+    }
+
+    for num_variables in synthetic_sizes:
+        filename = os.path.join(dirname, 'synthetic-{}.cellml'.format(num_variables))
+        task, variables = build_task(filename, cellml_1_0, write_synthetic_model(filename, num_variables),
+                                     number_of_steps=number_of_steps)
+        parameter_targets = [target.format('k_{}'.format(i_variable)) for i_variable in range(min(num_variables, 10))]
+        cases['synthetic-{}'.format(num_variables)] = (
+            task, variables, parameter_targets, [0.1 + i_variable / num_variables for i_variable in range(len(parameter_targets))])
+
+    return cases
+
+
+def get_calls_per_second(func, parameter_values):
+    """ Measure the number of calls of a function per second
+
+    Args:
+        func (:obj:`types.FunctionType`): function which executes a simulation for values of the parameters
+        parameter_values (:obj:`numpy.ndarray`): values of the parameters of each call
+
+    Returns:
+        :obj:`float`: number of calls per second
+    """
+    start = time.perf_counter()
+    for values in parameter_values:
+        func(values)
+    return parameter_values.shape[0] / (time.perf_counter() - start)
+
+
+def benchmark_task(task, variables, parameter_targets, nominal_values, num_calls=1000):
+    """ Measure the number of simulations per second of a task with :obj:`CompiledTask` and with :obj:`exec_sed_task`
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables
+        parameter_targets (:obj:`list` of :obj:`str`): targets of the parameters
+        nominal_values (:obj:`list` of :obj:`float`): nominal values of the parameters
+        num_calls (:obj:`int`, optional): number of simulations to execute with :obj:`CompiledTask`; a tenth as many
+            simulations are executed with :obj:`exec_sed_task`
+
+    Returns:
+        :obj:`dict`: numbers of simulations per second
+    """
+    random = numpy.random.RandomState(0)
+    parameter_values = numpy.array(nominal_values) * random.uniform(0.9, 1.1, (num_calls, len(nominal_values)))
+    namespaces = variables[0].target_namespaces
+
+    # execute each set of values as a task with changes to its model
+    preprocessed_task = preprocess_sed_task(task, variables)
+
+    def exec_task(values):
+        task.model.changes = [
+            ModelAttributeChange(target=target + '/@initial_value', target_namespaces=namespaces, new_value=str(value))
+            for target, value in zip(parameter_targets, values)
+        ]
+        exec_sed_task(task, variables, preprocessed_task=preprocessed_task)
+
+    exec_sed_task_calls_per_second = get_calls_per_second(exec_task, parameter_values[0:max(num_calls // 10, 1)])
+    task.model.changes = []
+
+    # execute each set of values with a compiled task
+    start = time.perf_counter()
+    with CompiledTask(task, variables, parameter_targets, preprocessed_task=preprocessed_task) as compiled_task:
+        compile_duration = time.perf_counter() - start
+
+        out = numpy.empty((len(variables), compiled_task.num_points))
+        compiled_task_calls_per_second = get_calls_per_second(
+            lambda values: compiled_task.simulate(values, out=out), parameter_values)
+
+    return {
+        'numVariables': len(variables),
+        'numParameters': len(parameter_targets),
+        'numPoints': task.simulation.number_of_steps + 1,
+        'compileDuration': compile_duration,
+        'callsPerSecond': {
+            'CompiledTask.simulate': compiled_task_calls_per_second,
+            'exec_sed_task': exec_sed_task_calls_per_second,
+        },
+        'speedup': compiled_task_calls_per_second / exec_sed_task_calls_per_second,
+    }
+
+
+def benchmark_compiled_task_simulate(num_calls=1000, number_of_steps=100, synthetic_sizes=(10, 100)):
+    """ Measure the number of simulations per second of each benchmarked task
+
+    Args:
+        num_calls (:obj:`int`, optional): number of simulations to execute with :obj:`CompiledTask`
+        number_of_steps (:obj:`int`, optional): number of steps of the simulations
+        synthetic_sizes (:obj:`list` of :obj:`int`, optional): numbers of variables of the synthetic models
+
+    Returns:
+        :obj:`dict`: numbers of simulations per second of each task, and the commit and platform which were benchmarked
+    """
+    dirname = tempfile.mkdtemp()
+    try:
+        cases = get_cases(dirname, synthetic_sizes, number_of_steps)
+        results = {
+            name: benchmark_task(task, variables, parameter_targets, nominal_values, num_calls=num_calls)
+            for name, (task, variables, parameter_targets, nominal_values) in cases.items()
+        }
+    finally:
+        shutil.rmtree(dirname)
+
+    return {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numCalls': num_calls,
+        'cases': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the simulations per second of compiled OpenCOR tasks.')
+    parser.add_argument('--num-calls', type=int, default=1000)
+    parser.add_argument('--num-steps', type=int, default=100)
+    parser.add_argument('--synthetic-sizes', type=int, nargs='*', default=[10, 100])
+    args = parser.parse_args()
+
+    # the warnings about the SED-ML files for OpenCOR are expected
+    warnings.simplefilter('ignore', BioSimulatorsWarning)
+    print(json.dumps(benchmark_compiled_task_simulate(args.num_calls, args.num_steps, args.synthetic_sizes), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+""" Micro-benchmarks of each phase of the execution of SED tasks (:obj:`biosimulators_opencor.core.exec_sed_task`)
+
+The phases are benchmarked for the Lorenz model, for a model which imports components from other files, for a DAE
+model, and for synthetic models of uncoupled ODEs with varying numbers of variables. The results are printed as JSON,
+so that they can be saved and compared across commits.
+
+Usage::
+
+    python tests/benchmarks/exec_sed_task_phases.py [--num-repeats 10] [--synthetic-sizes 10 100 1000] [--cold]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import algorithms
+from biosimulators_opencor.cache import (get_flattened_model_cache, get_model_index_cache,
+                                         get_parsed_model_cache, get_results_index_cache)
+from biosimulators_opencor.utils import (validate_task, validate_variable_xpaths, get_opencor_algorithm,
+                                         build_opencor_sedml_doc, save_task_to_opencor_sedml_file,
+                                         validate_opencor_simulation, run_opencor_simulation,
+                                         get_results_from_opencor_simulation)
+from biosimulators_utils.config import get_config
+from biosimulators_utils.sedml.data_model import (Task, Model, ModelLanguage, UniformTimeCourseSimulation,
+                                                  Algorithm, Variable)
+from biosimulators_utils.warnings import BioSimulatorsWarning
+import argparse
+import json
+import numpy
+import opencor
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import warnings
+
+FIXTURES_DIRNAME = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+PHASES = [
+    'validate_task',
+    'validate_variable_xpaths',
+    'get_opencor_algorithm',
+    'build_opencor_sedml_doc',
+    'save_task_to_opencor_sedml_file',
+    'open_simulation',
+    'run',
+    'get_results_from_opencor_simulation',
+]
+
+
+def build_task(model_source, namespace, variable_targets, output_end_time=10., number_of_steps=1000):
+    """ Build a task which simulates a model with CVODE, and variables for the task
+
+    Args:
+        model_source (:obj:`str`): path to the model
+        namespace (:obj:`str`): CellML namespace of the model
+        variable_targets (:obj:`list` of :obj:`tuple` of :obj:`str`): names of the component and variable of
+            each variable
+        output_end_time (:obj:`float`, optional): output end time
+        number_of_steps (:obj:`int`, optional): number of steps
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`Task`: task
+            * :obj:`list` of :obj:`Variable`: variables
+    """
+    task = Task(
+        id='task',
+        model=Model(id='model', source=os.path.abspath(model_source), language=ModelLanguage.CellML.value),
+        simulation=UniformTimeCourseSimulation(
+            id='simulation',
+            initial_time=0.,
+            output_start_time=0.,
+            output_end_time=output_end_time,
+            number_of_steps=number_of_steps,
+            algorithm=Algorithm(kisao_id='KISAO_0000019'),
+        ),
+    )
+
+    variables = [
+        Variable(
+            id='{}_{}'.format(component_name, variable_name),
+            target="/cellml:model/cellml:component[@name='{}']/cellml:variable[@name='{}']".format(component_name, variable_name),
+            target_namespaces={'cellml': namespace},
+            task=task,
+        )
+        for component_name, variable_name in variable_targets
+    ]
+
+    return task, variables
+
+
+def write_synthetic_model(filename, num_variables):
+    """ Write a CellML model of uncoupled exponential decays (``dx_i/dt = -k_i * x_i``)
+
+    Args:
+        filename (:obj:`str`): path to save the model
+        num_variables (:obj:`int`): number of states of the model
+
+    Returns:
+        :obj:`list` of :obj:`tuple` of :obj:`str`: names of the component and each variable of the model
+    """
+    variables = ['<variable name="t" units="dimensionless"/>']
+    equations = []
+    for i_variable in range(num_variables):
+        variables.append('<variable name="k_{0}" units="dimensionless" initial_value="{1}"/>'.format(
+            i_variable, 0.1 + i_variable / max(num_variables, 1)))
+        variables.append('<variable name="x_{}" units="dimensionless" initial_value="1.0"/>'.format(i_variable))
+        equations.append((
+            '<apply><eq/>'
+            '<apply><diff/><bvar><ci>t</ci></bvar><ci>x_{0}</ci></apply>'
+            '<apply><times/><apply><minus/><ci>k_{0}</ci></apply><ci>x_{0}</ci></apply>'
+            '</apply>'
+        ).format(i_variable))
+
+    with open(filename, 'w') as file:
+        file.write((
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<model xmlns="http://www.cellml.org/cellml/1.0#" name="synthetic">\n'
+            '  <component name="main">\n'
+            '    {}\n'
+            '    <math xmlns="http://www.w3.org/1998/Math/MathML">{}</math>\n'
+            '  </component>\n'
+            '</model>\n'
+        ).format('\n    '.join(variables), ''.join(equations)))
+
+    return [('main', 't')] + [('main', 'x_{}'.format(i_variable)) for i_variable in range(num_variables)]
+
+
+def get_cases(dirname, synthetic_sizes):
+    """ Get the tasks to benchmark
+
+    Args:
+        dirname (:obj:`str`): directory to save the synthetic models
+        synthetic_sizes (:obj:`list` of :obj:`int`): numbers of variables of the synthetic models
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each case to its task and variables
+    """
+    cellml_1_0 = 'http://www.cellml.org/cellml/1.0#'
+    cellml_1_1 = 'http://www.cellml.org/cellml/1.1#'
+
+    cases = {
+        'lorenz': build_task(
+            os.path.join(FIXTURES_DIRNAME, 'lorenz.cellml'), cellml_1_0,
+            [('main', 't'), ('main', 'x'), ('main', 'y'), ('main', 'z')]),
+        'imported-model': build_task(
+            os.path.join(FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca', 'HATPase_test.cellml'), cellml_1_1,
+            [('environment', 'time'), ('concentrations', 'pH_ext'), ('fluxes', 'plot')],
+            output_end_time=50.),
+        'dae': build_task(
+            os.path.join(FIXTURES_DIRNAME, 'parabola_variant_dae_model.cellml'), cellml_1_0,
+            [('main', 'time'), ('main', 'x'), ('main', 'y'), ('main', 'z')]),
+    }
+
+    for num_variables in synthetic_sizes:
+        filename = os.path.join(dirname, 'synthetic-{}.cellml'.format(num_variables))
+        cases['synthetic-{}'.format(num_variables)] = build_task(
+            filename, cellml_1_0, write_synthetic_model(filename, num_variables))
+
+    return cases
+
+
+def clear_caches():
+    """ Clear the caches of parsed models, indices and algorithms, so that each phase is measured cold """
+    get_parsed_model_cache().clear()
+    get_flattened_model_cache().clear()
+    get_model_index_cache().clear()
+    get_results_index_cache().clear()
+    algorithms.clear_algorithm_tables()
+
+
+def benchmark_task(task, variables, num_repeats=10, cold=False):
+    """ Measure the time of each phase of the execution of a task
+
+    Args:
+        task (:obj:`Task`): task
+        variables (:obj:`list` of :obj:`Variable`): variables
+        num_repeats (:obj:`int`, optional): number of times to measure each phase
+        cold (:obj:`bool`, optional): whether to clear the caches before each repetition
+
+    Returns:
+        :obj:`dict`: minimum, median, and maximum times (in seconds) of each phase
+    """
+    config = get_config()
+    durations = {phase: [] for phase in PHASES}
+
+    def measure(phase, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        durations[phase].append(time.perf_counter() - start)
+        return result
+
+    for _ in range(num_repeats):
+        if cold:
+            clear_caches()
+
+        opencor_task, model_etree, variable_names = measure('validate_task', validate_task, task, variables, config=config)
+        measure('validate_variable_xpaths', validate_variable_xpaths, variables, model_etree)
+        measure('get_opencor_algorithm', get_opencor_algorithm, task.simulation.algorithm, config=config)
+        measure('build_opencor_sedml_doc', build_opencor_sedml_doc, opencor_task, variables)
+        sedml_filename = measure('save_task_to_opencor_sedml_file', save_task_to_opencor_sedml_file, opencor_task, variables)
+
+        try:
+            opencor_sim = measure('open_simulation', opencor.open_simulation, sedml_filename)
+        finally:
+            os.remove(sedml_filename)
+
+        try:
+            validate_opencor_simulation(opencor_sim)
+            if not measure('run', run_opencor_simulation, opencor_sim, opencor_task.simulation):
+                raise RuntimeError('Simulation of `{}` failed.'.format(task.model.source))
+            measure('get_results_from_opencor_simulation', get_results_from_opencor_simulation,
+                    opencor_sim, opencor_task, variables, variable_names)
+        finally:
+            opencor.close_simulation(opencor_sim)
+
+    return {
+        'numVariables': len(variables),
+        'numPoints': task.simulation.number_of_steps + 1,
+        'phases': {
+            phase: {
+                'min': min(phase_durations),
+                'median': float(numpy.median(phase_durations)),
+                'max': max(phase_durations),
+            }
+            for phase, phase_durations in durations.items()
+        },
+    }
+
+
+def get_commit():
+    """ Get the git commit of the working tree of the package
+
+    Returns:
+        :obj:`str`: hash of the commit, or :obj:`None` if it can't be determined
+    """
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(__file__),
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.decode().strip()
+
+
+def benchmark_exec_sed_task_phases(num_repeats=10, synthetic_sizes=(10, 100, 1000), cold=False):
+    """ Measure the time of each phase of the execution of each benchmarked task
+
+    Args:
+        num_repeats (:obj:`int`, optional): number of times to measure each phase
+        synthetic_sizes (:obj:`list` of :obj:`int`, optional): numbers of variables of the synthetic models
+        cold (:obj:`bool`, optional): whether to clear the caches before each repetition
+
+    Returns:
+        :obj:`dict`: times of each phase of each task, and the commit and platform which were benchmarked
+    """
+    dirname = tempfile.mkdtemp()
+    try:
+        cases = get_cases(dirname, synthetic_sizes)
+        results = {
+            name: benchmark_task(task, variables, num_repeats=num_repeats, cold=cold)
+            for name, (task, variables) in cases.items()
+        }
+    finally:
+        shutil.rmtree(dirname)
+
+    return {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numRepeats': num_repeats,
+        'cold': cold,
+        'cases': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark each phase of the execution of SED tasks with OpenCOR.')
+    parser.add_argument('--num-repeats', type=int, default=10)
+    parser.add_argument('--synthetic-sizes', type=int, nargs='*', default=[10, 100, 1000])
+    parser.add_argument('--cold', action='store_true', help='clear the caches before each repetition')
+    args = parser.parse_args()
+
+    # the warnings about the SED-ML files for OpenCOR are expected
+    warnings.simplefilter('ignore', BioSimulatorsWarning)
+    print(json.dumps(benchmark_exec_sed_task_phases(args.num_repeats, args.synthetic_sizes, args.cold), indent=2))
+
+
+if __name__ == '__main__':
+    main()
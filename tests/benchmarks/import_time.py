@@ -0,0 +1,70 @@
+""" Benchmark of the time to import the package, its methods for executing tasks, and its command-line application,
+relative to the time to import the modules of BioSimulators utils which they need
+
+Each module is imported several times in fresh Python processes, and the minimum durations are compared with the
+minimum duration to import the reference modules of BioSimulators utils on the same machine. Because the ratios
+don't depend on the speed of the machine, they can be compared across machines and commits. The test suite fails if
+a ratio exceeds its maximum (see ``tests/test_import_time.py``). The results are printed as JSON.
+
+Usage::
+
+    python tests/benchmarks/import_time.py [--num-repeats 5]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from exec_sed_task_phases import get_commit
+import argparse
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from test_import_time import REFERENCE_MODULES, MAX_IMPORT_TIME_RATIOS, get_import_time  # noqa: E402
+
+
+def benchmark_import_time(num_repeats=5):
+    """ Measure the time to import each benchmarked module, and its ratio to the time to import the reference modules
+
+    Args:
+        num_repeats (:obj:`int`, optional): number of times to measure the time to import each module
+
+    Returns:
+        :obj:`dict`: times to import each module and the reference modules, their ratios, the maximum ratios, the
+            modules whose ratios exceed their maximums, and the commit and platform which were benchmarked
+    """
+    reference_duration = get_import_time(REFERENCE_MODULES, num_repeats=num_repeats)
+    durations = {module: get_import_time([module], num_repeats=num_repeats) for module in MAX_IMPORT_TIME_RATIOS}
+    ratios = {module: duration / reference_duration for module, duration in durations.items()}
+
+    return {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numRepeats': num_repeats,
+        'referenceModules': REFERENCE_MODULES,
+        'referenceDuration': reference_duration,
+        'durations': durations,
+        'ratios': ratios,
+        'maxRatios': MAX_IMPORT_TIME_RATIOS,
+        'regressions': [module for module, ratio in ratios.items() if ratio > MAX_IMPORT_TIME_RATIOS[module]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the time to import the package, relative to BioSimulators utils.')
+    parser.add_argument('--num-repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    results = benchmark_import_time(args.num_repeats)
+    print(json.dumps(results, indent=2))
+    if results['regressions']:
+        sys.exit('Importing {} is slower than allowed.'.format(', '.join(results['regressions'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+""" Micro-benchmark of the extraction of the results of SED variables from OpenCOR simulations of models with
+thousands of variables
+
+Usage::
+
+    python tests/benchmarks/results_extraction.py [--num-variables 5000] [--num-points 1001] [--num-repeats 20]
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor.utils import get_opencor_results_index, get_results_from_opencor_simulation
+from biosimulators_utils.sedml.data_model import Task, UniformTimeCourseSimulation, Variable
+import argparse
+import json
+import numpy
+import time
+
+
+class OpenCorValues(object):
+    """ Trajectory of a variable of a simulated OpenCOR simulation, which is copied each time it is read """
+
+    def __init__(self, name, values):
+        self._name = name
+        self._values = values
+
+    def uri(self):
+        return self._name
+
+    def values(self):
+        return numpy.array(self._values)
+
+
+class OpenCorResults(object):
+    """ Results of a simulated OpenCOR simulation """
+
+    def __init__(self, num_variables, num_points):
+        self._voi = OpenCorValues('main/t', numpy.linspace(0., 1., num_points))
+        self._groups = {group: {} for group in ['states', 'rates', 'constants', 'algebraic']}
+        for i_variable in range(num_variables):
+            group = ['states', 'rates', 'constants', 'algebraic'][i_variable % 4]
+            name = 'component_{}/variable_{}'.format(i_variable // 100, i_variable)
+            self._groups[group][name] = OpenCorValues(name, numpy.random.rand(num_points))
+
+    def voi(self):
+        return self._voi
+
+    def states(self):
+        return dict(self._groups['states'])
+
+    def rates(self):
+        return dict(self._groups['rates'])
+
+    def constants(self):
+        return dict(self._groups['constants'])
+
+    def algebraic(self):
+        return dict(self._groups['algebraic'])
+
+
+class OpenCorSimulation(object):
+    """ Simulated OpenCOR simulation """
+
+    def __init__(self, num_variables, num_points):
+        self._results = OpenCorResults(num_variables, num_points)
+
+    def results(self):
+        return self._results
+
+
+def benchmark_results_extraction(num_variables=5000, num_points=1001, num_repeats=20):
+    """ Measure the time to extract the results of all of the variables of a simulation
+
+    Args:
+        num_variables (:obj:`int`, optional): number of variables of the simulation
+        num_points (:obj:`int`, optional): number of recorded points
+        num_repeats (:obj:`int`, optional): number of times to measure the time
+
+    Returns:
+        :obj:`dict`: minimum times (in seconds) to build the index of the results and to extract the results of the
+            variables, overall and per variable
+    """
+    opencor_sim = OpenCorSimulation(num_variables, num_points)
+    task = Task(simulation=UniformTimeCourseSimulation(number_of_steps=num_points - 1))
+    names = list(get_opencor_results_index(opencor_sim).keys())
+    variables = [Variable(id='var_{}'.format(i_name), task=task) for i_name in range(len(names))]
+    variable_names = {variable.id: name for variable, name in zip(variables, names)}
+
+    index_durations = []
+    extraction_durations = []
+    for _ in range(num_repeats):
+        start = time.perf_counter()
+        index = get_opencor_results_index(opencor_sim)
+        index_durations.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        get_results_from_opencor_simulation(opencor_sim, task, variables, variable_names, opencor_results_index=index)
+        extraction_durations.append(time.perf_counter() - start)
+
+    return {
+        'numVariables': len(variables),
+        'numPoints': num_points,
+        'indexDuration': min(index_durations),
+        'extractionDuration': min(extraction_durations),
+        'extractionDurationPerVariable': min(extraction_durations) / len(variables),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the extraction of the results of OpenCOR simulations.')
+    parser.add_argument('--num-variables', type=int, default=5000)
+    parser.add_argument('--num-points', type=int, default=1001)
+    parser.add_argument('--num-repeats', type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(benchmark_results_extraction(args.num_variables, args.num_points, args.num_repeats), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+""" Tests of the memoized substitutions of algorithms and translations of the values of their parameters
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import algorithms
+from biosimulators_opencor.utils import get_opencor_parameter_value
+from biosimulators_utils.data_model import ValueType
+from kisao.data_model import AlgorithmSubstitutionPolicy
+from kisao.exceptions import AlgorithmCannotBeSubstitutedException
+from kisao.warnings import AlgorithmSubstitutedWarning
+from unittest import mock
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class AlgorithmTablesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        algorithms.clear_algorithm_tables()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+        algorithms.clear_algorithm_tables()
+
+    def test_get_substitute_algorithm_id(self):
+        self.assertEqual(algorithms.get_substitute_algorithm_id('KISAO_0000019', AlgorithmSubstitutionPolicy.NONE), 'KISAO_0000019')
+
+        with mock.patch('biosimulators_opencor.algorithms.get_preferred_substitute_algorithm_by_ids') as resolve:
+            self.assertEqual(algorithms.get_substitute_algorithm_id('KISAO_0000019', AlgorithmSubstitutionPolicy.NONE),
+                             'KISAO_0000019')
+            resolve.assert_not_called()
+
+        for _ in range(2):
+            with self.assertWarns(AlgorithmSubstitutedWarning):
+                self.assertEqual(algorithms.get_substitute_algorithm_id('KISAO_0000088', AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES),
+                                 'KISAO_0000019')
+
+        for _ in range(2):
+            with self.assertRaises(AlgorithmCannotBeSubstitutedException):
+                algorithms.get_substitute_algorithm_id('KISAO_0000088', AlgorithmSubstitutionPolicy.NONE)
+
+    def test_get_memoized_parameter_value(self):
+        get_value = mock.Mock(side_effect=get_opencor_parameter_value)
+        for _ in range(2):
+            self.assertEqual(algorithms.get_memoized_parameter_value('1e-3', ValueType.float, None, get_value), (True, '1e-3'))
+            self.assertEqual(algorithms.get_memoized_parameter_value('x', ValueType.float, None, get_value), (False, None))
+        self.assertEqual(get_value.call_count, 2)
+
+    def test_save_load_algorithm_tables(self):
+        algorithms.build_algorithm_tables(get_opencor_parameter_value)
+        filename = os.path.join(self.dirname, 'tables.json')
+        algorithms.save_algorithm_tables(filename)
+
+        with open(filename, 'r') as file:
+            tables = json.load(file)
+        self.assertEqual(len(tables['substitutions']) % len(AlgorithmSubstitutionPolicy), 0)
+        self.assertIn({
+            'kisaoId': 'KISAO_0000019',
+            'substitutionPolicy': 'NONE',
+            'substitute': 'KISAO_0000019',
+            'error': None,
+            'warnings': [],
+        }, tables['substitutions'])
+
+        algorithms.clear_algorithm_tables()
+        with mock.patch.dict('os.environ', {'ALGORITHM_TABLES_FILENAME': filename}):
+            with mock.patch('biosimulators_opencor.algorithms.get_preferred_substitute_algorithm_by_ids') as resolve:
+                with self.assertWarns(AlgorithmSubstitutedWarning):
+                    self.assertEqual(algorithms.get_substitute_algorithm_id('KISAO_0000088', AlgorithmSubstitutionPolicy.SIMILAR_VARIABLES),
+                                     'KISAO_0000019')
+                with self.assertRaises(AlgorithmCannotBeSubstitutedException):
+                    algorithms.get_substitute_algorithm_id('KISAO_0000088', AlgorithmSubstitutionPolicy.NONE)
+                resolve.assert_not_called()
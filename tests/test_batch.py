@@ -0,0 +1,108 @@
+""" Tests of the batch execution of archives
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import batch
+from biosimulators_opencor import parallel
+from biosimulators_utils.log.data_model import CombineArchiveLog, Status
+from unittest import mock
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import yaml
+
+
+def exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=None, simulator_config=None):
+    if 'invalid' in archive_filename:
+        raise ValueError('Archive is invalid')
+    if simulator_config.NUM_WORKERS != 1:
+        raise ValueError('Archives should be executed serially by workers')
+    os.makedirs(out_dir)
+    return None, CombineArchiveLog(status=Status.SUCCEEDED)
+
+
+def exec_sedml_docs_in_combine_archive_crashing_b(archive_filename, out_dir, config=None, simulator_config=None):
+    if os.path.basename(archive_filename) == 'b.omex':
+        time.sleep(0.1)
+        os._exit(1)
+    time.sleep(0.2)
+    return exec_sedml_docs_in_combine_archive(archive_filename, out_dir, config=config, simulator_config=simulator_config)
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.archives_dirname = os.path.join(self.dirname, 'archives')
+        os.makedirs(os.path.join(self.archives_dirname, 'group'))
+        for filename in ['a.omex', 'b.omex', os.path.join('group', 'invalid.omex'), 'notes.txt']:
+            with open(os.path.join(self.archives_dirname, filename), 'w'):
+                pass
+        parallel.shutdown_worker_pool()
+
+    def tearDown(self):
+        parallel.shutdown_worker_pool()
+        shutil.rmtree(self.dirname)
+
+    def test_get_archive_filenames(self):
+        a = os.path.join(self.archives_dirname, 'a.omex')
+        b = os.path.join(self.archives_dirname, 'b.omex')
+        invalid = os.path.join(self.archives_dirname, 'group', 'invalid.omex')
+
+        self.assertEqual(batch.get_archive_filenames([self.archives_dirname]), [a, b, invalid])
+        self.assertEqual(batch.get_archive_filenames([b, os.path.join(self.archives_dirname, '*.omex')]), [b, a])
+
+        with self.assertRaisesRegex(ValueError, 'is not a path'):
+            batch.get_archive_filenames([os.path.join(self.archives_dirname, '*.sedml')])
+
+    def test_get_archive_out_dirs(self):
+        out_dirs = batch.get_archive_out_dirs(batch.get_archive_filenames([self.archives_dirname]), 'out')
+        self.assertEqual(out_dirs, ['out/a', 'out/b', os.path.join('out', 'group', 'invalid')])
+
+    def test_main(self):
+        out_dir = os.path.join(self.dirname, 'out')
+        with mock.patch('biosimulators_opencor.core.exec_sedml_docs_in_combine_archive', exec_sedml_docs_in_combine_archive):
+            with mock.patch('sys.stdout'):
+                exit_code = batch.main([self.archives_dirname, '-o', out_dir, '-n', '2'])
+        self.assertEqual(exit_code, 1)
+
+        self.assertTrue(os.path.isdir(os.path.join(out_dir, 'a')))
+        self.assertTrue(os.path.isdir(os.path.join(out_dir, 'b')))
+
+        with open(os.path.join(out_dir, batch.SUMMARY_FILENAME), 'r') as file:
+            summary = yaml.load(file, Loader=yaml.SafeLoader)
+        self.assertEqual(summary['statusCounts'], {'SUCCEEDED': 2, 'FAILED': 1})
+        self.assertEqual([archive['status'] for archive in summary['archives']], ['SUCCEEDED', 'SUCCEEDED', 'FAILED'])
+        self.assertEqual(summary['archives'][2]['exception'], 'ValueError: Archive is invalid')
+        self.assertGreaterEqual(summary['archives'][0]['duration'], 0.)
+
+    def test_exec_archive_in_worker(self):
+        out_dir = os.path.join(self.dirname, 'out')
+        with mock.patch('biosimulators_opencor.core.exec_sedml_docs_in_combine_archive', exec_sedml_docs_in_combine_archive):
+            with mock.patch.dict('os.environ', {'NUM_WORKERS': '4'}):
+                summary = batch.exec_archive_in_worker(os.path.join(self.archives_dirname, 'a.omex'), out_dir)
+
+                # the environment of the worker is not changed
+                self.assertEqual(os.environ['NUM_WORKERS'], '4')
+        self.assertEqual(summary['status'], 'SUCCEEDED')
+
+    def test_exec_archives_in_batch_with_crashed_worker(self):
+        archive_filenames = batch.get_archive_filenames([self.archives_dirname])
+        with mock.patch('biosimulators_opencor.core.exec_sedml_docs_in_combine_archive', side_effect=lambda *args, **kwargs: os._exit(1)):
+            summaries = batch.exec_archives_in_batch(archive_filenames, os.path.join(self.dirname, 'out'), num_workers=1)
+        self.assertEqual([summary['status'] for summary in summaries], ['FAILED'] * 3)
+        self.assertIn('BrokenProcessPool', summaries[0]['exception'])
+
+    def test_exec_archives_in_batch_with_crashed_worker_only_fails_crashing_archive(self):
+        archive_filenames = batch.get_archive_filenames([self.archives_dirname])
+        out_dir = os.path.join(self.dirname, 'out')
+        with mock.patch('biosimulators_opencor.core.exec_sedml_docs_in_combine_archive', exec_sedml_docs_in_combine_archive_crashing_b):
+            summaries = batch.exec_archives_in_batch(archive_filenames, out_dir, num_workers=2)
+        self.assertEqual([summary['status'] for summary in summaries], ['SUCCEEDED', 'FAILED', 'FAILED'])
+        self.assertIn('BrokenProcessPool', summaries[1]['exception'])
+        self.assertEqual(summaries[2]['exception'], 'ValueError: Archive is invalid')
@@ -0,0 +1,222 @@
+""" Tests of the caches
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import cache
+from biosimulators_opencor.config import SimulatorConfig
+from biosimulators_utils.sedml.data_model import Algorithm, AlgorithmParameterChange
+from unittest import mock
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class LruCacheTestCase(unittest.TestCase):
+    def test_get_set(self):
+        lru_cache = cache.LruCache(max_entries=2, max_bytes=100)
+        self.assertEqual(lru_cache.get('a'), None)
+        self.assertTrue(lru_cache.set('a', 1, size=10))
+        self.assertTrue(lru_cache.set('b', 2, size=10))
+        self.assertEqual(lru_cache.get('a'), 1)
+        self.assertTrue(lru_cache.set('c', 3, size=10))
+
+        self.assertIn('a', lru_cache)
+        self.assertNotIn('b', lru_cache)
+        self.assertIn('c', lru_cache)
+        self.assertEqual(lru_cache.get_stats(), {
+            'entries': 2,
+            'bytes': 20,
+            'maxEntries': 2,
+            'maxBytes': 100,
+            'hits': 1,
+            'misses': 1,
+            'evictions': 1,
+        })
+
+    def test_byte_limit(self):
+        evicted = []
+        lru_cache = cache.LruCache(max_entries=10, max_bytes=100)
+        lru_cache.on_evict = lambda key, value: evicted.append(key)
+
+        lru_cache.set('a', 1, size=60)
+        lru_cache.set('b', 2, size=30)
+        lru_cache.set('c', 3, size=30)
+        self.assertEqual(evicted, ['a'])
+        self.assertEqual(lru_cache.num_bytes, 60)
+
+        self.assertFalse(lru_cache.set('d', 4, size=200))
+        self.assertEqual(evicted, ['a', 'd'])
+        self.assertEqual(len(lru_cache), 2)
+
+        lru_cache.resize(1, 100)
+        self.assertEqual(evicted, ['a', 'd', 'b'])
+
+        lru_cache.clear()
+        self.assertEqual(evicted, ['a', 'd', 'b', 'c'])
+        self.assertEqual(len(lru_cache), 0)
+        self.assertEqual(lru_cache.num_bytes, 0)
+
+    def test_disabled(self):
+        lru_cache = cache.LruCache(max_entries=0, max_bytes=100)
+        self.assertFalse(lru_cache.set('a', 1))
+        self.assertEqual(lru_cache.get('a'), None)
+
+    def test_pop(self):
+        lru_cache = cache.LruCache(max_entries=2, max_bytes=100)
+        lru_cache.set('a', 1, size=10)
+        self.assertEqual(lru_cache.pop('a'), 1)
+        self.assertEqual(lru_cache.pop('a'), None)
+        self.assertEqual(lru_cache.num_bytes, 0)
+
+    def test_checkout(self):
+        lru_cache = cache.LruCache(max_entries=1, max_bytes=100)
+        lru_cache.set('a', 1, size=10)
+        self.assertEqual(lru_cache.checkout('a'), 1)
+        self.assertEqual(lru_cache.checkout('a'), None)
+        self.assertNotIn('a', lru_cache)
+        self.assertEqual(lru_cache.num_bytes, 0)
+        self.assertEqual(lru_cache.get_stats()['hits'], 1)
+        self.assertEqual(lru_cache.get_stats()['misses'], 1)
+
+
+class SimulationPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_simulation_pool(self):
+        pool = cache.get_simulation_pool(SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=3, SIMULATION_POOL_MAX_BYTES=1000))
+        self.assertIs(cache.get_simulation_pool(), pool)
+        self.assertEqual(pool.max_entries, int(os.environ.get('SIMULATION_POOL_MAX_ENTRIES', 8)))
+
+        pool = cache.get_simulation_pool(SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=3, SIMULATION_POOL_MAX_BYTES=1000))
+        self.assertEqual(pool.max_entries, 3)
+        self.assertEqual(pool.max_bytes, 1000)
+
+    def test_evicted_simulations_are_closed(self):
+        opencor = mock.Mock()
+        pool = cache.SimulationPool(max_entries=1, max_bytes=1000)
+        with mock.patch.dict('sys.modules', opencor=opencor):
+            pool.set('a', 'sim-a')
+            pool.set('b', 'sim-b')
+        opencor.close_simulation.assert_called_once_with('sim-a')
+
+    def test_checked_out_simulations_are_not_closed(self):
+        opencor = mock.Mock()
+        pool = cache.SimulationPool(max_entries=1, max_bytes=1000)
+        with mock.patch.dict('sys.modules', opencor=opencor):
+            pool.set('a', 'sim-a')
+            self.assertEqual(pool.checkout('a'), 'sim-a')
+            pool.set('b', 'sim-b')
+            opencor.close_simulation.assert_not_called()
+
+            pool.set('a', 'sim-a')
+        opencor.close_simulation.assert_called_once_with('sim-b')
+
+    def test_get_simulation_pool_key(self):
+        model_filename_1 = os.path.join(self.dirname, 'model-1.cellml')
+        model_filename_2 = os.path.join(self.dirname, 'model-2.cellml')
+        with open(model_filename_1, 'w') as file:
+            file.write('<model/>')
+        with open(model_filename_2, 'w') as file:
+            file.write('<model/>')
+
+        alg_1 = Algorithm(kisao_id='KISAO_0000019', changes=[
+            AlgorithmParameterChange(kisao_id='KISAO_0000209', new_value='1e-6'),
+        ])
+        alg_2 = Algorithm(kisao_id='KISAO_0000019', changes=[
+            AlgorithmParameterChange(kisao_id='KISAO_0000209', new_value='1e-8'),
+        ])
+
+        self.assertEqual(cache.get_simulation_pool_key(model_filename_1, alg_1),
+                         cache.get_simulation_pool_key(model_filename_2, alg_1))
+        self.assertNotEqual(cache.get_simulation_pool_key(model_filename_1, alg_1),
+                            cache.get_simulation_pool_key(model_filename_1, alg_2))
+
+        with open(model_filename_2, 'w') as file:
+            file.write('<model name="other"/>')
+        self.assertNotEqual(cache.get_simulation_pool_key(model_filename_1, alg_1),
+                            cache.get_simulation_pool_key(model_filename_2, alg_1))
+
+    def test_get_simulation_pool_key_includes_imported_models(self):
+        model_filename = os.path.join(self.dirname, 'model.cellml')
+        imported_model_filename = os.path.join(self.dirname, 'imported.cellml')
+        with open(model_filename, 'w') as file:
+            file.write(('<model xmlns="http://www.cellml.org/cellml/1.1#" xmlns:xlink="http://www.w3.org/1999/xlink" name="model">'
+                        '<import xlink:href="imported.cellml"><component name="a" component_ref="a"/></import>'
+                        '</model>'))
+        with open(imported_model_filename, 'w') as file:
+            file.write('<model xmlns="http://www.cellml.org/cellml/1.1#" name="imported"><component name="a"/></model>')
+
+        alg = Algorithm(kisao_id='KISAO_0000019')
+        key = cache.get_simulation_pool_key(model_filename, alg)
+        self.assertEqual(cache.get_simulation_pool_key(model_filename, alg), key)
+
+        # ensure that the modification time of the imported model changes
+        stat = os.stat(imported_model_filename)
+        with open(imported_model_filename, 'w') as file:
+            file.write('<model xmlns="http://www.cellml.org/cellml/1.1#" name="imported"><component name="b"/></model>')
+        os.utime(imported_model_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertNotEqual(cache.get_simulation_pool_key(model_filename, alg), key)
+
+
+class ParsedModelCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_model(self):
+        model_filename_1 = os.path.join(self.dirname, 'model-1.cellml')
+        model_filename_2 = os.path.join(self.dirname, 'model-2.cellml')
+        with open(model_filename_1, 'w') as file:
+            file.write('<model name="model"/>')
+        with open(model_filename_2, 'w') as file:
+            file.write('<model name="model"/>')
+
+        model_cache = cache.ParsedModelCache(max_entries=2, max_bytes=1000)
+        model_etree, content_hash = model_cache.get_model(model_filename_1)
+        self.assertEqual(model_etree.getroot().attrib['name'], 'model')
+        self.assertEqual(model_cache.get_stats()['parses'], 1)
+        self.assertEqual(model_cache.get_stats()['reads'], 1)
+
+        # unmodified files are neither read nor parsed again
+        self.assertEqual(model_cache.get_model(model_filename_1), (model_etree, content_hash))
+        self.assertEqual(model_cache.get_stats()['reads'], 1)
+
+        # files with the same contents share a parsed model
+        self.assertIs(model_cache.get_model(model_filename_2)[0], model_etree)
+        self.assertEqual(model_cache.get_stats()['parses'], 1)
+
+        # copies can be modified without modifying the cached model
+        model_copy, _ = model_cache.get_model(model_filename_1, copy_model=True)
+        self.assertIsNot(model_copy, model_etree)
+        model_copy.getroot().attrib['name'] = 'modified'
+        self.assertEqual(model_cache.get_model(model_filename_1)[0].getroot().attrib['name'], 'model')
+
+        # modified files are parsed again
+        with open(model_filename_1, 'w') as file:
+            file.write('<model name="other-model"/>')
+        os.utime(model_filename_1, ns=(0, 0))
+        other_model_etree, other_content_hash = model_cache.get_model(model_filename_1)
+        self.assertNotEqual(other_content_hash, content_hash)
+        self.assertEqual(other_model_etree.getroot().attrib['name'], 'other-model')
+        self.assertEqual(model_cache.get_stats()['parses'], 2)
+
+    def test_get_parsed_model_cache(self):
+        model_cache = cache.get_parsed_model_cache(SimulatorConfig(MODEL_CACHE_MAX_ENTRIES=3, MODEL_CACHE_MAX_BYTES=1000))
+        self.assertIs(cache.get_parsed_model_cache(), model_cache)
+        self.assertEqual(model_cache.max_entries, int(os.environ.get('MODEL_CACHE_MAX_ENTRIES', 64)))
+
+        model_cache = cache.get_parsed_model_cache(SimulatorConfig(MODEL_CACHE_MAX_ENTRIES=3, MODEL_CACHE_MAX_BYTES=1000))
+        self.assertEqual(model_cache.max_entries, 3)
+        self.assertEqual(model_cache.max_bytes, 1000)
+        cache.get_parsed_model_cache()
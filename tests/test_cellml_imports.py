@@ -0,0 +1,124 @@
+""" Tests of resolving the imports of CellML models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import cellml_imports
+from biosimulators_opencor import utils
+from biosimulators_opencor.cache import get_flattened_model_cache, get_parsed_model_cache
+from biosimulators_opencor.model_index import get_cellml_model_index
+from biosimulators_utils.sedml.data_model import Variable
+from unittest import mock
+import lxml.etree
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class CellmlImportsTestCase(unittest.TestCase):
+    FIXTURES_DIRNAME = os.path.join(os.path.dirname(__file__), 'fixtures')
+    NAMESPACES = {
+        'cellml': 'http://www.cellml.org/cellml/1.1#',
+    }
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        get_flattened_model_cache().clear()
+        get_parsed_model_cache().clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_cellml_imports(self):
+        model_etree = lxml.etree.parse(os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca', 'HATPase_test.cellml'))
+        imports = cellml_imports.get_cellml_imports(model_etree)
+        self.assertEqual(imports[0], ('Units/Units.cellml', [
+            ('units', 'mM', 'mM'),
+            ('units', 'per_s', 'per_s'),
+            ('units', 'mV', 'mV'),
+            ('units', 'umol_per_s_per_cm2', 'umol_per_s_per_cm2'),
+        ]))
+        self.assertEqual(imports[1], ('Weinstein_2000_HATPase.cellml', [('component', 'H_ATPase', 'H_ATPase')]))
+
+    def test_has_relative_cellml_imports(self):
+        self.assertTrue(cellml_imports.has_relative_cellml_imports(
+            os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca', 'HATPase_test.cellml')))
+        self.assertFalse(cellml_imports.has_relative_cellml_imports(os.path.join(self.FIXTURES_DIRNAME, 'lorenz.cellml')))
+
+        filename = os.path.join(self.dirname, 'model.cellml')
+        with open(filename, 'w') as file:
+            file.write((
+                '<model xmlns="http://www.cellml.org/cellml/1.1#" xmlns:xlink="http://www.w3.org/1999/xlink" name="model">'
+                '<import xlink:href="https://models.physiomeproject.org/units.cellml"/>'
+                '<import xlink:href="{}"/>'
+                '</model>'
+            ).format(os.path.join(self.FIXTURES_DIRNAME, 'lorenz.cellml')))
+        self.assertFalse(cellml_imports.has_relative_cellml_imports(filename))
+
+    def test_get_flattened_cellml_model(self):
+        model_filename = os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca-modified-2', 'subdir-2',
+                                      'HATPase_test.cellml')
+        model_etree = cellml_imports.get_flattened_cellml_model(model_filename)
+        root = model_etree.getroot()
+
+        self.assertEqual(root.xpath('/cellml:model/cellml:import', namespaces=self.NAMESPACES), [])
+        self.assertEqual(len(root.xpath("/cellml:model/cellml:component[@name='H_ATPase']", namespaces=self.NAMESPACES)), 1)
+        self.assertEqual(len(root.xpath("/cellml:model/cellml:units[@name='mM']", namespaces=self.NAMESPACES)), 1)
+
+        # the units imported with the CellML 1.0 namespace are converted to the namespace of the model
+        self.assertEqual(len(root.xpath("/cellml:model/cellml:units[@name='umol_per_s_per_cm2']/cellml:unit",
+                                        namespaces=self.NAMESPACES)), 3)
+
+        # the flattened model is cached
+        self.assertIs(cellml_imports.get_flattened_cellml_model(model_filename), model_etree)
+
+        # variables of imported components can be resolved
+        variables = [
+            Variable(id='J', target="/cellml:model/cellml:component[@name='H_ATPase']/cellml:variable[@name='J_Vtype_H']",
+                     target_namespaces=self.NAMESPACES),
+        ]
+        names = utils.validate_variable_xpaths(variables, None, model_index=get_cellml_model_index(model_etree))
+        self.assertEqual(names, {'J': 'H_ATPase/J_Vtype_H'})
+
+    def test_shared_imports_are_parsed_once(self):
+        model_filenames = [
+            os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca', 'HATPase_test.cellml'),
+            os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca-modified-1', 'HATPase_test.cellml'),
+            os.path.join(self.FIXTURES_DIRNAME, 'imported-model-file-pmr-e-2ca-modified-2', 'subdir-2', 'HATPase_test.cellml'),
+        ]
+        with mock.patch('lxml.etree.parse', wraps=lxml.etree.parse) as parse:
+            for model_filename in model_filenames:
+                cellml_imports.get_flattened_cellml_model(model_filename)
+
+        # the three copies of the units are identical, and the models and their components form two distinct pairs
+        self.assertEqual(parse.call_count, 1 + 2 + 3)
+
+    def test_cyclic_imports(self):
+        for name, imported_name in [('a', 'b'), ('b', 'a')]:
+            with open(os.path.join(self.dirname, name + '.cellml'), 'w') as file:
+                file.write((
+                    '<model name="{0}" xmlns="http://www.cellml.org/cellml/1.1#" xmlns:xlink="http://www.w3.org/1999/xlink">'
+                    '<import xlink:href="{1}.cellml"><component component_ref="{1}" name="{1}"/></import>'
+                    '<component name="{0}"/>'
+                    '</model>'
+                ).format(name, imported_name))
+
+        with self.assertRaisesRegex(ValueError, 'cyclic'):
+            cellml_imports.get_flattened_cellml_model(os.path.join(self.dirname, 'a.cellml'))
+
+    def test_unresolved_imports(self):
+        filename = os.path.join(self.dirname, 'model.cellml')
+        with open(filename, 'w') as file:
+            file.write(
+                '<model name="model" xmlns="http://www.cellml.org/cellml/1.1#" xmlns:xlink="http://www.w3.org/1999/xlink">'
+                '<import xlink:href="https://models.physiomeproject.org/units.cellml"><units units_ref="mM" name="mM"/></import>'
+                '<import xlink:href="missing.cellml"><units units_ref="mM" name="mM"/></import>'
+                '</model>'
+            )
+
+        model_etree = cellml_imports.get_flattened_cellml_model(filename)
+        self.assertEqual(len(model_etree.getroot().xpath('/cellml:model/cellml:import', namespaces=self.NAMESPACES)), 2)
@@ -7,8 +7,12 @@
 """
 
 from biosimulators_opencor import __main__
+from biosimulators_opencor import cache
 from biosimulators_opencor import core
+from biosimulators_opencor import parallel
+from biosimulators_opencor import tracing
 from biosimulators_opencor import utils
+from biosimulators_opencor.config import SimulatorConfig
 from biosimulators_opencor.data_model import KISAO_ALGORITHM_MAP
 from biosimulators_utils.combine import data_model as combine_data_model
 from biosimulators_utils.combine.io import CombineArchiveWriter
@@ -18,15 +22,22 @@ from biosimulators_utils.report import data_model as report_data_model
 from biosimulators_utils.report.io import ReportReader
 from biosimulators_utils.simulator.specs import gen_algorithms_from_specs
 from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml import exec as sedml_exec
 from biosimulators_utils.sedml.io import SedmlSimulationWriter
 from unittest import mock
+import concurrent.futures
+import concurrent.futures.process
+import copy
 import datetime
 import dateutil.tz
+import io
+import json
 import numpy
 import numpy.testing
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 
 
@@ -48,6 +59,87 @@ class TestCase(unittest.TestCase):
         results, log = core.exec_sed_task(task, variables, log=log)
         self._assert_variable_results(task, variables, results)
 
+    def test_exec_sed_task_reuses_pooled_simulation(self):
+        simulator_config = SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=2)
+        task, variables = self._get_simulation()
+        log = TaskLog()
+        results, log = core.exec_sed_task(task, variables, log=log, simulator_config=simulator_config)
+        self._assert_variable_results(task, variables, results)
+
+        task.simulation.output_end_time = 20.
+        log = TaskLog()
+        results, log = core.exec_sed_task(task, variables, log=log, simulator_config=simulator_config)
+        self._assert_variable_results(task, variables, results)
+        self.assertTrue(log.simulator_details['simulationPool']['hit'])
+        self.assertGreaterEqual(log.simulator_details['simulationPool']['hits'], 1)
+
+        results, log = core.exec_sed_task(task, variables, log=TaskLog(), simulator_config=SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=0))
+        self._assert_variable_results(task, variables, results)
+        self.assertFalse(log.simulator_details['simulationPool']['hit'])
+        self.assertEqual(log.simulator_details['simulationPool']['entries'], 0)
+
+    def test_exec_sed_task_closes_pooled_simulation_after_failure(self):
+        simulator_config = SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=2)
+        cache.get_simulation_pool(simulator_config).clear()
+        task, variables = self._get_simulation()
+
+        with mock.patch('biosimulators_opencor.core.get_results_from_opencor_simulation', side_effect=ValueError('extraction failed')):
+            with mock.patch('opencor.close_simulation') as close_simulation:
+                with self.assertRaisesRegex(ValueError, 'extraction failed'):
+                    core.exec_sed_task(task, variables, log=TaskLog(), simulator_config=simulator_config)
+        close_simulation.assert_called_once()
+        self.assertEqual(cache.get_simulation_pool(simulator_config).get_stats()['entries'], 0)
+
+        # the simulation is returned to the pool after successful executions
+        core.exec_sed_task(task, variables, log=TaskLog(), simulator_config=simulator_config)
+        self.assertEqual(cache.get_simulation_pool(simulator_config).get_stats()['entries'], 1)
+
+    def test_exec_sed_task_reuses_parsed_model(self):
+        task, variables = self._get_simulation()
+        _, log = core.exec_sed_task(task, variables, log=TaskLog())
+        parses = log.simulator_details['modelCache']['parses']
+
+        _, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertEqual(log.simulator_details['modelCache']['parses'], parses)
+        self.assertGreaterEqual(log.simulator_details['modelCache']['hits'], 1)
+
+    def test_exec_sed_task_records_phases(self):
+        task, variables = self._get_simulation()
+        _, log = core.exec_sed_task(task, variables, log=TaskLog(), simulator_config=SimulatorConfig(SIMULATION_POOL_MAX_ENTRIES=0))
+        phases = log.simulator_details['phases']
+        self.assertEqual(set(phases.keys()), set(['validate', 'load', 'run', 'extractResults', 'release']))
+        for stats in phases.values():
+            self.assertEqual(stats['count'], 1)
+            self.assertGreaterEqual(stats['wallTime'], 0.)
+            self.assertGreaterEqual(stats['cpuTime'], 0.)
+
+        preprocessed_task = core.preprocess_sed_task(task, variables)
+        _, log = core.exec_sed_task(task, variables, preprocessed_task=preprocessed_task, log=TaskLog())
+        self.assertNotIn('validate', log.simulator_details['phases'])
+
+    def test_exec_sed_task_records_solver_settings(self):
+        task, variables = self._get_simulation()
+        _, log = core.exec_sed_task(task, variables, log=TaskLog())
+        solver_settings = log.simulator_details['solverSettings']
+        self.assertEqual(solver_settings, {'solver': 'CVODE', 'configuredLinearSolver': 'Dense'})
+
+    def test_exec_sed_task_releases_unrequested_results(self):
+        task, variables = self._get_simulation()
+        with mock.patch('biosimulators_opencor.core.release_opencor_simulation_results',
+                        wraps=utils.release_opencor_simulation_results) as release_opencor_simulation_results:
+            results, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self._assert_variable_results(task, variables, results)
+
+        opencor_sim = release_opencor_simulation_results.call_args[0][0]
+        self.assertEqual(len(opencor_sim.results().voi().values()), 0)
+
+        results_memory = log.simulator_details['resultsMemory']
+        self.assertEqual(results_memory['retainedVariables'], len(variables))
+        self.assertGreater(results_memory['recordedVariables'], len(variables))
+        self.assertEqual(results_memory['retainedBytes'], sum(result.nbytes for result in results.values()))
+        self.assertEqual(results_memory['releasedAfterExtractionBytes'],
+                         results_memory['recordedBytes'] - results_memory['retainedBytes'])
+
     def test_exec_sed_task_with_imported_model_file(self):
         model_sources = [
             os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures',
@@ -142,6 +234,304 @@ class TestCase(unittest.TestCase):
                 self.assertEqual(result.shape, (2, 1, sim.number_of_points + 1,))
                 self.assertFalse(numpy.any(numpy.isnan(result)))
 
+    def test_exec_sed_doc_with_repeated_task_over_model_changes(self):
+        doc = self._build_sed_doc()
+        task = doc.tasks[0]
+        task.simulation.output_end_time = 2.
+        task.simulation.number_of_steps = 20
+
+        x_range = sedml_data_model.VectorRange(id='x_range', values=[1., 2., 4.])
+        repeated_task = sedml_data_model.RepeatedTask(
+            id='repeated_task',
+            range=x_range,
+            ranges=[x_range],
+            changes=[
+                sedml_data_model.SetValueComputeModelChange(
+                    model=task.model,
+                    target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+                    target_namespaces=self.NAMESPACES,
+                    range=x_range,
+                    math='x_range',
+                ),
+            ],
+            sub_tasks=[sedml_data_model.SubTask(task=task, order=1)],
+            reset_model_for_each_iteration=True,
+        )
+        doc.tasks.append(repeated_task)
+
+        report = sedml_data_model.Report(id='report2')
+        doc.outputs.append(report)
+        for data_gen in list(doc.data_generators):
+            variable = data_gen.variables[0]
+            repeated_data_gen = sedml_data_model.DataGenerator(
+                id=data_gen.id + '_repeated',
+                variables=[
+                    sedml_data_model.Variable(id=variable.id + '_repeated', target=variable.target,
+                                              target_namespaces=variable.target_namespaces, task=repeated_task),
+                ],
+                math=variable.id + '_repeated',
+            )
+            doc.data_generators.append(repeated_data_gen)
+            report.data_sets.append(sedml_data_model.DataSet(id='data_set_' + repeated_data_gen.id, label=repeated_data_gen.id,
+                                                             data_generator=repeated_data_gen))
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        out_dir = os.path.join(self.dirname, 'out')
+
+        with mock.patch('biosimulators_opencor.core.base_exec_repeated_task', side_effect=Exception('not executed natively')):
+            results, log = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config)
+        self.assertEqual(results['report2']['data_set_data_generator_x_repeated'].shape, (3, 1, task.simulation.number_of_steps + 1))
+        numpy.testing.assert_allclose(results['report2']['data_set_data_generator_x_repeated'][:, 0, 0], [1., 2., 4.])
+
+        expected_results, _ = sedml_exec.exec_sed_doc(core.exec_sed_task, doc, working_dir=self.dirname,
+                                                      base_out_path=out_dir, config=config)
+        for data_set_id, expected_data_set_results in expected_results['report2'].items():
+            numpy.testing.assert_allclose(results['report2'][data_set_id], expected_data_set_results)
+
+    def test_exec_sed_doc_execution_context(self):
+        core._import_base_sedml_exec()
+        base_exec_repeated_task = mock.Mock(return_value='base')
+        exec_repeated_sed_task = mock.Mock(return_value='opencor')
+        dispatch = core._get_sedml_exec_dispatcher(exec_repeated_sed_task, base_exec_repeated_task)
+
+        self.assertEqual(dispatch('task'), 'base')
+
+        thread_results = []
+        with core.sed_doc_execution_context(core.SedDocExecutionContext()):
+            self.assertEqual(dispatch('task'), 'opencor')
+
+            # other threads which are not executing a document use the executers of BioSimulators utils
+            thread = threading.Thread(target=lambda: thread_results.append(dispatch('task')))
+            thread.start()
+            thread.join()
+        self.assertEqual(thread_results, ['base'])
+        self.assertEqual(dispatch('task'), 'base')
+
+    def test_exec_sed_doc_patches_base_sedml_exec_only_while_executing(self):
+        base_sedml_exec = core._import_base_sedml_exec()
+        self.assertIs(sedml_exec.exec_repeated_task, base_sedml_exec['exec_repeated_task'])
+
+        with core.sed_doc_execution_context(core.SedDocExecutionContext()):
+            self.assertIs(sedml_exec.exec_repeated_task, base_sedml_exec['dispatch_exec_repeated_task'])
+            with core.sed_doc_execution_context(core.SedDocExecutionContext()):
+                self.assertIs(sedml_exec.exec_report, base_sedml_exec['dispatch_exec_report'])
+            self.assertIs(sedml_exec.exec_report, base_sedml_exec['dispatch_exec_report'])
+
+        for name in ['exec_repeated_task', 'exec_report', 'exec_plot_2d', 'exec_plot_3d']:
+            self.assertIs(getattr(sedml_exec, name), base_sedml_exec[name])
+
+        # the original executers are restored after documents fail
+        with self.assertRaises(ValueError):
+            with core.sed_doc_execution_context(core.SedDocExecutionContext()):
+                raise ValueError()
+        self.assertIs(sedml_exec.exec_repeated_task, base_sedml_exec['exec_repeated_task'])
+
+    def test_exec_repeated_sed_task_with_non_finite_values(self):
+        doc = self._build_sed_doc()
+        task = doc.tasks[0]
+        x_range = sedml_data_model.VectorRange(id='x_range', values=[1., float('nan')])
+        repeated_task = sedml_data_model.RepeatedTask(
+            id='repeated_task',
+            range=x_range,
+            changes=[
+                sedml_data_model.SetValueComputeModelChange(
+                    model=task.model,
+                    target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+                    target_namespaces=self.NAMESPACES,
+                    range=x_range,
+                    math='x_range',
+                ),
+            ],
+            sub_tasks=[sedml_data_model.SubTask(task=task, order=1)],
+            reset_model_for_each_iteration=True,
+        )
+        variables = doc.data_generators[0].variables
+
+        with self.assertRaisesRegex(ValueError, 'iteration 2 .* must be finite'):
+            core.exec_repeated_sed_task(repeated_task, core.exec_sed_task, variables, doc)
+
+    def test_exec_sed_doc_applies_model_changes_to_simulations(self):
+        doc = self._build_sed_doc()
+        doc.models[0].changes.append(sedml_data_model.ModelAttributeChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+            target_namespaces=self.NAMESPACES,
+            new_value='2'))
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        out_dir = os.path.join(self.dirname, 'out')
+
+        results, log = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config)
+        self.assertEqual(results['report1']['data_set_x'][0], 2.)
+        self.assertTrue(log.tasks['task'].simulator_details['modelChangesAppliedToSimulation'])
+
+        # changes which can only be applied to model files are applied before the tasks are executed
+        doc.models[0].changes.append(sedml_data_model.RemoveElementModelChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='beta']",
+            target_namespaces=self.NAMESPACES))
+        self.assertFalse(utils.are_model_changes_applicable_to_simulations(doc))
+        with mock.patch('biosimulators_opencor.core.base_exec_sed_doc', return_value=(None, None)) as base_exec_sed_doc:
+            core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config)
+        self.assertTrue(base_exec_sed_doc.call_args[1]['apply_xml_model_changes'])
+
+    def test_exec_sed_doc_in_parallel(self):
+        doc = self._build_sed_doc()
+        task = doc.tasks[0]
+        data_gens = list(doc.data_generators)
+
+        for i_task, x in enumerate([2., 4.]):
+            model = copy.deepcopy(task.model)
+            model.id = 'model{}'.format(i_task + 2)
+            model.changes.append(sedml_data_model.ModelAttributeChange(
+                target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+                target_namespaces=self.NAMESPACES,
+                new_value=str(x)))
+            doc.models.append(model)
+            other_task = sedml_data_model.Task(id='task{}'.format(i_task + 2), model=model, simulation=task.simulation)
+            doc.tasks.append(other_task)
+
+            report = sedml_data_model.Report(id='report{}'.format(i_task + 2))
+            doc.outputs.append(report)
+            for data_gen in data_gens:
+                variable = data_gen.variables[0]
+                other_data_gen = sedml_data_model.DataGenerator(
+                    id=data_gen.id + '_' + other_task.id,
+                    variables=[
+                        sedml_data_model.Variable(id=variable.id + '_' + other_task.id, target=variable.target,
+                                                  target_namespaces=variable.target_namespaces, task=other_task),
+                    ],
+                    math=variable.id + '_' + other_task.id,
+                )
+                doc.data_generators.append(other_data_gen)
+                report.data_sets.append(sedml_data_model.DataSet(id='data_set_' + other_data_gen.id, label=other_data_gen.id,
+                                                                 data_generator=other_data_gen))
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        out_dir = os.path.join(self.dirname, 'out')
+
+        expected_results, expected_log = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config,
+                                                           simulator_config=SimulatorConfig(NUM_WORKERS=1))
+
+        with mock.patch('biosimulators_opencor.core.exec_sed_task', wraps=core.exec_sed_task) as exec_sed_task:
+            results, log = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config,
+                                             simulator_config=SimulatorConfig(NUM_WORKERS=2))
+        parallel.shutdown_worker_pool()
+        exec_sed_task.assert_not_called()
+
+        self.assertEqual(set(results.keys()), set(expected_results.keys()))
+        for report_id, expected_report_results in expected_results.items():
+            for data_set_id, expected_data_set_results in expected_report_results.items():
+                numpy.testing.assert_equal(results[report_id][data_set_id], expected_data_set_results)
+        self.assertFalse(numpy.array_equal(results['report2']['data_set_data_generator_x_task2'],
+                                           results['report3']['data_set_data_generator_x_task3']))
+        self.assertEqual(log.tasks['task3'].algorithm, expected_log.tasks['task3'].algorithm)
+
+    def test_exec_sed_doc_in_parallel_with_broken_worker_pool(self):
+        doc = self._build_sed_doc()
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        config.COLLECT_SED_DOCUMENT_RESULTS = True
+        out_dir = os.path.join(self.dirname, 'out')
+
+        expected_results, _ = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config,
+                                                simulator_config=SimulatorConfig(NUM_WORKERS=1))
+
+        # tasks which can't be submitted to a new pool either are executed serially
+        with mock.patch('biosimulators_opencor.core.get_independent_tasks', return_value=[doc.tasks[0], doc.tasks[0]]):
+            with mock.patch('biosimulators_opencor.core.get_worker_pool') as get_worker_pool:
+                with mock.patch('biosimulators_opencor.core.submit_tasks_to_worker_pool',
+                                side_effect=concurrent.futures.process.BrokenProcessPool('worker crashed')):
+                    results, log = core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, config=config,
+                                                     simulator_config=SimulatorConfig(NUM_WORKERS=2))
+        self.assertEqual(get_worker_pool.call_count, 2)
+        for report_id, expected_report_results in expected_results.items():
+            for data_set_id, expected_data_set_results in expected_report_results.items():
+                numpy.testing.assert_equal(results[report_id][data_set_id], expected_data_set_results)
+
+    def test_exec_sed_doc_with_profiling(self):
+        doc = self._build_sed_doc()
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        out_dir = os.path.join(self.dirname, 'out')
+
+        core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, rel_out_path='sim.sedml', config=config,
+                          simulator_config=SimulatorConfig(PROFILE_TASKS=True, PROFILE_MEMORY=True))
+
+        profiles_dirname = os.path.join(out_dir, 'sim.sedml', 'profiles')
+        self.assertEqual(sorted(os.listdir(profiles_dirname)), ['task.json', 'task.prof'])
+        with open(os.path.join(profiles_dirname, 'task.json'), 'r') as file:
+            summary = json.load(file)
+        self.assertEqual(summary['task'], 'task')
+        self.assertIn('memory', summary)
+
+    def test_exec_sed_doc_with_profiling_does_not_profile_re_executions_of_failed_worker_tasks(self):
+        doc = self._build_sed_doc()
+
+        config = get_config()
+        config.REPORT_FORMATS = []
+        config.VIZ_FORMATS = []
+        out_dir = os.path.join(self.dirname, 'out')
+        profiles_dirname = os.path.join(out_dir, 'sim.sedml', 'profiles')
+
+        for exception, expected_profiles in [
+            (ValueError('task failed in worker'), []),
+            (concurrent.futures.process.BrokenProcessPool('worker crashed'), ['task.json', 'task.prof']),
+        ]:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+            future = concurrent.futures.Future()
+            future.set_exception(exception)
+            with mock.patch('biosimulators_opencor.core.get_independent_tasks', return_value=[doc.tasks[0], doc.tasks[0]]):
+                with mock.patch('biosimulators_opencor.core.get_worker_pool'):
+                    with mock.patch('biosimulators_opencor.core.submit_tasks_to_worker_pool', return_value={'task': future}):
+                        core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, rel_out_path='sim.sedml',
+                                          config=config, simulator_config=SimulatorConfig(NUM_WORKERS=2, PROFILE_TASKS=True))
+
+            # the worker saves the profile of a failed task; only tasks whose workers crashed are profiled again
+            self.assertEqual(sorted(os.listdir(profiles_dirname)) if os.path.isdir(profiles_dirname) else [], expected_profiles)
+
+    def test_exec_sed_doc_with_tracing(self):
+        doc = self._build_sed_doc()
+
+        config = get_config()
+        config.REPORT_FORMATS = [report_data_model.ReportFormat.csv]
+        config.VIZ_FORMATS = []
+        out_dir = os.path.join(self.dirname, 'out')
+        trace_filename = os.path.join(self.dirname, 'trace.jsonl')
+
+        # open the model rather than reusing a pooled simulation
+        cache.get_simulation_pool().clear()
+
+        try:
+            core.exec_sed_doc(doc, working_dir=self.dirname, base_out_path=out_dir, rel_out_path='sim.sedml', config=config,
+                              simulator_config=SimulatorConfig(TRACE_FILENAME=trace_filename))
+        finally:
+            tracing.set_tracer(None)
+
+        spans = {span['name']: span for span in tracing.read_trace(trace_filename)}
+        for name in ['exec_sed_doc', 'exec_sed_task', 'validate', 'load', 'open', 'run', 'extractResults', 'writeReport']:
+            self.assertIn(name, spans)
+        self.assertEqual(spans['exec_sed_doc']['args']['document'], 'sim.sedml')
+        self.assertEqual(spans['exec_sed_task']['args']['parentId'], spans['exec_sed_doc']['args']['spanId'])
+        self.assertEqual(spans['exec_sed_task']['args']['numberOfSteps'], doc.simulations[0].number_of_steps)
+        self.assertEqual(spans['exec_sed_task']['args']['algorithm'], 'KISAO_0000019')
+        self.assertEqual(len(spans['exec_sed_task']['args']['modelHash']), 64)
+        self.assertEqual(spans['run']['args']['parentId'], spans['exec_sed_task']['args']['spanId'])
+        self.assertEqual(spans['open']['args']['parentId'], spans['load']['args']['spanId'])
+        self.assertEqual(spans['writeReport']['args']['output'], 'report1')
+
     def test_exec_sed_task_with_algebraic_variable(self):
         task, variables = self._get_simulation()
         task.model.source = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'parabola_variant_dae_model.cellml'))
@@ -208,6 +598,122 @@ class TestCase(unittest.TestCase):
             rtol=5e-5,
         )
 
+    def test_exec_sed_task_with_transient(self):
+        task, variables = self._get_simulation()
+        task.simulation.output_start_time = 5.1
+        task.simulation.output_end_time = 10.
+        task.simulation.number_of_steps = 7
+
+        for skip_transient_output in [True, False]:
+            results, _ = core.exec_sed_task(task, variables,
+                                            simulator_config=SimulatorConfig(SKIP_TRANSIENT_OUTPUT=skip_transient_output))
+            numpy.testing.assert_allclose(results['t'], numpy.linspace(5.1, 10., 8))
+            for result in results.values():
+                self.assertEqual(result.shape, (8,))
+                self.assertFalse(numpy.any(numpy.isnan(result)))
+
+    def test_exec_sed_task_streamed_to_hdf5(self):
+        task, variables = self._get_simulation()
+        task.simulation.output_start_time = 5.
+        task.simulation.output_end_time = 10.
+        task.simulation.number_of_steps = 25
+
+        expected_results, _ = core.exec_sed_task(task, variables)
+
+        filename = os.path.join(self.dirname, 'results.h5')
+        results, log = core.exec_sed_task(task, variables, log=TaskLog(), stream_to=filename,
+                                          simulator_config=SimulatorConfig(STREAMING_SEGMENT_STEPS=10))
+        self.assertEqual(log.simulator_details['streaming'], {'filename': filename, 'segments': 3, 'points': 26})
+        self.assertEqual((results.filename, results.num_points), (filename, 26))
+        with results.open() as streamed_results:
+            for variable in variables:
+                self.assertEqual(streamed_results[variable.id].chunks, (11,))
+                numpy.testing.assert_allclose(streamed_results[variable.id][:], expected_results[variable.id])
+        self.assertFalse(streamed_results[variables[0].id].id.valid)
+
+        # the file isn't held open, so that it can be rewritten
+        results, _ = core.exec_sed_task(task, variables, stream_to=filename)
+        with results.open() as streamed_results:
+            numpy.testing.assert_allclose(streamed_results[variables[0].id][:], expected_results[variables[0].id])
+
+    def test_exec_sed_task_with_changes_applied_to_simulation(self):
+        task, variables = self._get_simulation()
+        variables.append(sedml_data_model.Variable(
+            id='sigma',
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='sigma']",
+            target_namespaces=self.NAMESPACES,
+            task=task,
+        ))
+        for var_name, new_value in [('x', 2.), ('sigma', 12.)]:
+            task.model.changes.append(sedml_data_model.ModelAttributeChange(
+                target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='{}']/@initial_value".format(var_name),
+                target_namespaces=self.NAMESPACES,
+                new_value=new_value,
+            ))
+        results, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertTrue(log.simulator_details['modelChangesAppliedToSimulation'])
+        self.assertEqual(results['x'][0], 2.)
+        self.assertEqual(results['sigma'][0], 12.)
+
+        # the time cannot be changed in memory, which requires the changes to be applied to the model file
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='t']/@initial_value",
+            target_namespaces=self.NAMESPACES,
+            new_value=0.,
+        ))
+        results2, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertFalse(log.simulator_details['modelChangesAppliedToSimulation'])
+        for variable in variables:
+            numpy.testing.assert_allclose(results2[variable.id], results[variable.id])
+
+        # changes are not applied to subsequent executions of the pooled simulation
+        task.model.changes = []
+        results3, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertNotIn('modelChangesAppliedToSimulation', log.simulator_details)
+        self.assertEqual(results3['x'][0], 1.)
+        self.assertEqual(results3['sigma'][0], 10.)
+
+    def test_exec_sed_task_with_changes_applied_to_simulation_recomputes_computed_constants(self):
+        task, variables = self._get_computed_constant_simulation()
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='k']/@initial_value",
+            target_namespaces=self.NAMESPACES,
+            new_value='3',
+        ))
+
+        for _ in range(2):
+            results, log = core.exec_sed_task(task, variables, log=TaskLog())
+            self.assertTrue(log.simulator_details['modelChangesAppliedToSimulation'])
+            numpy.testing.assert_allclose(results['double_k'], numpy.full((11,), 6.))
+
+        # the computed constant is also recomputed when the outputs start after the initial time
+        task.simulation.output_start_time = 5.
+        results, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertTrue(log.simulator_details['modelChangesAppliedToSimulation'])
+        numpy.testing.assert_allclose(results['double_k'], numpy.full((11,), 6.))
+
+        task.model.changes = []
+        results, _ = core.exec_sed_task(task, variables, log=TaskLog())
+        numpy.testing.assert_allclose(results['double_k'], numpy.full((11,), 2.))
+
+    def test_exec_sed_task_applies_changes_to_models_with_variable_initial_values_to_model_files(self):
+        task, variables = self._get_computed_constant_simulation()
+        model_filename = os.path.join(self.dirname, 'model.cellml')
+        with open(task.model.source, 'r') as file:
+            model = file.read()
+        with open(model_filename, 'w') as file:
+            file.write(model.replace('initial_value="0" name="x"', 'initial_value="k" name="x"'))
+        task.model.source = model_filename
+
+        task.model.changes.append(sedml_data_model.ModelAttributeChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='k']/@initial_value",
+            target_namespaces=self.NAMESPACES,
+            new_value='3',
+        ))
+        results, log = core.exec_sed_task(task, variables, log=TaskLog())
+        self.assertFalse(log.simulator_details['modelChangesAppliedToSimulation'])
+        numpy.testing.assert_allclose(results['double_k'], numpy.full((11,), 6.))
+
     def test_exec_sedml_docs_in_combine_archive(self):
         doc, archive_filename = self._build_combine_archive()
 
@@ -224,6 +730,15 @@ class TestCase(unittest.TestCase):
 
         self._assert_combine_archive_outputs(doc, out_dir)
 
+        with open(os.path.join(out_dir, 'opencor-phases.json'), 'r') as file:
+            phases_summary = json.load(file)
+        self.assertGreaterEqual(phases_summary['numTasks'], 1)
+        self.assertIn('run', phases_summary['phases'])
+
+        with open(os.path.join(out_dir, 'opencor-solver-settings.json'), 'r') as file:
+            solver_settings_summary = json.load(file)
+        self.assertGreaterEqual(solver_settings_summary['CVODE']['numTasks'], 1)
+
     def test_exec_sedml_docs_in_combine_archive_with_all_algorithms(self):
         for alg in gen_algorithms_from_specs(os.path.join(os.path.dirname(__file__), '..', 'biosimulators.json')).values():
             alg_props = KISAO_ALGORITHM_MAP[alg.kisao_id]
@@ -248,6 +763,33 @@ class TestCase(unittest.TestCase):
 
             self._assert_combine_archive_outputs(doc, out_dir)
 
+    def _get_computed_constant_simulation(self):
+        task = sedml_data_model.Task(
+            model=sedml_data_model.Model(
+                source=os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'computed-constant.cellml')),
+                language=sedml_data_model.ModelLanguage.CellML.value,
+            ),
+            simulation=sedml_data_model.UniformTimeCourseSimulation(
+                initial_time=0.,
+                output_start_time=0.,
+                output_end_time=10.,
+                number_of_steps=10,
+                algorithm=sedml_data_model.Algorithm(kisao_id='KISAO_0000019'),
+            ),
+        )
+
+        variables = [
+            sedml_data_model.Variable(
+                id=var_name,
+                target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='{}']".format(var_name),
+                target_namespaces=self.NAMESPACES,
+                task=task,
+            )
+            for var_name in ['t', 'x', 'double_k']
+        ]
+
+        return task, variables
+
     def _get_simulation(self, algorithm=None):
         model_source = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'lorenz.cellml'))
 
@@ -382,6 +924,46 @@ class TestCase(unittest.TestCase):
                 __main__.main()
                 self.assertRegex(context.Exception, 'usage: ')
 
+    def test_raw_cli_reports_startup_duration_when_requested(self):
+        for env, expected_report in [({}, False), ({'REPORT_STARTUP_DURATION': '1'}, True)]:
+            with mock.patch('sys.argv', ['', '--help']):
+                with mock.patch.dict(os.environ, env):
+                    with mock.patch('sys.stdout'):
+                        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                            with self.assertRaises(SystemExit):
+                                __main__.main()
+            self.assertEqual('Started in ' in stderr.getvalue(), expected_report)
+
+    def test_raw_cli_does_not_get_simulator_version(self):
+        with mock.patch('sys.argv', ['', '--help']):
+            with mock.patch('biosimulators_opencor.__main__.get_simulator_version', side_effect=Exception('version retrieved')):
+                with mock.patch('sys.stdout'):
+                    with self.assertRaises(SystemExit):
+                        __main__.main()
+
+        with mock.patch('sys.argv', ['', '--version']):
+            with mock.patch('biosimulators_opencor.__main__.get_simulator_version', return_value='2021-05-19') as get_simulator_version:
+                with mock.patch('sys.stdout'):
+                    with self.assertRaises(SystemExit):
+                        __main__.main()
+        get_simulator_version.assert_called_once_with()
+
+    def test_raw_cli_batch(self):
+        with mock.patch('sys.argv', ['', 'batch', 'archive.omex', '-o', 'out']):
+            with mock.patch('biosimulators_opencor.batch.main', return_value=0) as batch_main:
+                with self.assertRaises(SystemExit) as context:
+                    __main__.main()
+        batch_main.assert_called_once_with()
+        self.assertEqual(context.exception.code, 0)
+
+    def test_raw_cli_daemon(self):
+        with mock.patch('sys.argv', ['', 'daemon', '--port', '8001']):
+            with mock.patch('biosimulators_opencor.daemon.main', return_value=0) as daemon_main:
+                with self.assertRaises(SystemExit) as context:
+                    __main__.main()
+        daemon_main.assert_called_once_with()
+        self.assertEqual(context.exception.code, 0)
+
     def test_exec_sedml_docs_in_combine_archive_with_cli(self):
         doc, archive_filename = self._build_combine_archive()
         out_dir = os.path.join(self.dirname, 'out')
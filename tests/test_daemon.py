@@ -0,0 +1,177 @@
+""" Tests of the simulation daemon
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import daemon
+from biosimulators_opencor import utils
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.sedml.io import SedmlSimulationWriter
+from unittest import mock
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+
+class DaemonTestCase(unittest.TestCase):
+    NAMESPACES = {
+        'cellml': 'http://www.cellml.org/cellml/1.0#',
+    }
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.daemon = daemon.SimulationDaemon(max_concurrent_jobs=1, max_queued_jobs=2)
+        self.daemon.start()
+        self.server = daemon.serve(self.daemon, port=0, quiet=True)
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.daemon.stop()
+        shutil.rmtree(self.dirname)
+
+    def _request(self, path, body=None):
+        request = urllib.request.Request(self.url + path, data=json.dumps(body).encode() if body is not None else None)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as exception:
+            return exception.code, json.loads(exception.read())
+
+    def _write_sed_doc(self):
+        shutil.copyfile(os.path.join(os.path.dirname(__file__), 'fixtures', 'lorenz.cellml'), os.path.join(self.dirname, 'model.cellml'))
+        model = sedml_data_model.Model(id='model', source='model.cellml', language=sedml_data_model.ModelLanguage.CellML.value)
+        sim = sedml_data_model.UniformTimeCourseSimulation(id='sim', initial_time=0., output_start_time=0., output_end_time=10.,
+                                                           number_of_steps=10,
+                                                           algorithm=sedml_data_model.Algorithm(kisao_id='KISAO_0000019'))
+        task = sedml_data_model.Task(id='task', model=model, simulation=sim)
+        variable = sedml_data_model.Variable(id='x', task=task, target_namespaces=self.NAMESPACES,
+                                             target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']")
+        data_gen = sedml_data_model.DataGenerator(id='data_gen_x', variables=[variable], math='x')
+        report = sedml_data_model.Report(id='report', data_sets=[
+            sedml_data_model.DataSet(id='data_set_x', label='x', data_generator=data_gen),
+        ])
+        doc = sedml_data_model.SedDocument(models=[model], simulations=[sim], tasks=[task], data_generators=[data_gen], outputs=[report])
+
+        filename = os.path.join(self.dirname, 'simulation.sedml')
+        with mock.patch.dict('sys.modules', libcellml=utils.get_mock_libcellml()):
+            SedmlSimulationWriter().run(doc, filename, validate_models_with_languages=False)
+        return filename
+
+    def test_health_and_readiness(self):
+        self.assertEqual(self._request('/health'), (200, {'status': 'ok'}))
+        self.assertEqual(self._request('/ready'), (200, {'ready': True}))
+        self.assertEqual(self._request('/unknown')[0], 404)
+        self.assertEqual(self._request('/jobs/unknown')[0], 404)
+
+    def test_readiness_waits_for_workers_to_load_opencor(self):
+        self.daemon.stop()
+        self.assertEqual(self._request('/ready'), (503, {'ready': False}))
+
+        with mock.patch.object(daemon, 'create_worker_pool', wraps=daemon.create_worker_pool) as create_worker_pool:
+            with mock.patch.object(daemon, 'warm_up_worker') as warm_up_worker:
+                self.daemon.start()
+        warm_up_worker.assert_called_once_with()
+        self.assertIs(create_worker_pool.call_args[1]['initializer'], warm_up_worker)
+        self.assertEqual(self._request('/ready'), (200, {'ready': True}))
+
+    def test_warm_up_worker(self):
+        with mock.patch('biosimulators_opencor.core._import_base_sedml_exec') as import_base_sedml_exec:
+            daemon.warm_up_worker()
+        import_base_sedml_exec.assert_called_once_with()
+
+    def test_task_job(self):
+        sedml_filename = self._write_sed_doc()
+
+        code, job = self._request('/jobs', {'sedml': sedml_filename, 'task': 'task', 'wait': True})
+        self.assertEqual(code, 200)
+        self.assertEqual(job['status'], 'SUCCEEDED')
+        self.assertEqual(len(job['result']['variables']['x']), 11)
+        self.assertEqual(job['result']['variables']['x'][0], 1.)
+        self.assertGreaterEqual(job['queueDuration'], 0.)
+        self.assertGreaterEqual(job['runDuration'], 0.)
+
+        code, job_2 = self._request('/jobs/' + job['id'])
+        self.assertEqual(code, 200)
+        self.assertEqual(job_2['result'], job['result'])
+
+        code, job_2 = self._request('/jobs/' + job['id'] + '?format=json')
+        self.assertEqual(code, 200)
+        self.assertEqual(job_2['id'], job['id'])
+
+        code, job = self._request('/jobs', {'sedml': sedml_filename, 'task': 'unknown', 'wait': True})
+        self.assertEqual(job['status'], 'FAILED')
+        self.assertIn('does not have a basic task', job['exception'])
+
+        code, jobs = self._request('/jobs')
+        self.assertEqual(len(jobs), 2)
+
+    def test_archive_job(self):
+        out_dir = os.path.join(self.dirname, 'out')
+        code, job = self._request('/jobs', {'archive': os.path.join(self.dirname, 'missing.omex'), 'outDir': out_dir})
+        self.assertEqual(code, 202)
+        self.assertIn(job['status'], ['QUEUED', 'RUNNING'])
+
+        self.daemon.get_job(job['id']).done.wait()
+        code, job = self._request('/jobs/' + job['id'])
+        self.assertEqual(job['status'], 'FAILED')
+        self.assertEqual(job['result']['archive'], os.path.join(self.dirname, 'missing.omex'))
+
+    def test_task_job_reads_sed_doc_in_worker(self):
+        sedml_filename = self._write_sed_doc()
+
+        # the daemon doesn't replace modules in :obj:`sys.modules` while other threads may be importing modules
+        with mock.patch('unittest.mock._patch_dict.__enter__', side_effect=AssertionError('patched sys.modules')):
+            code, job = self._request('/jobs', {'sedml': sedml_filename, 'task': 'task', 'wait': True})
+        self.assertEqual(job['status'], 'SUCCEEDED')
+
+    def test_broken_worker_pool_is_replaced_by_server_thread(self):
+        sedml_filename = self._write_sed_doc()
+        worker_pool = self.daemon._worker_pool
+
+        threads = []
+        base_create_worker_pool = daemon.create_worker_pool
+
+        def create_worker_pool(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return base_create_worker_pool(*args, **kwargs)
+
+        with mock.patch.object(daemon, 'create_worker_pool', side_effect=create_worker_pool):
+            with mock.patch.object(daemon, 'exec_archive_in_worker', _crash_worker):
+                code, job = self._request('/jobs', {'archive': 'archive.omex', 'outDir': 'out', 'wait': True})
+            self.assertEqual(job['status'], 'FAILED')
+            self.assertIn('BrokenProcessPool', job['exception'])
+
+            # subsequent jobs wait for the pool to be replaced
+            code, job = self._request('/jobs', {'sedml': sedml_filename, 'task': 'task', 'wait': True})
+        self.assertEqual(job['status'], 'SUCCEEDED')
+        self.assertIsNot(self.daemon._worker_pool, worker_pool)
+        self.assertEqual(threads, [self.thread])
+
+    def test_invalid_job(self):
+        self.assertEqual(self._request('/jobs', {'archive': 'archive.omex'})[0], 400)
+        self.assertEqual(self._request('/jobs', ['archive.omex'])[0], 400)
+
+    def test_full_queue(self):
+        self.daemon.stop()
+        self.daemon._dispatchers = [None]
+        for _ in range(2):
+            self.assertEqual(self._request('/jobs', {'archive': 'archive.omex', 'outDir': 'out'})[0], 202)
+        self.assertEqual(self._request('/ready'), (503, {'ready': False}))
+        self.assertEqual(self._request('/jobs', {'archive': 'archive.omex', 'outDir': 'out'})[0], 503)
+        self.daemon._dispatchers = []
+
+
+def _crash_worker(*args):
+    os._exit(1)
@@ -0,0 +1,310 @@
+""" Tests of the execution of SED tasks for ensembles of values of the parameters of their models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import core
+from biosimulators_opencor import ensemble
+from biosimulators_opencor import parallel
+from biosimulators_opencor.cache import get_simulation_pool, get_results_index_cache
+from biosimulators_opencor.config import SimulatorConfig
+from biosimulators_utils.sedml.data_model import (Task, Model, ModelLanguage, ModelAttributeChange,
+                                                  UniformTimeCourseSimulation, Algorithm, Variable)
+from unittest import mock
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+
+class EnsembleTestCase(unittest.TestCase):
+    NAMESPACES = {
+        'cellml': 'http://www.cellml.org/cellml/1.0#',
+    }
+
+    SIGMA = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='sigma']"
+    X = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']"
+
+    def setUp(self):
+        get_simulation_pool().clear()
+        get_results_index_cache().clear()
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        parallel.shutdown_worker_pool()
+        get_results_index_cache().clear()
+        shutil.rmtree(self.dirname)
+
+    def _get_simulation(self):
+        task = Task(
+            id='task',
+            model=Model(
+                id='model',
+                source=os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'lorenz.cellml')),
+                language=ModelLanguage.CellML.value,
+            ),
+            simulation=UniformTimeCourseSimulation(
+                initial_time=0.,
+                output_start_time=0.,
+                output_end_time=1.,
+                number_of_steps=10,
+                algorithm=Algorithm(kisao_id='KISAO_0000019'),
+            ),
+        )
+
+        variables = [
+            Variable(id='t', target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='t']",
+                     target_namespaces=self.NAMESPACES, task=task),
+            Variable(id='x', target=self.X, target_namespaces=self.NAMESPACES, task=task),
+            Variable(id='y', target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='y']",
+                     target_namespaces=self.NAMESPACES, task=task),
+        ]
+
+        return task, variables
+
+    def test_get_opencor_parameter_names(self):
+        task, variables = self._get_simulation()
+        preprocessed_task = core.preprocess_sed_task(task, variables)
+
+        self.assertEqual(
+            ensemble.get_opencor_parameter_names([self.SIGMA, self.X + '/@initial_value'], self.NAMESPACES,
+                                                 preprocessed_task['model_etree']),
+            ['main/sigma', 'main/x'])
+
+        with self.assertRaisesRegex(ValueError, 'not valid'):
+            ensemble.get_opencor_parameter_names(
+                ["/cellml:model/cellml:component[@name='main']/cellml:variable[@name='undefined']"], self.NAMESPACES,
+                preprocessed_task['model_etree'])
+        with self.assertRaisesRegex(ValueError, 'not valid'):
+            ensemble.get_opencor_parameter_names(["/cellml:model/cellml:component[@name='main']"], self.NAMESPACES,
+                                                 preprocessed_task['model_etree'])
+        with self.assertRaisesRegex(ValueError, 'not valid'):
+            ensemble.get_opencor_parameter_names([self.X + '/@name'], self.NAMESPACES, preprocessed_task['model_etree'])
+
+    def test_exec_sed_task_ensemble(self):
+        task, variables = self._get_simulation()
+        parameter_values = numpy.array([
+            [10., 1.],
+            [5., 2.],
+            [10., 1.],
+        ])
+
+        results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values)
+        self.assertEqual(results.shape, (3, 3, 11))
+        numpy.testing.assert_allclose(results[:, 0, :], numpy.tile(numpy.linspace(0., 1., 11), (3, 1)))
+        numpy.testing.assert_allclose(results[:, 1, 0], [1., 2., 1.])
+        numpy.testing.assert_allclose(results[0], results[2])
+        self.assertFalse(numpy.allclose(results[0], results[1]))
+
+        # each parameter set gives the same results as a task with the equivalent changes to its model
+        for i_set, (sigma, x) in enumerate(parameter_values):
+            task.model.changes = [
+                ModelAttributeChange(target=self.SIGMA + '/@initial_value', target_namespaces=self.NAMESPACES,
+                                     new_value=str(sigma)),
+                ModelAttributeChange(target=self.X + '/@initial_value', target_namespaces=self.NAMESPACES,
+                                     new_value=str(x)),
+            ]
+            variable_results, _ = core.exec_sed_task(task, variables)
+            for i_variable, variable in enumerate(variables):
+                numpy.testing.assert_allclose(results[i_set, i_variable, :], variable_results[variable.id])
+
+        # the changes to the model of the task are applied to each parameter set
+        task.model.changes = [
+            ModelAttributeChange(target=self.X + '/@initial_value', target_namespaces=self.NAMESPACES, new_value='3.'),
+        ]
+        results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA], [[10.], [5.]])
+        numpy.testing.assert_allclose(results[:, 1, 0], [3., 3.])
+
+        # the compiled simulation is returned to the pool
+        self.assertEqual(get_simulation_pool().get_stats()['entries'], 1)
+
+    def test_exec_sed_task_ensemble_error_handling(self):
+        task, variables = self._get_simulation()
+
+        with self.assertRaisesRegex(ValueError, 'one column for each'):
+            ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], [[10.], [5.]])
+
+        with self.assertRaisesRegex(ValueError, 'one column for each'):
+            ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA], [10., 5.])
+
+        with self.assertRaisesRegex(ValueError, 'not valid'):
+            ensemble.exec_sed_task_ensemble(task, variables, [self.X + '/@name'], [[1.]])
+
+        results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA], numpy.zeros((0, 1)))
+        self.assertEqual(results.shape, (0, 3, 11))
+
+    def test_compiled_task(self):
+        task, variables = self._get_simulation()
+        expected_results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], [[10., 1.], [5., 2.]])
+
+        with ensemble.CompiledTask(task, variables, [self.SIGMA, self.X]) as compiled_task:
+            self.assertEqual(compiled_task.parameter_names, ['main/sigma', 'main/x'])
+
+            # the simulation is removed from the pool while the task is compiled
+            self.assertEqual(get_simulation_pool().get_stats()['entries'], 0)
+
+            for _ in range(2):
+                numpy.testing.assert_allclose(compiled_task.simulate(numpy.array([10., 1.])), expected_results[0])
+                out = numpy.zeros((3, 11))
+                self.assertIs(compiled_task.simulate([5., 2.], out=out), out)
+                numpy.testing.assert_allclose(out, expected_results[1])
+
+            with self.assertRaisesRegex(ValueError, '2 values are required'):
+                compiled_task.simulate([10.])
+
+        self.assertEqual(get_simulation_pool().get_stats()['entries'], 1)
+        with self.assertRaisesRegex(RuntimeError, 'closed'):
+            compiled_task.simulate([10., 1.])
+
+    def _get_computed_constant_simulation(self):
+        task, _ = self._get_simulation()
+        task.model.source = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'computed-constant.cellml'))
+        variables = [
+            Variable(id=name, target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='{}']".format(name),
+                     target_namespaces=self.NAMESPACES, task=task)
+            for name in ['t', 'x', 'double_k']
+        ]
+        return task, variables
+
+    def test_compiled_task_recomputes_computed_constants(self):
+        task, variables = self._get_computed_constant_simulation()
+        k = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='k']"
+
+        for output_start_time in [0., 0.5]:
+            task.simulation.output_start_time = output_start_time
+            with ensemble.CompiledTask(task, variables, [k]) as compiled_task:
+                for value in [3., 5., 3.]:
+                    results = compiled_task.simulate([value])
+                    numpy.testing.assert_allclose(results[2], numpy.full((11,), 2 * value))
+
+            # the values of the parameters are also applied after the changes to the model
+            task.model.changes = [
+                ModelAttributeChange(target=self.X + '/@initial_value', target_namespaces=self.NAMESPACES, new_value='2.'),
+            ]
+            with ensemble.CompiledTask(task, variables, [k]) as compiled_task:
+                for value in [4., 6.]:
+                    results = compiled_task.simulate([value])
+                    numpy.testing.assert_allclose(results[2], numpy.full((11,), 2 * value))
+            task.model.changes = []
+
+    def test_compiled_task_with_parameters_which_define_initial_values(self):
+        task, variables = self._get_computed_constant_simulation()
+        with open(task.model.source, 'r') as file:
+            model = file.read()
+        task.model.source = os.path.join(self.dirname, 'model.cellml')
+        with open(task.model.source, 'w') as file:
+            file.write(model.replace('initial_value="0" name="x"', 'initial_value="k" name="x"'))
+
+        k = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='k']"
+        with self.assertRaisesRegex(ValueError, 'define the initial values'):
+            ensemble.CompiledTask(task, variables, [k])
+
+        # other parameters can still be varied
+        with ensemble.CompiledTask(task, variables, [self.X]) as compiled_task:
+            numpy.testing.assert_allclose(compiled_task.simulate([3.])[1, 0], 3.)
+
+    def test_compiled_task_error_handling(self):
+        task, variables = self._get_simulation()
+        with ensemble.CompiledTask(task, variables, [self.SIGMA]) as compiled_task:
+            with mock.patch('biosimulators_opencor.ensemble.get_opencor_results_index',
+                            return_value={'main/t': 'voi', 'main/x': 'states'}):
+                with self.assertRaisesRegex(ValueError, 'not valid observables'):
+                    compiled_task.simulate([10.])
+
+        task, variables = self._get_simulation()
+        with ensemble.CompiledTask(task, variables, [self.SIGMA]) as compiled_task:
+            with mock.patch('biosimulators_opencor.ensemble.run_opencor_simulation', return_value=False):
+                with self.assertRaisesRegex(RuntimeError, 'failed'):
+                    compiled_task.simulate([10.])
+        self.assertEqual(get_simulation_pool().get_stats()['entries'], 0)
+
+    def test_get_ensemble_chunks(self):
+        self.assertEqual(ensemble.get_ensemble_chunks(10, 2, 4), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(ensemble.get_ensemble_chunks(10, 2), [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10)])
+        self.assertEqual(ensemble.get_ensemble_chunks(3, 8), [(0, 1), (1, 2), (2, 3)])
+        self.assertEqual(ensemble.get_ensemble_chunks(0, 2), [])
+
+    def test_exec_sed_task_ensemble_with_worker_pool(self):
+        task, variables = self._get_simulation()
+        parameter_values = numpy.stack([numpy.linspace(5., 15., 7), numpy.linspace(1., 2., 7)], axis=1)
+
+        expected_results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values,
+                                                           num_workers=1)
+
+        results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values,
+                                                  num_workers=2, chunk_size=3)
+        numpy.testing.assert_allclose(results, expected_results)
+
+        out = numpy.zeros(expected_results.shape)
+        results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values,
+                                                  simulator_config=SimulatorConfig(NUM_WORKERS=2), out=out)
+        self.assertIs(results, out)
+        numpy.testing.assert_allclose(out, expected_results)
+
+        with self.assertRaisesRegex(ValueError, 'shape'):
+            ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values, out=numpy.zeros((1,)))
+
+        # errors in the workers are raised
+        parallel.shutdown_worker_pool()
+        with mock.patch.object(ensemble, 'exec_sed_task_ensemble', side_effect=RuntimeError('OpenCOR failed')):
+            with self.assertRaisesRegex(RuntimeError, 'OpenCOR failed'):
+                ensemble._exec_sed_task_ensemble_in_worker_pool(task, variables, [self.SIGMA, self.X], parameter_values,
+                                                                self.NAMESPACES, out, 2, 3, None, SimulatorConfig())
+
+    def test_exec_sed_task_ensemble_with_worker_pool_retries_crashed_chunks(self):
+        task, variables = self._get_simulation()
+        parameter_values = numpy.stack([numpy.linspace(5., 15., 4), numpy.linspace(1., 2., 4)], axis=1)
+        expected_results = ensemble.exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values,
+                                                           num_workers=1)
+
+        # crash the worker which executes the first chunk the first time it is executed
+        crash_filename = os.path.join(self.dirname, 'crashed')
+        exec_sed_task_ensemble = ensemble.exec_sed_task_ensemble
+
+        def crash_once(task, variables, parameter_targets, parameter_values, **kwargs):
+            if parameter_values[0, 0] == 5. and not os.path.isfile(crash_filename):
+                open(crash_filename, 'w').close()
+                os._exit(1)
+            return exec_sed_task_ensemble(task, variables, parameter_targets, parameter_values, **kwargs)
+
+        parallel.shutdown_worker_pool()
+        with mock.patch.object(ensemble, 'exec_sed_task_ensemble', side_effect=crash_once):
+            results = exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values,
+                                             num_workers=2, chunk_size=2)
+        self.assertTrue(os.path.isfile(crash_filename))
+        numpy.testing.assert_allclose(results, expected_results)
+
+        # chunks whose workers repeatedly crash are not retried indefinitely
+        def crash(*args, **kwargs):
+            os._exit(1)
+
+        parallel.shutdown_worker_pool()
+        with mock.patch.object(ensemble, 'exec_sed_task_ensemble', side_effect=crash):
+            with self.assertRaisesRegex(RuntimeError, 'crashed 2 times'):
+                exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values, num_workers=2, chunk_size=2,
+                                       simulator_config=SimulatorConfig(ENSEMBLE_MAX_RETRIES=1))
+
+    def test_exec_sed_task_ensemble_with_worker_pool_only_retries_crashing_chunks(self):
+        task, variables = self._get_simulation()
+        parameter_values = numpy.stack([numpy.linspace(5., 15., 4), numpy.linspace(1., 2., 4)], axis=1)
+        exec_sed_task_ensemble = ensemble.exec_sed_task_ensemble
+
+        # crash the worker which executes the second chunk, while the other worker executes the first chunk
+        def crash_second_chunk(task, variables, parameter_targets, parameter_values, **kwargs):
+            if parameter_values[0, 0] != 5.:
+                time.sleep(0.1)
+                os._exit(1)
+            time.sleep(0.5)
+            return exec_sed_task_ensemble(task, variables, parameter_targets, parameter_values, **kwargs)
+
+        parallel.shutdown_worker_pool()
+        with mock.patch.object(ensemble, 'exec_sed_task_ensemble', side_effect=crash_second_chunk):
+            with self.assertRaisesRegex(RuntimeError, 'Parameter sets 2 to 3 .* crashed 2 times'):
+                exec_sed_task_ensemble(task, variables, [self.SIGMA, self.X], parameter_values, num_workers=2, chunk_size=2,
+                                       simulator_config=SimulatorConfig(ENSEMBLE_MAX_RETRIES=1))
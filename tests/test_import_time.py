@@ -0,0 +1,120 @@
+""" Tests that importing the package, its methods for executing tasks, and its command-line application doesn't import
+modules which are only needed to execute archives and SED documents, and doesn't take longer than a multiple of the
+time to import the modules of BioSimulators utils which they need
+
+Because the times depend on the machine, they are compared with the time to import these modules of BioSimulators
+utils on the same machine, rather than with absolute times. The times and their ratios are reported by
+``tests/benchmarks/import_time.py``.
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+REFERENCE_MODULES = [
+    'biosimulators_utils.config',
+    'biosimulators_utils.log.data_model',
+    'biosimulators_utils.report.data_model',
+    'biosimulators_utils.sedml.data_model',
+    'biosimulators_utils.utils.core',
+]
+# :obj:`list` of :obj:`str`: modules of BioSimulators utils which the methods for executing tasks import, the time to
+# import which is the reference for the times to import the modules of the package
+
+MAX_IMPORT_TIME_RATIOS = {
+    'biosimulators_opencor': 0.25,
+    'biosimulators_opencor.core': 2.,
+    'biosimulators_opencor.__main__': 2.,
+}
+# :obj:`dict`: dictionary which maps the name of each module to the maximum ratio of the time to import it to the time
+# to import :obj:`REFERENCE_MODULES`
+
+IMPORT_TIME_SCRIPT = '''
+import json
+import time
+start = time.perf_counter()
+import {}
+print(json.dumps(time.perf_counter() - start))
+'''
+
+IMPORTED_MODULES_SCRIPT = '''
+import json
+import sys
+import {}
+print(json.dumps(sorted(sys.modules.keys())))
+'''
+
+
+def get_imported_modules(module):
+    """ Get the modules which are imported by importing a module in a fresh Python process
+
+    Args:
+        module (:obj:`str`): name of the module
+
+    Returns:
+        :obj:`list` of :obj:`str`: names of the modules which were imported
+    """
+    result = subprocess.run([sys.executable, '-c', IMPORTED_MODULES_SCRIPT.format(module)],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return json.loads(result.stdout.decode().strip().split('\n')[-1])
+
+
+def get_import_time(modules, num_repeats=3):
+    """ Measure the time to import modules in fresh Python processes
+
+    Args:
+        modules (:obj:`list` of :obj:`str`): names of the modules
+        num_repeats (:obj:`int`, optional): number of times to measure the time
+
+    Returns:
+        :obj:`float`: minimum duration in seconds
+    """
+    durations = []
+    for _ in range(num_repeats):
+        result = subprocess.run([sys.executable, '-c', IMPORT_TIME_SCRIPT.format(', '.join(modules))],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        durations.append(json.loads(result.stdout.decode().strip().split('\n')[-1]))
+    return min(durations)
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    def test_package(self):
+        modules = get_imported_modules('biosimulators_opencor')
+        self.assertNotIn('biosimulators_opencor.core', modules)
+        self.assertNotIn('biosimulators_utils', modules)
+        self.assertNotIn('opencor', modules)
+
+    def test_core(self):
+        modules = get_imported_modules('biosimulators_opencor.core')
+        for module in [
+            'opencor',
+            'biosimulators_utils.combine.exec',
+            'biosimulators_utils.sedml.exec',
+            'biosimulators_utils.sedml.io',
+            'biosimulators_utils.sedml.utils',
+            'biosimulators_utils.sedml.validation',
+            'biosimulators_utils.report.io',
+            'biosimulators_utils.viz.io',
+            'matplotlib',
+            'pandas',
+        ]:
+            self.assertNotIn(module, modules)
+
+    def test_cli(self):
+        modules = get_imported_modules('biosimulators_opencor.__main__')
+        self.assertNotIn('biosimulators_opencor.core', modules)
+        self.assertNotIn('opencor', modules)
+
+    def test_import_time(self):
+        reference_duration = get_import_time(REFERENCE_MODULES)
+        for module, max_ratio in MAX_IMPORT_TIME_RATIOS.items():
+            duration = get_import_time([module])
+            self.assertLessEqual(duration, max_ratio * reference_duration,
+                                 ('Importing `{}` took {:.3f} s, more than {} times the {:.3f} s to import the modules of '
+                                  'BioSimulators utils which it needs.').format(module, duration, max_ratio, reference_duration))
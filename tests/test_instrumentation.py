@@ -0,0 +1,129 @@
+""" Tests of the measurement of the phases of the execution of SED tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import instrumentation
+from biosimulators_utils.log.data_model import CombineArchiveLog, SedDocumentLog, TaskLog
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_rss(self):
+        self.assertGreater(instrumentation.get_rss(), 0)
+
+        # unlike the peak, the current resident set size reflects memory which was released
+        rss = instrumentation.get_rss()
+        data = bytearray(64 * 1024 * 1024)
+        self.assertGreater(instrumentation.get_rss(), rss + 32 * 1024 * 1024)
+        del data
+        self.assertLess(instrumentation.get_rss(), rss + 32 * 1024 * 1024)
+
+    def test_get_peak_rss(self):
+        self.assertGreater(instrumentation.get_peak_rss(), 0)
+
+    def test_phase_timer(self):
+        timer = instrumentation.PhaseTimer()
+        for _ in range(2):
+            with timer.measure('run'):
+                sum(range(1000))
+        with self.assertRaises(ValueError):
+            with timer.measure('extractResults'):
+                raise ValueError()
+
+        phases = timer.to_dict()
+        self.assertEqual(set(phases.keys()), set(['run', 'extractResults']))
+        self.assertEqual(phases['run']['count'], 2)
+        self.assertGreater(phases['run']['wallTime'], 0.)
+        self.assertGreaterEqual(phases['run']['cpuTime'], 0.)
+        self.assertIsInstance(phases['run']['rssDelta'], int)
+        self.assertGreater(phases['run']['processPeakRss'], 0)
+
+        # the change of the resident set size is specific to each phase
+        data = []
+        with timer.measure('allocate'):
+            data.append(bytearray(64 * 1024 * 1024))
+        with timer.measure('release'):
+            data.pop()
+        phases = timer.to_dict()
+        self.assertGreater(phases['allocate']['rssDelta'], 32 * 1024 * 1024)
+        self.assertLess(phases['release']['rssDelta'], -32 * 1024 * 1024)
+
+        phases['run']['count'] = 0
+        self.assertEqual(timer.phases['run']['count'], 2)
+
+    def test_summarize_task_phases(self):
+        log = CombineArchiveLog(sed_documents={
+            'doc_1': SedDocumentLog(tasks={
+                'task_1': TaskLog(simulator_details={'phases': {
+                    'load': {'count': 1, 'wallTime': 2., 'cpuTime': 1., 'rssDelta': 10, 'processPeakRss': 100},
+                    'run': {'count': 1, 'wallTime': 3., 'cpuTime': 3., 'rssDelta': -20, 'processPeakRss': 200},
+                }}),
+                'task_2': TaskLog(simulator_details={'phases': {
+                    'run': {'count': 2, 'wallTime': 4., 'cpuTime': 2., 'rssDelta': -30, 'processPeakRss': 150},
+                }}),
+                'task_3': TaskLog(),
+                'task_4': None,
+            }),
+            'doc_2': None,
+        })
+
+        self.assertEqual(instrumentation.summarize_task_phases(log), {
+            'numTasks': 2,
+            'wallTime': 9.,
+            'cpuTime': 6.,
+            'phases': {
+                'load': {'count': 1, 'wallTime': 2., 'cpuTime': 1., 'maxRssDelta': 10, 'processPeakRss': 100},
+                'run': {'count': 3, 'wallTime': 7., 'cpuTime': 5., 'maxRssDelta': -20, 'processPeakRss': 200},
+            },
+        })
+
+        out_dir = os.path.join(self.dirname, 'out')
+        filename = instrumentation.write_task_phases_summary(log, out_dir)
+        self.assertEqual(filename, os.path.join(out_dir, instrumentation.PHASES_SUMMARY_FILENAME))
+        with open(filename, 'r') as file:
+            self.assertEqual(json.load(file)['numTasks'], 2)
+
+    def test_summarize_solver_settings(self):
+        log = CombineArchiveLog(sed_documents={
+            'doc_1': SedDocumentLog(tasks={
+                'task_1': TaskLog(simulator_details={
+                    'solverSettings': {'solver': 'CVODE', 'configuredLinearSolver': 'Dense'},
+                    'phases': {'run': {'count': 1, 'wallTime': 2.}},
+                }),
+                'task_2': TaskLog(simulator_details={
+                    'solverSettings': {'solver': 'CVODE', 'configuredLinearSolver': 'GMRES'},
+                    'phases': {'run': {'count': 1, 'wallTime': 3.}},
+                }),
+                'task_3': TaskLog(simulator_details={
+                    'solverSettings': {'solver': 'Forward Euler'},
+                    'phases': {'run': {'count': 1, 'wallTime': 1.}},
+                }),
+                'task_4': TaskLog(simulator_details={'solverSettings': {'solver': 'Forward Euler'}}),
+                'task_5': TaskLog(),
+            }),
+        })
+
+        self.assertEqual(instrumentation.summarize_solver_settings(log), {
+            'CVODE': {'numTasks': 2, 'configuredLinearSolvers': ['Dense', 'GMRES'], 'runTime': 5., 'maxRunTime': 3.},
+            'Forward Euler': {'numTasks': 2, 'configuredLinearSolvers': [], 'runTime': 1., 'maxRunTime': 1.},
+        })
+
+        out_dir = os.path.join(self.dirname, 'out')
+        filename = instrumentation.write_solver_settings_summary(log, out_dir)
+        self.assertEqual(filename, os.path.join(out_dir, instrumentation.SOLVER_SETTINGS_SUMMARY_FILENAME))
+        with open(filename, 'r') as file:
+            self.assertEqual(json.load(file)['CVODE']['numTasks'], 2)
@@ -0,0 +1,62 @@
+""" Tests of the index of CellML models
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import model_index
+from biosimulators_opencor.utils import get_opencor_name
+import lxml.etree
+import os
+import unittest
+
+
+class ModelIndexTestCase(unittest.TestCase):
+    MODEL_FILENAME = os.path.join(os.path.dirname(__file__), 'fixtures', 'lorenz.cellml')
+    NAMESPACES = {
+        None: 'http://sed-ml.org/sed-ml/level1/version3',
+        'cellml': 'http://www.cellml.org/cellml/1.0#',
+    }
+
+    def test_get_compiled_xpath(self):
+        xpath = model_index.get_compiled_xpath('/cellml:model', self.NAMESPACES)
+        self.assertIsInstance(xpath, lxml.etree.XPath)
+        self.assertIs(model_index.get_compiled_xpath('/cellml:model', dict(reversed(list(self.NAMESPACES.items())))), xpath)
+        self.assertIsNot(model_index.get_compiled_xpath('/cellml:model/cellml:component', self.NAMESPACES), xpath)
+
+        with self.assertRaises(lxml.etree.XPathError):
+            model_index.get_compiled_xpath('/cellml:model[', self.NAMESPACES)
+
+    def test_index(self):
+        model_etree = lxml.etree.parse(self.MODEL_FILENAME)
+        index = model_index.CellmlModelIndex(model_etree)
+
+        variables = model_etree.xpath('/cellml:model/cellml:component/cellml:variable', namespaces={'cellml': self.NAMESPACES['cellml']})
+        self.assertEqual(len(index.names), len(variables))
+        for variable in variables:
+            self.assertEqual(index.get_name(variable), get_opencor_name(variable))
+        self.assertEqual(index.get_name(model_etree.getroot()), None)
+
+        target = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']"
+        xml_objs = index.xpath(target, self.NAMESPACES)
+        self.assertEqual(len(xml_objs), 1)
+        self.assertEqual(index.get_name(xml_objs[0]), 'main/x')
+        self.assertIs(index.xpath(target, self.NAMESPACES), xml_objs)
+        self.assertGreater(index.estimate_size(), 0)
+        self.assertFalse(index.has_variable_initial_values)
+        self.assertEqual(index.initial_value_names, set())
+
+        xml_objs[0].attrib['initial_value'] = 'sigma'
+        index = model_index.CellmlModelIndex(model_etree)
+        self.assertTrue(index.has_variable_initial_values)
+        self.assertEqual(index.initial_value_names, set(['main/sigma']))
+
+    def test_get_cellml_model_index(self):
+        model_etree = lxml.etree.parse(self.MODEL_FILENAME)
+        index = model_index.get_cellml_model_index(model_etree)
+        self.assertIs(model_index.get_cellml_model_index(model_etree), index)
+
+        other_model_etree = lxml.etree.parse(self.MODEL_FILENAME)
+        self.assertIsNot(model_index.get_cellml_model_index(other_model_etree), index)
@@ -0,0 +1,127 @@
+""" Tests of the parallel execution of tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import parallel
+from biosimulators_utils.sedml import data_model as sedml_data_model
+from biosimulators_utils.warnings import BioSimulatorsWarning
+import concurrent.futures
+import concurrent.futures.process
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+
+class ParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        with open(os.path.join(self.dirname, 'model.cellml'), 'w') as file:
+            file.write('<model/>')
+
+    def tearDown(self):
+        parallel.shutdown_worker_pool()
+        shutil.rmtree(self.dirname)
+
+    def _build_sed_doc(self):
+        model = sedml_data_model.Model(id='model', source='model.cellml', language=sedml_data_model.ModelLanguage.CellML.value)
+        other_model = sedml_data_model.Model(id='other_model', source='#model', language=sedml_data_model.ModelLanguage.CellML.value)
+        sim = sedml_data_model.UniformTimeCourseSimulation(id='sim')
+        task_1 = sedml_data_model.Task(id='task_1', model=model, simulation=sim)
+        task_2 = sedml_data_model.Task(id='task_2', model=other_model, simulation=sim)
+        task_3 = sedml_data_model.Task(id='task_3', model=model, simulation=sim)
+        repeated_task = sedml_data_model.RepeatedTask(id='repeated_task', sub_tasks=[sedml_data_model.SubTask(task=task_3)])
+        data_gen_1 = sedml_data_model.DataGenerator(id='data_gen_1', variables=[sedml_data_model.Variable(id='var_1', task=task_1)])
+        data_gen_2 = sedml_data_model.DataGenerator(id='data_gen_2', variables=[sedml_data_model.Variable(id='var_2', task=repeated_task)])
+        report = sedml_data_model.Report(id='report', data_sets=[
+            sedml_data_model.DataSet(id='data_set_1', data_generator=data_gen_1),
+        ])
+        plot = sedml_data_model.Plot2D(id='plot', curves=[
+            sedml_data_model.Curve(id='curve', x_data_generator=data_gen_1, y_data_generator=data_gen_2),
+        ])
+        return sedml_data_model.SedDocument(
+            models=[model, other_model],
+            simulations=[sim],
+            tasks=[task_1, task_2, task_3, repeated_task],
+            data_generators=[data_gen_1, data_gen_2],
+            outputs=[report, plot],
+        )
+
+    def test_get_sed_doc_dependency_graph(self):
+        graph = parallel.get_sed_doc_dependency_graph(self._build_sed_doc())
+        self.assertEqual(graph, {
+            ('task', 'task_1'): set(),
+            ('task', 'task_2'): set(),
+            ('task', 'task_3'): set(),
+            ('task', 'repeated_task'): set([('task', 'task_3')]),
+            ('data_generator', 'data_gen_1'): set([('task', 'task_1')]),
+            ('data_generator', 'data_gen_2'): set([('task', 'repeated_task')]),
+            ('output', 'report'): set([('data_generator', 'data_gen_1')]),
+            ('output', 'plot'): set([('data_generator', 'data_gen_1'), ('data_generator', 'data_gen_2')]),
+        })
+
+    def test_get_independent_tasks(self):
+        doc = self._build_sed_doc()
+        self.assertEqual([task.id for task in parallel.get_independent_tasks(doc, self.dirname)], ['task_1', 'task_3'])
+
+        doc.models[0].changes.append(sedml_data_model.AddElementModelChange(target='/model', new_elements='<component/>'))
+        self.assertEqual(parallel.get_independent_tasks(doc, self.dirname), [])
+
+    def test_get_worker_pool(self):
+        pool = parallel.get_worker_pool(2)
+        self.assertIs(parallel.get_worker_pool(2), pool)
+        self.assertIsNot(parallel.get_worker_pool(3), pool)
+
+        # forked children don't inherit the shared pool
+        pool = parallel.get_worker_pool(2)
+        self.assertFalse(pool.submit(_has_shared_worker_pool).result())
+        self.assertTrue(_has_shared_worker_pool())
+
+    def test_get_worker_pool_replaces_broken_pool(self):
+        pool = parallel.get_worker_pool(2)
+        with self.assertRaises(concurrent.futures.process.BrokenProcessPool):
+            pool.submit(os._exit, 1).result()
+        self.assertTrue(parallel.is_worker_pool_broken(pool))
+
+        new_pool = parallel.get_worker_pool(2)
+        self.assertIsNot(new_pool, pool)
+        self.assertFalse(parallel.is_worker_pool_broken(new_pool))
+        self.assertEqual(new_pool.submit(abs, -1).result(), 1)
+
+    def test_create_worker_pool(self):
+        with parallel.create_worker_pool(2, initializer=_set_worker_state, initargs=('initialized',)) as pool:
+            self.assertEqual(len(pool._processes), 2)
+            self.assertEqual(set(pool.map(_get_worker_state, range(4))), set(['initialized']))
+        self.assertEqual(_worker_state, None)
+
+        # creating pools while other threads are running is unsafe
+        event = threading.Event()
+        thread = threading.Thread(target=event.wait)
+        thread.start()
+        try:
+            with self.assertWarnsRegex(BioSimulatorsWarning, 'other threads'):
+                parallel.create_worker_pool(1).shutdown()
+        finally:
+            event.set()
+            thread.join()
+
+
+_worker_state = None
+
+
+def _set_worker_state(state):
+    global _worker_state
+    _worker_state = state
+
+
+def _get_worker_state(_):
+    return _worker_state
+
+
+def _has_shared_worker_pool():
+    return parallel._worker_pool is not None
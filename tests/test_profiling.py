@@ -0,0 +1,71 @@
+""" Tests of the profiling of the execution of SED tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import profiling
+from biosimulators_utils.sedml.data_model import Task
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_profiles_dirname(self):
+        self.assertEqual(profiling.get_profiles_dirname('out'), os.path.join('out', 'profiles'))
+        self.assertEqual(profiling.get_profiles_dirname('out', 'dir/sim.sedml'), os.path.join('out', 'dir/sim.sedml', 'profiles'))
+
+    def test_profile_task(self):
+        dirname = os.path.join(self.dirname, 'profiles')
+        with profiling.profile_task('task_1', dirname):
+            sorted(range(1000), key=lambda i: -i)
+
+        self.assertEqual(sorted(os.listdir(dirname)), ['task_1.json', 'task_1.prof'])
+        self.assertGreater(pstats.Stats(os.path.join(dirname, 'task_1.prof')).total_calls, 0)
+        with open(os.path.join(dirname, 'task_1.json'), 'r') as file:
+            summary = json.load(file)
+        self.assertEqual(summary['task'], 'task_1')
+        self.assertEqual(summary['profile'], 'task_1.prof')
+        self.assertGreater(summary['duration'], 0.)
+        self.assertLessEqual(len(summary['functions']), profiling.NUM_PROFILED_FUNCTIONS)
+        self.assertNotIn('memory', summary)
+
+        # profiles of repeated executions of the same task are saved to separate files
+        with self.assertRaises(ValueError):
+            with profiling.profile_task('task_1', dirname, memory=True):
+                values = [float(i) for i in range(10000)]
+                raise ValueError(len(values))
+        self.assertFalse(tracemalloc.is_tracing())
+
+        self.assertEqual(sorted(os.listdir(dirname)), ['task_1-2.json', 'task_1-2.prof', 'task_1.json', 'task_1.prof'])
+        with open(os.path.join(dirname, 'task_1-2.json'), 'r') as file:
+            summary = json.load(file)
+        self.assertGreater(summary['memory']['peak'], 0)
+        self.assertGreater(len(summary['memory']['allocations']), 0)
+
+    def test_get_profile_filename(self):
+        # paths are reserved, so that processes which profile the same task concurrently don't overwrite each other
+        self.assertEqual(profiling.get_profile_filename(self.dirname, 'task_1'), os.path.join(self.dirname, 'task_1'))
+        self.assertEqual(profiling.get_profile_filename(self.dirname, 'task_1'), os.path.join(self.dirname, 'task_1-2'))
+        self.assertEqual(sorted(os.listdir(self.dirname)), ['task_1-2.prof', 'task_1.prof'])
+
+    def test_profile_task_executer(self):
+        def exec_task(task, variables, log=None):
+            return variables, log
+
+        exec_and_profile_task = profiling.profile_task_executer(exec_task, self.dirname)
+        self.assertEqual(exec_and_profile_task(Task(id='task_1'), ['x'], log='log'), (['x'], 'log'))
+        self.assertTrue(os.path.isfile(os.path.join(self.dirname, 'task_1.prof')))
@@ -0,0 +1,72 @@
+""" Tests of streaming the results of time courses to HDF5 files
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import streaming
+from biosimulators_utils.report.data_model import VariableResults
+from biosimulators_utils.sedml.data_model import UniformTimeCourseSimulation, Variable
+import numpy
+import numpy.testing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class StreamingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_simulation_segments(self):
+        sim = UniformTimeCourseSimulation(initial_time=0., output_start_time=2., output_end_time=12., number_of_steps=25)
+
+        segments = streaming.get_simulation_segments(sim, 10)
+        self.assertEqual([segment.number_of_steps for segment in segments], [10, 10, 5])
+        self.assertEqual([segment.initial_time for segment in segments], [0., 6., 10.])
+        self.assertEqual([segment.output_start_time for segment in segments], [2., 6., 10.])
+        self.assertEqual([segment.output_end_time for segment in segments], [6., 10., 12.])
+
+        times = numpy.concatenate([numpy.linspace(segments[0].output_start_time, segments[0].output_end_time, 11)] + [
+            numpy.linspace(segment.output_start_time, segment.output_end_time, segment.number_of_steps + 1)[1:]
+            for segment in segments[1:]
+        ])
+        numpy.testing.assert_allclose(times, numpy.linspace(2., 12., 26))
+
+        segments = streaming.get_simulation_segments(sim, 25)
+        self.assertEqual(len(segments), 1)
+        self.assertIsNot(segments[0], sim)
+        self.assertEqual(segments[0].number_of_steps, 25)
+
+    def test_write_read(self):
+        variables = [
+            Variable(id='t', symbol='urn:sedml:symbol:time'),
+            Variable(id='x', target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']"),
+        ]
+        filename = os.path.join(self.dirname, 'results.h5')
+
+        with streaming.Hdf5VariableResultsWriter(filename, variables, 4) as writer:
+            writer.append(VariableResults(t=numpy.array([0., 1., 2.]), x=numpy.array([3., 4., 5.])))
+            writer.append(VariableResults(t=numpy.array([3., 4.]), x=numpy.array([6., 7.])))
+            self.assertEqual(writer.num_points, 5)
+
+        with streaming.read_streamed_variable_results(filename, variables) as results:
+            numpy.testing.assert_allclose(results['t'][:], numpy.arange(5.))
+            numpy.testing.assert_allclose(results['x'][:], numpy.arange(3., 8.))
+            self.assertEqual(results['x'].chunks, (4,))
+            self.assertEqual(results['t'].attrs['symbol'], 'urn:sedml:symbol:time')
+            self.assertEqual(results['x'].attrs['target'], variables[1].target)
+
+        # the file is closed once the results have been read
+        self.assertFalse(results['t'].id.valid)
+
+        streamed_results = streaming.StreamedVariableResults(filename, variables, 5)
+        with streamed_results.open() as results:
+            numpy.testing.assert_allclose(results['x'][:], numpy.arange(3., 8.))
+        self.assertFalse(results['x'].id.valid)
@@ -0,0 +1,73 @@
+""" Tests of the tracing of the execution of archives, SED documents, and tasks
+
+:Author: BioSimulators Team <info@biosimulators.org>
+:Date: 2026-10-17
+:Copyright: 2026, BioSimulators Team
+:License: MIT
+"""
+
+from biosimulators_opencor import tracing
+from biosimulators_opencor.config import SimulatorConfig
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TracingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        tracing.set_tracer(None)
+        shutil.rmtree(self.dirname)
+
+    def test_tracer(self):
+        filename = os.path.join(self.dirname, 'trace.jsonl')
+        tracer = tracing.Tracer(filename)
+        with tracer.span('task', task='task_1') as attributes:
+            attributes['algorithm'] = 'KISAO_0000019'
+            with tracer.span('run'):
+                pass
+            with self.assertRaises(ValueError):
+                with tracer.span('extractResults'):
+                    raise ValueError()
+
+        run, extract_results, task = tracing.read_trace(filename)
+        self.assertEqual([run['name'], extract_results['name'], task['name']], ['run', 'extractResults', 'task'])
+        self.assertEqual(task['ph'], 'X')
+        self.assertEqual(task['pid'], os.getpid())
+        self.assertEqual(task['args']['task'], 'task_1')
+        self.assertEqual(task['args']['algorithm'], 'KISAO_0000019')
+        self.assertNotIn('parentId', task['args'])
+        self.assertEqual(run['args']['parentId'], task['args']['spanId'])
+        self.assertEqual(extract_results['args']['parentId'], task['args']['spanId'])
+        self.assertEqual(extract_results['args']['error'], 'ValueError')
+        self.assertGreaterEqual(run['ts'], task['ts'])
+        self.assertGreaterEqual(task['dur'], run['dur'])
+
+        out_filename = os.path.join(self.dirname, 'trace.json')
+        tracing.export_chrome_trace(filename, out_filename)
+        with open(out_filename, 'r') as file:
+            events = json.load(file)['traceEvents']
+        self.assertEqual(events[0]['name'], 'task')
+        self.assertEqual(len(events), 3)
+
+    def test_get_tracer(self):
+        tracing.set_tracer(None)
+        self.assertIsNone(tracing.get_tracer())
+        with tracing.trace_span('task', task='task_1') as attributes:
+            attributes['algorithm'] = 'KISAO_0000019'
+
+        filename = os.path.join(self.dirname, 'trace.jsonl')
+        tracer = tracing.get_tracer(SimulatorConfig(TRACE_FILENAME=filename))
+        self.assertEqual(tracer.filename, filename)
+        self.assertIs(tracing.get_tracer(), tracer)
+        self.assertIs(tracing.get_tracer(SimulatorConfig(TRACE_FILENAME=filename)), tracer)
+
+        with tracing.trace_span('task', task='task_1'):
+            pass
+        self.assertEqual([span['name'] for span in tracing.read_trace(filename)], ['task'])
+
+        self.assertIsNone(tracing.get_tracer(SimulatorConfig()))
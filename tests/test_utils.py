@@ -1,10 +1,12 @@
+import biosimulators_opencor
 from biosimulators_opencor import get_simulator_version
 from biosimulators_opencor import utils
 from biosimulators_opencor.data_model import KISAO_ALGORITHM_MAP, CvodeIterationType, CvodeIntegrationMethod
 from biosimulators_utils.log.data_model import TaskLog
 from biosimulators_utils.sedml.data_model import (SedDocument, Model, ModelLanguage, UniformTimeCourseSimulation, Task,
-                                                  RepeatedTask, VectorRange, SubTask,
-                                                  Algorithm, AlgorithmParameterChange, DataGenerator, Variable, Symbol)
+                                                  RepeatedTask, VectorRange, FunctionalRange, SubTask,
+                                                  Algorithm, AlgorithmParameterChange, DataGenerator, Variable, Symbol,
+                                                  ModelAttributeChange, RemoveElementModelChange, SetValueComputeModelChange)
 from biosimulators_utils.sedml.io import SedmlSimulationReader, SedmlSimulationWriter
 from biosimulators_utils.warnings import BioSimulatorsWarning
 from kisao.exceptions import AlgorithmCannotBeSubstitutedException
@@ -16,6 +18,7 @@ import numpy
 import numpy.testing
 import opencor
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -27,14 +30,40 @@ class TestCase(unittest.TestCase):
     }
 
     def test_get_simulator_version(self):
-        version = get_simulator_version()
-        self.assertIsInstance(version, str)
-        self.assertNotEqual(version, '')
-        self.assertNotIn('\n', version)
-
-        with self.assertRaises(RuntimeError):
-            with mock.patch('subprocess.run', return_value=mock.Mock(returncode=1, stderr=mock.Mock(decode=lambda: 'error'))):
-                get_simulator_version()
+        cache_dirname = tempfile.mkdtemp()
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_dirname}):
+            with mock.patch('biosimulators_opencor._simulator_version', None):
+                with mock.patch('biosimulators_opencor.get_simulator_version_from_module', return_value=None):
+                    version = get_simulator_version()
+            self.assertIsInstance(version, str)
+            self.assertNotEqual(version, '')
+            self.assertNotIn('\n', version)
+
+            # version is read from the on-disk cache
+            self.assertTrue(os.path.isfile(biosimulators_opencor.get_simulator_version_cache_filename()))
+            with mock.patch('biosimulators_opencor._simulator_version', None):
+                with mock.patch('biosimulators_opencor.get_simulator_version_from_module', return_value=None):
+                    with mock.patch('subprocess.run', side_effect=Exception('OpenCOR should not be run')):
+                        self.assertEqual(get_simulator_version(), version)
+
+            # on-disk cache is invalidated when OpenCOR changes
+            cache = biosimulators_opencor.read_simulator_version_cache()
+            for executable in cache:
+                cache[executable]['mtime'] -= 1
+            biosimulators_opencor.write_simulator_version_cache(cache)
+            with self.assertRaises(RuntimeError):
+                with mock.patch('biosimulators_opencor._simulator_version', None):
+                    with mock.patch('biosimulators_opencor.get_simulator_version_from_module', return_value=None):
+                        with mock.patch('subprocess.run', return_value=mock.Mock(returncode=1,
+                                                                                 stderr=mock.Mock(decode=lambda: 'error'))):
+                            get_simulator_version()
+        shutil.rmtree(cache_dirname)
+
+        # version is read from the opencor module
+        with mock.patch('biosimulators_opencor._simulator_version', None):
+            with mock.patch.dict('sys.modules', opencor=mock.Mock(version=lambda: '2021-05-19')):
+                with mock.patch('subprocess.run', side_effect=Exception('OpenCOR should not be run')):
+                    self.assertEqual(get_simulator_version(), '2021-05-19')
 
     def test_get_opencor_parameter_value(self):
         param_specs = KISAO_ALGORITHM_MAP['KISAO_0000019']['parameters']
@@ -77,6 +106,43 @@ class TestCase(unittest.TestCase):
         self.assertEqual(utils.get_opencor_parameter_value(
             'x', param_specs['KISAO_0000475']['type'], CvodeIntegrationMethod), (False, None))
 
+    def test_validate_simulation(self):
+        sim = UniformTimeCourseSimulation(initial_time=0., output_start_time=5., output_end_time=10., number_of_steps=10)
+
+        opencor_sim = utils.validate_simulation(sim)
+        self.assertEqual((opencor_sim.output_start_time, opencor_sim.number_of_steps), (5., 10))
+
+        opencor_sim = utils.validate_simulation(sim, skip_transient_output=False)
+        self.assertEqual((opencor_sim.output_start_time, opencor_sim.number_of_steps), (0., 20))
+
+        sim.output_start_time = 5.1
+        opencor_sim = utils.validate_simulation(sim, skip_transient_output=False)
+        self.assertEqual((opencor_sim.output_start_time, opencor_sim.number_of_steps), (5.1, 10))
+
+    def test_run_opencor_simulation(self):
+        task, variables = self._get_simulation()
+        task.simulation.initial_time = 0.
+        task.simulation.output_start_time = 5.
+        task.simulation.output_end_time = 10.
+        task.simulation.number_of_steps = 10
+        model_etree = lxml.etree.parse(task.model.source)
+        variable_names = utils.validate_variable_xpaths(variables, model_etree)
+
+        opencor_sim = utils.load_opencor_simulation(task, variables)
+        self.assertTrue(utils.run_opencor_simulation(opencor_sim, task.simulation))
+        results = utils.get_results_from_opencor_simulation(opencor_sim, task, variables, variable_names)
+        self.assertEqual(opencor_sim.results().voi().values().shape, (11,))
+        numpy.testing.assert_allclose(results['t'], numpy.linspace(5., 10., 11))
+
+        full_task = copy.deepcopy(task)
+        full_task.simulation = utils.validate_simulation(task.simulation, skip_transient_output=False)
+        opencor_sim = utils.load_opencor_simulation(full_task, variables)
+        self.assertTrue(utils.run_opencor_simulation(opencor_sim, full_task.simulation))
+        full_results = utils.get_results_from_opencor_simulation(opencor_sim, task, variables, variable_names)
+        self.assertEqual(opencor_sim.results().voi().values().shape, (21,))
+        for variable in variables:
+            numpy.testing.assert_allclose(results[variable.id], full_results[variable.id], rtol=1e-3)
+
     def test_get_opencor_algorithm(self):
         alg = Algorithm(kisao_id='KISAO_0000019', changes=[
             AlgorithmParameterChange(kisao_id='KISAO_0000467', new_value='1.0'),
@@ -172,6 +238,104 @@ class TestCase(unittest.TestCase):
         with self.assertRaisesRegex(NotImplementedError, 'Symbols are not supported.'):
             utils.validate_variable_xpaths(variables, model_etree)
 
+    def test_get_opencor_model_change_values(self):
+        task, _ = self._get_simulation()
+        model_etree = lxml.etree.parse(task.model.source)
+        target = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='{}']/@initial_value"
+
+        changes = [
+            ModelAttributeChange(target=target.format('x'), target_namespaces=self.NAMESPACES, new_value='2.5'),
+            ModelAttributeChange(target=target.format('sigma'), target_namespaces=self.NAMESPACES, new_value=3),
+        ]
+        self.assertEqual(utils.get_opencor_model_change_values(changes, model_etree), {
+            'main/x': 2.5,
+            'main/sigma': 3.,
+        })
+
+        changes[1].new_value = 'sigma_2'
+        self.assertEqual(utils.get_opencor_model_change_values(changes, model_etree), None)
+
+        changes[1].new_value = '3'
+        changes[1].target = target.format('undefined')
+        self.assertEqual(utils.get_opencor_model_change_values(changes, model_etree), None)
+
+        changes[1].target = "/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@units"
+        self.assertEqual(utils.get_opencor_model_change_values(changes, model_etree), None)
+
+        changes[1].target = "/cellml:model/cellml:component[@name='main']/@initial_value"
+        self.assertEqual(utils.get_opencor_model_change_values(changes, model_etree), None)
+
+        self.assertEqual(utils.get_opencor_model_change_values([], model_etree), {})
+
+    def test_is_repeated_task_executable_with_single_simulation(self):
+        task, _ = self._get_simulation()
+        task_range = VectorRange(id='range', values=[1., 2.])
+        repeated_task = RepeatedTask(
+            range=task_range,
+            changes=[
+                SetValueComputeModelChange(
+                    model=task.model,
+                    target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+                    target_namespaces=self.NAMESPACES,
+                    range=task_range,
+                    math='range',
+                ),
+            ],
+            sub_tasks=[SubTask(order=1, task=task)],
+        )
+        self.assertTrue(utils.is_repeated_task_executable_with_single_simulation(repeated_task))
+
+        repeated_task.changes[0].variables.append(Variable(id='x', target=repeated_task.changes[0].target, task=task))
+        self.assertFalse(utils.is_repeated_task_executable_with_single_simulation(repeated_task))
+        repeated_task.changes[0].variables = []
+
+        repeated_task.changes[0].model = copy.deepcopy(task.model)
+        self.assertFalse(utils.is_repeated_task_executable_with_single_simulation(repeated_task))
+        repeated_task.changes[0].model = task.model
+
+        repeated_task.sub_tasks.append(SubTask(order=2, task=task))
+        self.assertFalse(utils.is_repeated_task_executable_with_single_simulation(repeated_task))
+        repeated_task.sub_tasks.pop()
+
+        repeated_task.sub_tasks[0].task = RepeatedTask(sub_tasks=[SubTask(order=1, task=task)])
+        self.assertFalse(utils.is_repeated_task_executable_with_single_simulation(repeated_task))
+
+    def test_are_model_changes_applicable_to_simulations(self):
+        task, _ = self._get_simulation()
+        task.model.changes.append(ModelAttributeChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+            target_namespaces=self.NAMESPACES,
+            new_value='2'))
+        task_range = FunctionalRange(id='range', range=VectorRange(id='values', values=[1., 2.]), math='values')
+        repeated_task = RepeatedTask(
+            range=task_range,
+            changes=[
+                SetValueComputeModelChange(
+                    model=task.model,
+                    target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='x']/@initial_value",
+                    target_namespaces=self.NAMESPACES,
+                    range=task_range,
+                    math='range',
+                ),
+            ],
+            sub_tasks=[SubTask(order=1, task=task)],
+        )
+        doc = SedDocument(models=[task.model], tasks=[task, repeated_task])
+        self.assertTrue(utils.are_model_changes_applicable_to_simulations(doc))
+
+        repeated_task.changes[0].variables.append(Variable(id='x', target=repeated_task.changes[0].target, task=task))
+        self.assertFalse(utils.are_model_changes_applicable_to_simulations(doc))
+        repeated_task.changes[0].variables = []
+
+        task_range.variables.append(Variable(id='x', target=repeated_task.changes[0].target, task=task))
+        self.assertFalse(utils.are_model_changes_applicable_to_simulations(doc))
+        task_range.variables = []
+
+        task.model.changes.append(RemoveElementModelChange(
+            target="/cellml:model/cellml:component[@name='main']/cellml:variable[@name='beta']",
+            target_namespaces=self.NAMESPACES))
+        self.assertFalse(utils.are_model_changes_applicable_to_simulations(doc))
+
     def test_validate_task(self):
         task, variables = self._get_simulation()
         actual_task, model_etree, opencor_variable_names = utils.validate_task(task, variables)
@@ -188,8 +352,9 @@ class TestCase(unittest.TestCase):
 
         task, variables = self._get_simulation()
         task.simulation.output_start_time = 5.1
-        with self.assertRaisesRegex(NotImplementedError, 'Number of steps must be an integer'):
-            utils.validate_task(task, variables)
+        opencor_task, _, _ = utils.validate_task(task, variables)
+        self.assertEqual(opencor_task.simulation.output_start_time, 5.1)
+        self.assertEqual(opencor_task.simulation.number_of_steps, task.simulation.number_of_steps)
 
         task, variables = self._get_simulation()
         variables[0].task = None
@@ -265,6 +430,128 @@ class TestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             utils.validate_opencor_simulation(sim)
 
+    def test_load_opencor_simulation_without_sedml(self):
+        task, variables = self._get_simulation()
+        task.simulation.algorithm = utils.get_opencor_algorithm(task.simulation.algorithm)
+
+        with mock.patch.object(utils, 'save_task_to_opencor_sedml_file') as save_task_to_opencor_sedml_file:
+            with mock.patch.object(utils, 'configure_opencor_simulation_algorithm') as configure_opencor_simulation_algorithm:
+                opencor_sim = utils.load_opencor_simulation(task, variables)
+        save_task_to_opencor_sedml_file.assert_not_called()
+        configure_opencor_simulation_algorithm.assert_called_once_with(opencor_sim, task.simulation.algorithm)
+
+    def test_load_opencor_simulation_opens_independent_simulations(self):
+        task, variables = self._get_simulation()
+        task.simulation.algorithm = utils.get_opencor_algorithm(task.simulation.algorithm)
+        with open(task.model.source, 'rb') as file:
+            model = file.read()
+
+        # OpenCOR keeps one simulation for each file, so each simulation is opened through a separate copy of the model
+        filenames = []
+        base_open_simulation = opencor.open_simulation
+
+        def open_simulation(filename):
+            with open(filename, 'rb') as file:
+                self.assertEqual(file.read(), model)
+            filenames.append(filename)
+            return base_open_simulation(filename)
+
+        with mock.patch('opencor.open_simulation', side_effect=open_simulation):
+            utils.load_opencor_simulation(task, variables)
+            utils.load_opencor_simulation(task, variables)
+        self.assertEqual(len(set(filenames)), 2)
+        for filename in filenames:
+            # the model doesn't import other files, so it is copied into the system temporary directory
+            self.assertEqual(os.path.dirname(filename), tempfile.gettempdir())
+            self.assertFalse(os.path.isfile(filename))
+
+    def test_copy_model_file(self):
+        fixture_dirname = os.path.join(os.path.dirname(__file__), 'fixtures', 'imported-model-file-pmr-e-2ca')
+        temp_dirname = tempfile.mkdtemp()
+        dirname = os.path.join(temp_dirname, 'model')
+        shutil.copytree(fixture_dirname, dirname)
+        model_filename = os.path.join(dirname, 'HATPase_test.cellml')
+
+        try:
+            # models which import other files by relative paths are copied into their directories
+            filename = utils.copy_model_file(model_filename)
+            os.remove(filename)
+            self.assertEqual(os.path.dirname(filename), dirname)
+            self.assertTrue(filename.endswith('.cellml'))
+
+            # unless their directories can't be written
+            base_mkstemp = tempfile.mkstemp
+
+            def mkstemp(suffix=None, dir=None):
+                if dir == dirname:
+                    raise PermissionError('read-only directory')
+                return base_mkstemp(suffix=suffix, dir=dir)
+
+            with mock.patch('tempfile.mkstemp', side_effect=mkstemp):
+                filename = utils.copy_model_file(model_filename)
+            with open(filename, 'rb') as file, open(model_filename, 'rb') as model_file:
+                self.assertEqual(file.read(), model_file.read())
+            os.remove(filename)
+            self.assertEqual(os.path.dirname(filename), tempfile.gettempdir())
+
+            self.assertEqual(sorted(os.listdir(dirname)), sorted(os.listdir(fixture_dirname)))
+        finally:
+            shutil.rmtree(temp_dirname)
+
+    def test_configure_opencor_simulation(self):
+        simulation = UniformTimeCourseSimulation(initial_time=-5., output_start_time=5., output_end_time=10., number_of_steps=10)
+
+        opencor_sim = mock.Mock()
+        utils.configure_opencor_simulation(opencor_sim, simulation)
+        opencor_data = opencor_sim.data.return_value
+        self.assertEqual(opencor_data.setStartingPoint.call_args_list, [mock.call(-5., True), mock.call(5., False)])
+        opencor_data.setEndingPoint.assert_called_once_with(10.)
+        opencor_data.setPointInterval.assert_called_once_with(0.5)
+
+        opencor_sim = mock.Mock()
+        utils.configure_opencor_simulation(opencor_sim, simulation, recompute=False)
+        opencor_sim.data.return_value.setStartingPoint.assert_called_once_with(5., False)
+
+    def test_load_pooled_opencor_simulation_recomputes_at_initial_time(self):
+        task, variables = self._get_simulation()
+        task.simulation.initial_time = -5.
+        task.simulation.algorithm = utils.get_opencor_algorithm(task.simulation.algorithm)
+        pool = mock.Mock()
+
+        # simulations which are loaded and simulations which are obtained from the pool are configured in the same way
+        for pooled_opencor_sim in [None, mock.Mock()]:
+            pool.checkout.return_value = pooled_opencor_sim
+            with mock.patch.object(utils, 'configure_opencor_simulation') as configure_opencor_simulation:
+                opencor_sim, _, from_pool = utils.load_pooled_opencor_simulation(task, variables, pool)
+            self.assertEqual(from_pool, pooled_opencor_sim is not None)
+            configure_opencor_simulation.assert_called_once_with(opencor_sim, task.simulation)
+
+    def test_configure_opencor_simulation_algorithm(self):
+        opencor_sim = mock.Mock()
+        utils.configure_opencor_simulation_algorithm(opencor_sim, Algorithm(kisao_id='KISAO_0000019', changes=[
+            AlgorithmParameterChange(kisao_id='KISAO_0000211', new_value='1e-8'),
+            AlgorithmParameterChange(kisao_id='KISAO_0000415', new_value='1000'),
+            AlgorithmParameterChange(kisao_id='KISAO_0000475', new_value='Adams-Moulton'),
+            AlgorithmParameterChange(kisao_id='KISAO_0000481', new_value='false'),
+        ]))
+        opencor_data = opencor_sim.data.return_value
+        opencor_data.setOdeSolverName.assert_called_once_with('CVODE')
+        self.assertEqual(opencor_data.addOdeSolverProperty.call_args_list, [
+            mock.call('AbsoluteTolerance', 1e-8),
+            mock.call('MaximumNumberOfSteps', 1000),
+            mock.call('IntegrationMethod', 'Adams-Moulton'),
+            mock.call('InterpolateSolution', False),
+        ])
+
+        opencor_sim = mock.Mock()
+        utils.configure_opencor_simulation_algorithm(opencor_sim, Algorithm(kisao_id='KISAO_0000282', changes=[
+            AlgorithmParameterChange(kisao_id='KISAO_0000486', new_value='100'),
+        ]))
+        opencor_data = opencor_sim.data.return_value
+        opencor_data.setNlaSolverName.assert_called_once_with('KINSOL')
+        opencor_data.addNlaSolverProperty.assert_called_once_with('MaximumNumberOfIterations', 100)
+        opencor_data.setOdeSolverName.assert_not_called()
+
     @unittest.skip('causes segmentation fault')
     def test_load_opencor_simulation_error_handling_unsupported_algorithm(self):
         task, variables = self._get_simulation()
@@ -349,6 +636,32 @@ class TestCase(unittest.TestCase):
             self.assertEqual(result.shape, (sim.number_of_steps + 1,))
             self.assertFalse(numpy.any(numpy.isnan(result)))
 
+    def test_get_opencor_results_index(self):
+        filename = os.path.abspath(os.path.join(os.path.dirname(__file__), 'fixtures', 'lorenz.sedml'))
+        opencor_sim = opencor.open_simulation(filename)
+        opencor_sim.run()
+        opencor_results = opencor_sim.results()
+
+        index = utils.get_opencor_results_index(opencor_sim)
+        self.assertEqual(index[opencor_results.voi().uri()], 'voi')
+        for group in ['states', 'rates', 'constants', 'algebraic']:
+            for name in getattr(opencor_results, group)():
+                self.assertIn(index[name], ['states', 'rates', 'constants', 'algebraic'])
+
+    def test_get_opencor_result_window(self):
+        values = numpy.array(numpy.linspace(0., 1., 11))
+        self.assertIs(utils.get_opencor_result_window(values, 11), values)
+
+        window = utils.get_opencor_result_window(values, 6)
+        numpy.testing.assert_allclose(window, values[5:])
+        self.assertTrue(window.flags.owndata)
+
+        view = values[:]
+        window = utils.get_opencor_result_window(view, 11)
+        self.assertIsNot(window, view)
+        self.assertTrue(window.flags.owndata)
+        numpy.testing.assert_allclose(window, values)
+
     def test_get_results_from_opencor_simulation_invalid_observable(self):
         task, variables = self._get_simulation()
         model_etree = lxml.etree.parse(task.model.source)
@@ -408,6 +721,21 @@ class TestCase(unittest.TestCase):
 
         return task, variables
 
+    def test_get_opencor_solver_settings(self):
+        alg = Algorithm(kisao_id='KISAO_0000019')
+        self.assertEqual(utils.get_opencor_solver_settings(alg), {
+            'solver': 'CVODE',
+            'configuredLinearSolver': 'Dense',
+        })
+
+        alg.changes.append(AlgorithmParameterChange(kisao_id='KISAO_0000477', new_value='GMRES'))
+        self.assertEqual(utils.get_opencor_solver_settings(alg)['configuredLinearSolver'], 'GMRES')
+
+        alg = Algorithm(kisao_id='KISAO_0000030')
+        self.assertEqual(utils.get_opencor_solver_settings(alg), {
+            'solver': 'Euler (forward)',
+        })
+
     def test_log_opencor_execution(self):
         # supported algorithm
         task, _ = self._get_simulation()
@@ -421,6 +749,10 @@ class TestCase(unittest.TestCase):
             {'kisaoID': 'KISAO_0000475', 'value': 'BDF'},
         ])
 
+        log = TaskLog()
+        utils.log_opencor_execution(task, log, details={'simulationPool': {'hit': True}})
+        self.assertEqual(log.simulator_details['simulationPool'], {'hit': True})
+
         # alternative algorithm
         task, _ = self._get_simulation()
         task.simulation.algorithm.kisao_id = 'KISAO_0000560'